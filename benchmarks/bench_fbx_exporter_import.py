@@ -0,0 +1,153 @@
+"""Measures what enabling the addon costs: the import of every submodule of the addon, register() and unregister(), and how
+long cloning Blender's FBX exporter takes on the first export.
+
+Before the clone was made lazy, it was paid when the addon was registered. Now it is paid on the first export.
+
+The import time of each submodule is measured by a finder that wraps the loaders of the addon's modules, similar to
+python -X importtime. 'self' is the time spent executing the module itself, including modules from outside the addon it
+imports, 'cumulative' also includes the submodules of the addon it imports first.
+
+The benchmark runs inside Blender, so register() and unregister() are timed against the real bpy instead of a stub.
+
+Usage:
+    blender --background --factory-startup --python benchmarks/bench_fbx_exporter_import.py
+"""
+
+import os
+import sys
+import time
+import importlib
+import importlib.abc
+import addon_utils
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ADDON = "src"
+
+
+class TimingLoader(importlib.abc.Loader):
+    """Wraps the loader of a module of the addon and records how long executing it takes"""
+
+    def __init__(self, loader, finder, name):
+        self.loader = loader
+        self.finder = finder
+        self.name = name
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        finder = self.finder
+        depth = len(finder.stack)
+        finder.stack.append(0.0)
+
+        start = time.perf_counter()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            cumulative = time.perf_counter() - start
+            nested = finder.stack.pop()
+            if len(finder.stack) > 0:
+                finder.stack[-1] += cumulative
+            finder.times.append((self.name, depth, cumulative - nested, cumulative))
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+
+class TimingFinder(importlib.abc.MetaPathFinder):
+    """Finds the modules of the addon through the other finders and wraps their loaders in a TimingLoader"""
+
+    def __init__(self, package):
+        self.package = package
+        # Time spent importing addon submodules for each module that is being executed.
+        self.stack = []
+        # (name, depth, self, cumulative) of each module, in the order their imports finished.
+        self.times = []
+
+    def find_spec(self, name, path, target=None):
+        if name != self.package and not name.startswith(self.package + "."):
+            return None
+
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    spec.loader = TimingLoader(spec.loader, self, name)
+                return spec
+
+        return None
+
+
+def timed(function, times, key):
+    """Returns a wrapper of function that records how long each call takes"""
+
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            times[key] = time.perf_counter() - start
+
+    return wrapper
+
+
+def main():
+
+    if ADDON in sys.modules:
+        print("The addon has already been imported, start Blender with --factory-startup.")
+        return
+
+    finder = TimingFinder(ADDON)
+    sys.meta_path.insert(0, finder)
+    try:
+        start = time.perf_counter()
+        addon = importlib.import_module(ADDON)
+        importTime = time.perf_counter() - start
+    finally:
+        sys.meta_path.remove(finder)
+
+    print("%10s %12s  %s" % ("self [ms]", "cumul. [ms]", "module"))
+    for name, depth, selfTime, cumulative in finder.times:
+        print("%10.2f %12.2f  %s%s" % (selfTime * 1000, cumulative * 1000, "  " * depth, name))
+
+    print("")
+    print("Slowest modules by self time:")
+    for name, depth, selfTime, cumulative in sorted(finder.times, key=lambda entry: -entry[2])[:10]:
+        print("%10.2f  %s" % (selfTime * 1000, name))
+
+    # addon_utils reloads the package if it was not imported by it, which would replace the timed functions.
+    addon.__time__ = os.path.getmtime(addon.__file__)
+    times = {}
+    addon.register = timed(addon.register, times, 'register')
+    addon.unregister = timed(addon.unregister, times, 'unregister')
+
+    addon_utils.enable(ADDON, default_set=True)
+
+    exporter = sys.modules[ADDON + ".export.seut_custom_fbx_exporter"]
+
+    start = time.perf_counter()
+    exporter.get_fbx_module()
+    cloneTime = time.perf_counter() - start
+
+    start = time.perf_counter()
+    exporter.get_fbx_module()
+    cachedTime = time.perf_counter() - start
+
+    addon_utils.disable(ADDON, default_set=True)
+
+    print("")
+    print("Import of the addon and all submodules:      %8.2f ms" % (importTime * 1000))
+    print("register():                                  %8.2f ms" % (times.get('register', 0) * 1000))
+    print("unregister():                                %8.2f ms" % (times.get('unregister', 0) * 1000))
+    print("First get_fbx_module() (clone and patch):    %8.2f ms" % (cloneTime * 1000))
+    print("Later get_fbx_module() calls:                %8.4f ms" % (cachedTime * 1000))
+    print("Enabling cost before (eager clone):          %8.2f ms" % ((importTime + times.get('register', 0) + cloneTime) * 1000))
+    print("Enabling cost now (lazy clone):              %8.2f ms" % ((importTime + times.get('register', 0)) * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Measures how long getParentCollection() takes to find the SEUT collection of an object in a scene with 10,000 objects,
+compared to the previous lookup that walked the objects of every SEUT collection.
+
+The previous lookup is reproduced below as it was before the change, so both run on the same scene.
+
+Usage:
+    blender --background --factory-startup --python benchmarks/bench_parent_collection.py -- [--objects N] [--lookups N]
+"""
+
+import os
+import sys
+import time
+import argparse
+import addon_utils
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ADDON = "src"
+SUBTYPE_ID = "Bench"
+
+# How the objects are spread over the SEUT collections, roughly like a detailed block with build stages and LODs.
+DISTRIBUTION = [
+    ('Main', 0.4),
+    ('Collision', 0.05),
+    ('LOD1', 0.15),
+    ('LOD2', 0.1),
+    ('LOD3', 0.05),
+    ('BS1', 0.1),
+    ('BS2', 0.1),
+    ('BS3', 0.05)
+    ]
+
+
+def parse_arguments():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+
+    parser = argparse.ArgumentParser(description="Benchmarks getParentCollection()")
+    parser.add_argument('--objects', type=int, default=10000, help="Number of objects in the scene")
+    parser.add_argument('--lookups', type=int, default=1000, help="Number of objects to look up, spread evenly over the scene")
+
+    return parser.parse_args(argv)
+
+
+def get_parent_collection_before(context, childObject):
+    """getParentCollection() before objects were looked up through users_collection"""
+
+    from src.seut_ot_recreateCollections import SEUT_OT_RecreateCollections
+
+    scene = context.scene
+    collections = SEUT_OT_RecreateCollections.getCollections(scene)
+
+    for key, value in collections.items():
+        if value is not None:
+            for obj in value.objects:
+                if obj is not None and obj == childObject:
+                    return value
+
+    return None
+
+
+def create_scene(objectCount):
+    """Creates the SEUT collections of a scene and fills them with empties"""
+
+    scene = bpy.context.scene
+    scene.seut.subtypeId = SUBTYPE_ID
+
+    seut = bpy.data.collections.new("SEUT (%s)" % (SUBTYPE_ID))
+    scene.collection.children.link(seut)
+
+    objects = []
+    for prefix, share in DISTRIBUTION:
+        collection = bpy.data.collections.new("%s (%s)" % (prefix, SUBTYPE_ID))
+        seut.children.link(collection)
+
+        for i in range(int(objectCount * share)):
+            obj = bpy.data.objects.new("%s_%05i" % (prefix, i), None)
+            collection.objects.link(obj)
+            objects.append(obj)
+
+    return objects
+
+
+def time_lookups(function, context, objects):
+    start = time.perf_counter()
+    results = [function(context, obj) for obj in objects]
+    return time.perf_counter() - start, results
+
+
+def main():
+    args = parse_arguments()
+
+    addon_utils.enable(ADDON, default_set=True)
+    from src.seut_utils import getParentCollection
+
+    objects = create_scene(args.objects)
+    step = max(1, len(objects) // args.lookups)
+    sample = objects[::step][:args.lookups]
+
+    # The first lookup builds the collection index, which both versions share.
+    getParentCollection(bpy.context, sample[0])
+
+    timeBefore, resultsBefore = time_lookups(get_parent_collection_before, bpy.context, sample)
+    timeAfter, resultsAfter = time_lookups(getParentCollection, bpy.context, sample)
+
+    if resultsBefore != resultsAfter:
+        print("Results differ between the two lookups.")
+        sys.exit(1)
+
+    print("Objects in scene:                 %8i" % (len(objects)))
+    print("Lookups:                          %8i" % (len(sample)))
+    print("Before (walk collection objects): %8.2f ms total, %8.3f ms per lookup" % (timeBefore * 1000, timeBefore * 1000 / len(sample)))
+    print("After (users_collection):         %8.2f ms total, %8.3f ms per lookup" % (timeAfter * 1000, timeAfter * 1000 / len(sample)))
+    print("Speedup:                          %8.1fx" % (timeBefore / timeAfter))
+
+
+if __name__ == "__main__":
+    main()
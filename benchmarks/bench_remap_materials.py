@@ -0,0 +1,172 @@
+"""Measures how long remapping local materials to linked library materials takes on a scene with many objects,
+comparing the remap engine with the previous operator based remapping.
+
+The previous remapping is reproduced below as it was before the change. As there is no window in background mode,
+it runs on the current scene without switching scenes and calls the operator with a context override instead of
+making each object active, which makes it slightly faster than it was in the UI.
+
+Usage:
+    blender --background --factory-startup --python benchmarks/bench_remap_materials.py -- [--objects N] [--materials N]
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import addon_utils
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ADDON = "src"
+
+# A cube, each face of which gets one of the first slots. The remaining slots are unused and removed by the remap.
+CUBE_VERTICES = [(-1, -1, -1), (1, -1, -1), (1, 1, -1), (-1, 1, -1), (-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1)]
+CUBE_FACES = [(0, 1, 2, 3), (4, 5, 6, 7), (0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7)]
+USED_SLOTS = 3
+SLOTS = 5
+
+
+class Reporter():
+    """Stands in for the operator the remap reports to"""
+
+    def report(self, type, message):
+        print(message)
+
+
+def parse_arguments():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+
+    parser = argparse.ArgumentParser(description="Benchmarks the material remapping")
+    parser.add_argument('--objects', type=int, default=500, help="Number of objects in the scene")
+    parser.add_argument('--materials', type=int, default=300, help="Number of materials in the library")
+
+    return parser.parse_args(argv)
+
+
+def remap_materials_before(self, context):
+    """remapMaterials() before the remap engine, for the current scene only"""
+
+    mtl_to_delete = []
+
+    for obj in context.view_layer.objects:
+
+        if obj.type == 'EMPTY':
+            continue
+
+        try:
+            bpy.ops.object.material_slot_remove_unused({'object': obj, 'active_object': obj})
+        except RuntimeError:
+            self.report({'WARNING'}, "SEUT: Could not remove unused material slots for object '%s'." % (obj.name))
+
+        for slot in obj.material_slots:
+            if slot.material != None and slot.material.library == None:
+                old_material = slot.material
+
+                new_material = None
+                for mtl in bpy.data.materials:
+                    if mtl.library != None and ( mtl.name == old_material.name or mtl.name == old_material.name[:-4] ) and old_material.seut.overrideMatLib == False:
+                        new_material = mtl
+                        break
+
+                if new_material != None:
+                    slot.material = new_material
+                    if old_material not in mtl_to_delete:
+                        mtl_to_delete.append(old_material)
+
+    for mtl in mtl_to_delete:
+        bpy.data.materials.remove(
+            mtl, do_unlink=True, do_id_user=True, do_ui_user=False)
+
+
+def create_library(filepath, materialCount):
+    """Writes a MatLib with the given number of materials"""
+
+    materials = set(bpy.data.materials.new("Bench_Mat_%04i" % (i)) for i in range(materialCount))
+    bpy.data.libraries.write(filepath, materials, fake_user=True)
+
+    for mat in materials:
+        bpy.data.materials.remove(mat)
+
+
+def create_scene(libraryPath, objectCount, materialCount):
+    """Links the library materials and creates objects using local copies of them, as after importing a vanilla model"""
+
+    with bpy.data.libraries.load(libraryPath, link=True) as (data_from, data_to):
+        data_to.materials = data_from.materials
+
+    scene = bpy.context.scene
+    localMaterials = [bpy.data.materials.new("Bench_Mat_%04i" % (i)) for i in range(materialCount)]
+
+    for i in range(objectCount):
+        mesh = bpy.data.meshes.new("Bench_Mesh_%05i" % (i))
+        mesh.from_pydata(CUBE_VERTICES, [], CUBE_FACES)
+
+        for slot in range(SLOTS):
+            mesh.materials.append(localMaterials[(i + slot) % materialCount])
+        for index, polygon in enumerate(mesh.polygons):
+            polygon.material_index = index % USED_SLOTS
+
+        obj = bpy.data.objects.new("Bench_Object_%05i" % (i), mesh)
+        scene.collection.objects.link(obj)
+
+
+def clear_scene():
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj)
+    for mesh in list(bpy.data.meshes):
+        bpy.data.meshes.remove(mesh)
+    for mat in list(bpy.data.materials):
+        bpy.data.materials.remove(mat)
+    for library in list(bpy.data.libraries):
+        bpy.data.libraries.remove(library)
+
+
+def get_slots():
+    """Returns the materials of all slots and whether they are linked, for comparing the results"""
+
+    return sorted((obj.name, tuple((slot.material.name, slot.material.library is not None) for slot in obj.material_slots)) for obj in bpy.data.objects)
+
+
+def time_remap(function, libraryPath, args):
+    create_scene(libraryPath, args.objects, args.materials)
+
+    start = time.perf_counter()
+    function(Reporter(), bpy.context)
+    elapsed = time.perf_counter() - start
+
+    slots = get_slots()
+    clear_scene()
+
+    return elapsed, slots
+
+
+def main():
+    args = parse_arguments()
+
+    addon_utils.enable(ADDON, default_set=True)
+    from src.materials.seut_ot_remapMaterials import SEUT_OT_RemapMaterials
+
+    clear_scene()
+    with tempfile.TemporaryDirectory() as directory:
+        libraryPath = os.path.join(directory, "MatLib_Bench.blend")
+        create_library(libraryPath, args.materials)
+
+        timeBefore, slotsBefore = time_remap(remap_materials_before, libraryPath, args)
+        timeAfter, slotsAfter = time_remap(SEUT_OT_RemapMaterials.remapMaterials, libraryPath, args)
+
+    if slotsBefore != slotsAfter:
+        print("Results differ between the two remaps.")
+        sys.exit(1)
+
+    print("Objects:                      %8i" % (args.objects))
+    print("Library materials:            %8i" % (args.materials))
+    print("Before (operator per object): %8.2f ms" % (timeBefore * 1000))
+    print("After (remap engine):         %8.2f ms" % (timeAfter * 1000))
+    print("Speedup:                      %8.1fx" % (timeBefore / timeAfter))
+
+
+if __name__ == "__main__":
+    main()
@@ -55,16 +55,21 @@ from .export.seut_ot_exportBS                   import SEUT_OT_ExportBS
 from .export.seut_ot_exportLOD                  import SEUT_OT_ExportLOD
 from .export.seut_ot_exportHKT                  import SEUT_OT_ExportHKT
 from .export.seut_ot_exportSBC                  import SEUT_OT_ExportSBC
+from .export.seut_ot_exportModSBC               import SEUT_OT_ExportModSBC
 from .export.seut_ot_exportMWM                  import SEUT_OT_ExportMWM
 from .export.seut_ot_export                     import SEUT_OT_Export
 from .export.seut_ot_exportAllScenes            import SEUT_OT_ExportAllScenes
+from .export.seut_ot_exportBackground           import SEUT_OT_ExportBackground
 from .export.seut_ot_exportMaterials            import SEUT_OT_ExportMaterials
+from .export.seut_ot_exportTextureManifest      import SEUT_OT_ExportTextureManifest
 from .export.seut_ot_copyExportFolder           import SEUT_OT_CopyExportFolder
 from .materials.seut_materials                  import SEUT_Materials
 from .materials.seut_pt_matToolbar              import SEUT_PT_Panel_Materials
 from .materials.seut_pt_matToolbar              import SEUT_PT_Panel_MatLib
 from .materials.seut_ot_remapMaterials          import SEUT_OT_RemapMaterials
 from .materials.seut_ot_refreshMatLibs          import SEUT_OT_RefreshMatLibs
+from .materials.seut_ot_mergeTextures           import SEUT_OT_MergeTextures
+from .materials.seut_ot_linkMaterial            import SEUT_OT_LinkMaterial
 from .materials.seut_ot_matCreate               import SEUT_OT_MatCreate
 from .materials.seut_matLib                     import SEUT_UL_MatLib
 from .utils.seut_ot_convertBoneNames            import SEUT_OT_ConvertBonesToBlenderFormat
@@ -87,8 +92,9 @@ from .seut_ot_bBoxAuto                  import SEUT_OT_BBoxAuto
 from .seut_ot_mirroring                 import SEUT_OT_Mirroring
 from .seut_ot_mountpoints               import SEUT_OT_Mountpoints
 from .seut_ot_addMountpointArea         import SEUT_OT_AddMountpointArea
-from .seut_ot_recreateCollections       import SEUT_OT_RecreateCollections
+from .seut_ot_recreateCollections       import SEUT_OT_RecreateCollections, collection_index_handler, subscribe_Collections, unsubscribe_Collections
 from .seut_ot_simpleNavigation          import SEUT_OT_SimpleNavigation
+from .seut_subpart_refresh              import subpart_refresh_handler, refresh_instances
 from .seut_ot_iconRender                import SEUT_OT_IconRender
 from .seut_ot_iconRenderPreview         import SEUT_OT_IconRenderPreview
 from .seut_scene                        import SEUT_MountpointAreas
@@ -113,6 +119,7 @@ classes = (
     SEUT_PT_Panel_MatLib,
     SEUT_PT_EmptyLink,
     SEUT_OT_ExportMaterials,
+    SEUT_OT_ExportTextureManifest,
     SEUT_MT_ContextMenu,
     SEUT_OT_AddHighlightEmpty,
     SEUT_OT_AddDummy,
@@ -120,17 +127,21 @@ classes = (
     SEUT_OT_AddCustomSubpart,
     SEUT_OT_Export,
     SEUT_OT_ExportAllScenes,
+    SEUT_OT_ExportBackground,
     SEUT_OT_ExportMain,
     SEUT_OT_ExportBS,
     SEUT_OT_ExportLOD,
     SEUT_OT_ExportHKT,
     SEUT_OT_ExportSBC,
+    SEUT_OT_ExportModSBC,
     SEUT_OT_ExportMWM,
     SEUT_OT_CopyExportFolder,
     SEUT_OT_Import,
     SEUT_OT_StructureConversion,
     SEUT_OT_AttemptToFixPositioning,
     SEUT_OT_RemapMaterials,
+    SEUT_OT_MergeTextures,
+    SEUT_OT_LinkMaterial,
     SEUT_OT_EmptiesToCubeType,
     SEUT_OT_ConvertBonesToBlenderFormat,
     SEUT_OT_ConvertBonesToSEFormat,
@@ -172,6 +183,15 @@ def register():
     bpy.types.WindowManager.seut = PointerProperty(type=SEUT_WindowManager)
 
     bpy.app.handlers.load_post.append(load_handler)
+    bpy.app.handlers.load_post.append(collection_index_handler)
+    bpy.app.handlers.undo_post.append(collection_index_handler)
+    bpy.app.handlers.redo_post.append(collection_index_handler)
+    bpy.app.handlers.depsgraph_update_post.append(collection_index_handler)
+    bpy.app.handlers.load_post.append(subpart_refresh_handler)
+    bpy.app.handlers.undo_post.append(subpart_refresh_handler)
+    bpy.app.handlers.redo_post.append(subpart_refresh_handler)
+    bpy.app.handlers.depsgraph_update_post.append(subpart_refresh_handler)
+    subscribe_Collections()
 
 
 def unregister():
@@ -187,6 +207,17 @@ def unregister():
     del bpy.types.WindowManager.seut
 
     bpy.app.handlers.load_post.remove(load_handler)
+    bpy.app.handlers.load_post.remove(collection_index_handler)
+    bpy.app.handlers.undo_post.remove(collection_index_handler)
+    bpy.app.handlers.redo_post.remove(collection_index_handler)
+    bpy.app.handlers.depsgraph_update_post.remove(collection_index_handler)
+    bpy.app.handlers.load_post.remove(subpart_refresh_handler)
+    bpy.app.handlers.undo_post.remove(subpart_refresh_handler)
+    bpy.app.handlers.redo_post.remove(subpart_refresh_handler)
+    bpy.app.handlers.depsgraph_update_post.remove(subpart_refresh_handler)
+    if bpy.app.timers.is_registered(refresh_instances):
+        bpy.app.timers.unregister(refresh_instances)
+    unsubscribe_Collections()
 
 
 def menu_func(self, context):
@@ -204,6 +235,7 @@ def menu_draw(self, context):
 
 @persistent
 def load_handler(dummy):
+    subscribe_Collections()
     bpy.ops.object.gridscale()
     try:
         bpy.ops.scene.refresh_matlibs()
@@ -21,7 +21,22 @@ def process_hktfbx_to_fbximporterhkt(context, settings: ExportSettings, srcfile,
         logfile=dstfile+'.convert.log'
     )	
 
-def process_fbximporterhkt_to_final_hkt_for_mwm(self, context, scene, path, settings: ExportSettings, srcfile, dstfile, havokoptions=HAVOK_OPTION_FILE_CONTENT):	
+def get_bs_hktfiles(scene, path):
+    """Returns the HKT file paths the build stages of a scene need a copy of the main HKT file at"""
+
+    hktBSfiles = []
+    for collection in scene.collection.children:
+        for childcollection in collection.children:
+            if "BS" in str(childcollection.name) and "LOD" not in str(childcollection.name) and len(childcollection.objects) > 0:
+                hktBSfiles.append(join(path, scene.seut.subtypeId + '_' + str(childcollection.name)[:3] + ".hkt"))
+
+    return hktBSfiles
+
+def process_fbximporterhkt_to_final_hkt_for_mwm(self, context, scene, path, settings: ExportSettings, srcfile, dstfile, havokoptions=HAVOK_OPTION_FILE_CONTENT, hktBSfiles=None):	
+    # When run from the export pool, the build stage files have been collected beforehand and no scene is passed.
+    if hktBSfiles is None:
+        hktBSfiles = get_bs_hktfiles(scene, path)
+
     hko = tempfile.NamedTemporaryFile(mode='wt', prefix='space_engineers_', suffix=".hko", delete=False) # wt mode is write plus text mode.	
     try:	
         with hko.file as tempfile_to_process:	
@@ -46,12 +61,8 @@ def process_fbximporterhkt_to_final_hkt_for_mwm(self, context, scene, path, sett
         # Create a copy of the main models HKT file for all the build stages to go through MWMB with their models.
         # This could be modified at a later date if unique collisions are implemented per build stage to not process based on their existence.
         if os.path.exists(srcfile):
-            for collection in scene.collection.children:
-                for childcollection in collection.children:
-                    if "BS" in str(childcollection.name) and "LOD" not in str(childcollection.name) and len(childcollection.objects) > 0:
-                        print(childcollection.name)
-                        hktBSfile = join(path, scene.seut.subtypeId + '_' + str(childcollection.name)[:3] + ".hkt")
-                        copy(srcfile, hktBSfile)
+            for hktBSfile in hktBSfiles:
+                copy(srcfile, hktBSfile)
                         
         
         self.report({'INFO'}, "SEUT: Collision files have been created.") 
\ No newline at end of file
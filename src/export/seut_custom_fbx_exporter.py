@@ -22,10 +22,12 @@ def _clone_fbx_module():
                 del sys.modules[SPECIFICATION]
 
 # STOLLIE: Assign the clone of the loaded specification to global variable.
-_fbx = _clone_fbx_module() 
+# The clone is only created on the first export, as executing the FBX exporter's source adds noticeably to Blender's startup.
+_fbx = None
+_fbxLock = threading.Lock()
 
 # STOLLIE: Assign a copy of the function from the loaded specification to a global variable.
-_original_fbx_template_def_model = _fbx.fbx_template_def_model 
+_original_fbx_template_def_model = None
 
 # HARAG: Extend the "fbx_template_def_model" function with further SE properties by using the overrides.
 # Reference material: https://github.com/rjstone/SEMT/issues/1
@@ -51,9 +53,6 @@ def fbx_template_def_model(scene, settings, override_defaults=None, nbr_users=0)
 
     return _original_fbx_template_def_model(scene, settings, props, nbr_users)
 
-# STOLLIE: Assign extended properties to the copied function from the loaded specification by calling the function above.
-_fbx.fbx_template_def_model = fbx_template_def_model
-
 HAVOK_SHAPE_NAMES = {
     'CONVEX_HULL': 'Hull',
     'BOX': 'Box',
@@ -176,10 +175,31 @@ def fbx_data_object_elements(root, ob_obj, scene_data):
 
     _fbx.elem_props_template_finalize(tmpl, props)
 
-# STOLLIE: Assign the blender defined and custom properties above to the copied function from the loaded specification by calling the above function.
-_fbx.fbx_data_object_elements = fbx_data_object_elements
+def get_fbx_module():
+    """Returns the cloned FBX exporter with the SEUT modifications, creating it on first use"""
+
+    global _fbx
+    global _original_fbx_template_def_model
+
+    with _fbxLock:
+        if _fbx is None:
+            fbx = _clone_fbx_module()
+            _original_fbx_template_def_model = fbx.fbx_template_def_model
+
+            # STOLLIE: Assign extended properties to the copied function from the loaded specification by calling the function above.
+            fbx.fbx_template_def_model = fbx_template_def_model
+
+            # STOLLIE: Assign the blender defined and custom properties above to the copied function from the loaded specification by calling the above function.
+            fbx.fbx_data_object_elements = fbx_data_object_elements
+
+            _fbx = fbx
+
+    return _fbx
 
 # HARAG: Export these two functions as our own so that clients of this module don't have to depend on 
 # HARAG: the cloned fbx_experimental.export_fbx_bin module
-save_single = _fbx.save_single
-save = _fbx.save
\ No newline at end of file
+def save_single(*args, **kwargs):
+    return get_fbx_module().save_single(*args, **kwargs)
+
+def save(*args, **kwargs):
+    return get_fbx_module().save(*args, **kwargs)
@@ -0,0 +1,240 @@
+import bpy
+import os
+import json
+import array
+import struct
+import hashlib
+import threading
+
+from ..seut_ot_recreateCollections  import SEUT_OT_RecreateCollections
+
+# Increase this whenever the exported files change for unchanged input, to invalidate existing manifests.
+MANIFEST_VERSION = 1
+MANIFEST_NAME = "seut_manifest.json"
+
+# Manifests of different scenes sharing an export folder may be written from several export pool workers at once.
+_manifestLock = threading.Lock()
+
+
+class ExportCache():
+    """Decides which collections of a scene are unchanged since the last export, based on a manifest in the export folder"""
+
+    def __init__(self, context):
+        scene = context.scene
+        addon = __package__[:__package__.find(".")]
+        preferences = bpy.context.preferences.addons.get(addon).preferences
+
+        self.scene = scene
+        self.depsgraph = context.evaluated_depsgraph_get()
+        self.collections = SEUT_OT_RecreateCollections.getCollections(scene)
+        self.path = os.path.normpath(bpy.path.abspath(scene.seut.export_exportPath)) + "\\"
+        self.materialsPath = os.path.normpath(bpy.path.abspath(preferences.materialsPath))
+        self.entries = read_manifest(self.path)
+
+        # Hashes of collections that are being exported in this session, committed once their output exists.
+        self.pending = {}
+        self.collectionHashes = {}
+        self.baseHash = self.getBaseHash()
+
+    def getOutputName(self, collection):
+        """Returns the file name of the final output of a collection"""
+
+        if collection == self.collections['hkt']:
+            return self.scene.seut.subtypeId + ".hkt"
+        elif collection == self.collections['main']:
+            return self.scene.seut.subtypeId + ".mwm"
+        else:
+            return self.scene.seut.subtypeId + '_' + collection.name[:collection.name.find(" (")] + ".mwm"
+
+    def getBaseHash(self):
+        """Hashes everything that affects every collection of the scene: settings, materials and the layout of the SEUT collections"""
+
+        h = hashlib.sha1()
+        seut = self.scene.seut
+
+        hashString(h, str(MANIFEST_VERSION))
+        for value in (seut.subtypeId, seut.sceneType, seut.export_rescaleFactor, seut.export_exportPath,
+                      seut.export_lod1Distance, seut.export_lod2Distance, seut.export_lod3Distance, seut.export_bs_lodDistance):
+            hashString(h, str(value))
+
+        # The XML references LODs depending on which collections contain objects.
+        for key, col in self.collections.items():
+            hashString(h, key + ':' + str(col is not None and len(col.objects) > 0))
+
+        # Every model XML lists all materials in the file.
+        for mat in bpy.data.materials:
+            if mat is None or mat.users == 0 or mat.users == 1 and mat.use_fake_user or mat.name[:5] == 'SMAT_':
+                continue
+            hashMaterial(h, mat)
+
+        # MWM Builder reads the library materials from the Materials folder.
+        if os.path.isdir(self.materialsPath):
+            for fileName in sorted(os.listdir(self.materialsPath)):
+                if fileName.endswith(".xml"):
+                    stat = os.stat(os.path.join(self.materialsPath, fileName))
+                    hashString(h, "%s:%i:%i" % (fileName, stat.st_size, stat.st_mtime_ns))
+
+        return h.hexdigest()
+
+    def getCollectionHash(self, collection):
+        """Returns the hash of a collection's objects, combined with the base hash"""
+
+        if collection.name in self.collectionHashes:
+            return self.collectionHashes[collection.name]
+
+        h = hashlib.sha1()
+        hashString(h, self.baseHash)
+
+        for obj in sorted(collection.objects, key=lambda o: o.name):
+            # Subpart instances are removed before the FBX is written.
+            if obj is None or obj.name.find("(L)") != -1:
+                continue
+            hashObject(h, obj, self.depsgraph)
+
+        # The collision model is compiled into the MWM of the main model and the build stages.
+        if collection != self.collections['hkt'] and collection.name[:3] != 'LOD' and collection.name[:6] != 'BS_LOD' and self.collections['hkt'] is not None:
+            hashString(h, self.getCollectionHash(self.collections['hkt']))
+
+        digest = h.hexdigest()
+        self.collectionHashes[collection.name] = digest
+
+        return digest
+
+    def isUnchanged(self, collection):
+        """Returns True if the collection and its output have not changed since the last export. Otherwise it is marked as pending"""
+
+        outputName = self.getOutputName(collection)
+        digest = self.getCollectionHash(collection)
+        entry = self.entries.get(outputName)
+
+        if entry is not None and entry['hash'] == digest and entry['output'] == getFileStat(self.path + outputName):
+            return True
+
+        self.pending[outputName] = digest
+        return False
+
+    def hasPendingModels(self):
+        """Returns True if any collection apart from the collision collection is being exported"""
+
+        return any(not name.endswith(".hkt") for name in self.pending.keys())
+
+    def commit(self):
+        """Records the pending collections in the manifest. Does not access Blender data so it can run from the export pool"""
+
+        with _manifestLock:
+            entries = read_manifest(self.path)
+            for outputName, digest in self.pending.items():
+                stat = getFileStat(self.path + outputName)
+                if stat is None:
+                    entries.pop(outputName, None)
+                else:
+                    entries[outputName] = {'hash': digest, 'output': stat}
+
+            write_manifest(self.path, entries)
+
+        self.pending = {}
+
+
+def read_manifest(path):
+    """Reads the export manifest of an export folder. Returns an empty manifest if there is none or it is invalid"""
+
+    try:
+        with open(path + MANIFEST_NAME, 'r') as manifest:
+            data = json.load(manifest)
+    except (EnvironmentError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get('version') != MANIFEST_VERSION:
+        return {}
+
+    return data.get('entries', {})
+
+
+def write_manifest(path, entries):
+    """Writes the export manifest of an export folder"""
+
+    tempPath = path + MANIFEST_NAME + ".tmp"
+    try:
+        with open(tempPath, 'w') as manifest:
+            json.dump({'version': MANIFEST_VERSION, 'entries': entries}, manifest, indent=1, sort_keys=True)
+        os.replace(tempPath, path + MANIFEST_NAME)
+    except EnvironmentError:
+        print("SEUT Warning: Export manifest in '" + path + "' could not be written.")
+
+
+def getFileStat(filePath):
+    try:
+        stat = os.stat(filePath)
+    except EnvironmentError:
+        return None
+
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def hashString(h, value):
+    h.update(value.encode('utf-8'))
+    h.update(b'\0')
+
+
+def hashArray(h, collection, attribute, typecode, length):
+    """Hashes an attribute of all items in a bpy collection using a single bulk read"""
+
+    values = array.array(typecode, [0]) * (len(collection) * length)
+    collection.foreach_get(attribute, values)
+    h.update(values.tobytes())
+
+
+def hashMaterial(h, mat):
+    hashString(h, mat.name)
+    hashString(h, "" if mat.library is None else mat.library.name)
+    hashString(h, "%s:%s:%s:%s:%s" % (mat.seut.overrideMatLib, mat.seut.technique, mat.seut.facing, mat.seut.windScale, mat.seut.windFrequency))
+
+    if mat.node_tree is not None:
+        for node in mat.node_tree.nodes:
+            if node.type == 'TEX_IMAGE' and node.name in ('CM', 'NG', 'ADD', 'ALPHAMASK') and node.image is not None:
+                hashString(h, node.name + ':' + node.image.filepath)
+
+
+def hashObject(h, obj, depsgraph):
+    """Hashes everything of an object that ends up in the exported files"""
+
+    hashString(h, obj.name)
+    hashString(h, obj.type)
+    hashString(h, "" if obj.parent is None else obj.parent.name)
+    h.update(struct.pack('16f', *[value for row in obj.matrix_local for value in row]))
+
+    # Custom properties are set from these on export.
+    for key in ('file', 'highlight'):
+        if key in obj:
+            hashString(h, key + ':' + str(obj[key]))
+    if obj.seut.linkedScene is not None:
+        hashString(h, 'linkedScene:' + obj.seut.linkedScene.seut.subtypeId)
+    if obj.seut.linkedObject is not None:
+        hashString(h, 'linkedObject:' + obj.seut.linkedObject.name)
+
+    for slot in obj.material_slots:
+        hashString(h, "" if slot.material is None else slot.material.name + ':' + slot.link)
+
+    if obj.rigid_body is not None:
+        rbo = obj.rigid_body
+        hashString(h, "%s:%s:%s:%s" % (rbo.collision_shape, rbo.mass, rbo.friction, rbo.restitution))
+
+    if obj.type == 'MESH':
+        evaluated = obj.evaluated_get(depsgraph)
+        mesh = evaluated.to_mesh()
+        try:
+            hashArray(h, mesh.vertices, 'co', 'f', 3)
+            hashArray(h, mesh.loops, 'vertex_index', 'i', 1)
+            hashArray(h, mesh.polygons, 'loop_start', 'i', 1)
+            hashArray(h, mesh.polygons, 'material_index', 'i', 1)
+            hashArray(h, mesh.polygons, 'use_smooth', 'i', 1)
+
+            for uvLayer in mesh.uv_layers:
+                hashString(h, uvLayer.name)
+                hashArray(h, uvLayer.data, 'uv', 'f', 2)
+
+            if mesh.has_custom_normals:
+                mesh.calc_normals_split()
+                hashArray(h, mesh.loops, 'normal', 'f', 3)
+        finally:
+            evaluated.to_mesh_clear()
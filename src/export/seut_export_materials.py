@@ -0,0 +1,316 @@
+import bpy
+import os
+import math
+import xml.etree.ElementTree as ET
+
+from ..materials.seut_texture_info  import get_image_size
+from ..materials.seut_matlib_catalog import link_materials
+
+
+class ExportMaterials():
+    """Resolves the materials written to the model XML and prepares them for FBX export once per export session, so all collections of a scene can share the work"""
+
+    def __init__(self):
+
+        # Whether the last material of each name is part of a linked library.
+        self.isLinkedByName = {}
+        self.entries = None
+        self.preparedMaterials = []
+        self.dummyImage = None
+
+        # With MatLibs linked on demand, the library material of the same name as a local material may not be linked yet.
+        # It is linked now, so the materials are resolved the same way as with all MatLib materials linked.
+        names = [mat.name for mat in bpy.data.materials if mat is not None and mat.library is None and mat.users > 0 and not mat.seut.overrideMatLib]
+        link_materials(bpy.context, names)
+
+        for mat in bpy.data.materials:
+            if mat is not None:
+                self.isLinkedByName[mat.name] = mat.library is not None
+
+    def isUnique(self, mat):
+        """Returns True if a local material should be written to the XML instead of referencing a library material of the same name"""
+
+        # If the material is not part of a linked library, I have to account for the possibility that it is a leftover material from import.
+        # Those do get cleaned up, but only after the BLEND file is saved, closed and reopened. That may not have happened.
+        # With override turned on, the local material is used even if a linked library contains one with its name.
+        if mat.seut.overrideMatLib:
+            return True
+
+        return not self.isLinkedByName.get(mat.name, False)
+
+    def getEntries(self, reporter):
+        """Returns the XML entries of all materials that are written to the model XML. They are created and their warnings
+        are reported the first time this is called, after that the same entries are returned for every collection"""
+
+        if self.entries is not None:
+            return self.entries
+
+        entries = []
+
+        for mat in bpy.data.materials:
+            if mat == None:
+                continue
+            if mat.users == 0 or mat.users == 1 and mat.use_fake_user:
+                continue
+        
+            # This ensures that the material presets used internally are not written to the XML.
+            if mat.name[:5] == 'SMAT_':
+                continue
+        
+            # mat is a local material.
+            elif mat.library == None:
+
+                isUnique = self.isUnique(mat)
+            
+                if isUnique:
+                    matEntry = ET.Element('Material')
+                    matEntry.set('Name', mat.name)
+
+                    matTechnique = ET.SubElement(matEntry, 'Parameter')
+                    matTechnique.set('Name', 'Technique')
+                    matTechnique.text = mat.seut.technique
+
+                    if mat.seut.facing != 'None':
+                        matFacing = ET.SubElement(matEntry, 'Parameter')
+                        matFacing.set('Name', 'Facing')
+                        matFacing.text = mat.seut.facing
+                    
+                    if mat.seut.windScale != 0:
+                        matWindScale = ET.SubElement(matEntry, 'Parameter')
+                        matWindScale.set('Name', 'WindScale')
+                        matWindScale.text = str(mat.seut.windScale)
+                    
+                    if mat.seut.windFrequency != 0:
+                        matWindFrequency = ET.SubElement(matEntry, 'Parameter')
+                        matWindFrequency.set('Name', 'WindFrequency')
+                        matWindFrequency.text = str(mat.seut.windFrequency)
+                
+                    # Iterate through all image textures in material and register relevant ones to dictionary.
+                    images = {
+                        'cm': None,
+                        'ng': None,
+                        'add': None,
+                        'am': None
+                        }
+
+                    if mat.node_tree is not None:
+                        for node in mat.node_tree.nodes:
+                            if node.type == 'TEX_IMAGE':
+                                if node.name == 'CM':
+                                    images['cm'] = node.image
+                                if node.name == 'NG':
+                                    images['ng'] = node.image
+                                if node.name == 'ADD':
+                                    images['add'] = node.image
+                                if node.name == 'ALPHAMASK':
+                                    images['am'] = node.image
+
+                    # Used to create the relative paths for the textures.
+                    offset = 0
+
+                    # _cm ColorMask texture
+                    if images['cm'] == None:
+                        reporter.report({'WARNING'}, "SEUT: No 'CM' texture or node found for local material '%s'. Skipping." % (mat.name))
+                    else:
+                        offset = images['cm'].filepath.find("Textures\\")
+                        if offset == -1:
+                            reporter.report({'ERROR'}, "SEUT: 'CM' texture filepath in local material '%s' does not contain 'Textures\\'. Cannot be transformed into relative path. (007)" % (mat.name))
+                        else:
+                            matCM = ET.SubElement(matEntry, 'Parameter')
+                            matCM.set('Name', 'ColorMetalTexture')
+                            matCM.text = os.path.splitext(images['cm'].filepath[offset:])[0] + ".dds"
+                    
+                        size = get_image_size(images['cm'])
+                        if not isValidResolution(size[0]) or not isValidResolution(size[1]):
+                            reporter.report({'WARNING'}, "SEUT: 'CM' texture of local material '%s' is not of a valid resolution (%sx%s). May not display correctly ingame." % (mat.name, str(size[0]), str(size[1])))
+                
+                    # _ng NormalGloss texture
+                    if images['ng'] == None:
+                        reporter.report({'WARNING'}, "SEUT: No 'NG' texture or node found for local material '%s'. Skipping." % (mat.name))
+                    else:
+                        offset = images['ng'].filepath.find("Textures\\")
+                        if offset == -1:
+                            reporter.report({'ERROR'}, "SEUT: 'NG' texture filepath in local material '%s' does not contain 'Textures\\'. Cannot be transformed into relative path. (007)" % (mat.name))
+                        else:
+                            matNG = ET.SubElement(matEntry, 'Parameter')
+                            matNG.set('Name', 'NormalGlossTexture')
+                            matNG.text = os.path.splitext(images['ng'].filepath[offset:])[0] + ".dds"
+                    
+                        size = get_image_size(images['ng'])
+                        if not isValidResolution(size[0]) or not isValidResolution(size[1]):
+                            reporter.report({'WARNING'}, "SEUT: 'NG' texture of local material '%s' is not of a valid resolution (%sx%s). May not display correctly ingame." % (mat.name, str(size[0]), str(size[1])))
+                
+                    # _add AddMaps texture
+                    if images['add'] == None:
+                        reporter.report({'WARNING'}, "SEUT: No 'ADD' texture or node found for local material '%s'. Skipping." % (mat.name))
+                    else:
+                        offset = images['add'].filepath.find("Textures\\")
+                        if offset == -1:
+                            reporter.report({'ERROR'}, "SEUT: 'ADD' texture filepath in local material '%s' does not contain 'Textures\\'. Cannot be transformed into relative path. (007)" % (mat.name))
+                        else:
+                            matADD = ET.SubElement(matEntry, 'Parameter')
+                            matADD.set('Name', 'AddMapsTexture')
+                            matADD.text = os.path.splitext(images['add'].filepath[offset:])[0] + ".dds"
+                    
+                        size = get_image_size(images['add'])
+                        if not isValidResolution(size[0]) or not isValidResolution(size[1]):
+                            reporter.report({'WARNING'}, "SEUT: 'ADD' texture of local material '%s' is not of a valid resolution (%sx%s). May not display correctly ingame." % (mat.name, str(size[0]), str(size[1])))
+                
+                    # _alphamask Alphamask texture
+                    if images['am'] == None:
+                        reporter.report({'WARNING'}, "SEUT: No 'ALPHAMASK' texture or node found for local material '%s'. Skipping." % (mat.name))
+                    else:
+                        offset = images['am'].filepath.find("Textures\\")
+                        if offset == -1:
+                            reporter.report({'ERROR'}, "SEUT: 'ALPHAMASK' texture filepath in local material '%s' does not contain 'Textures\\'. Cannot be transformed into relative path. (007)" % (mat.name))
+                        else:
+                            matAM = ET.SubElement(matEntry, 'Parameter')
+                            matAM.set('Name', 'AlphamaskTexture')
+                            matAM.text = os.path.splitext(images['am'].filepath[offset:])[0] + ".dds"
+                    
+                        size = get_image_size(images['am'])
+                        if not isValidResolution(size[0]) or not isValidResolution(size[1]):
+                            reporter.report({'WARNING'}, "SEUT: 'ALPHAMASK' texture of local material '%s' is not of a valid resolution (%sx%s). May not display correctly ingame." % (mat.name, str(size[0]), str(size[1])))
+
+                    # If no textures are added to the material, the entry is left out.
+                    if images['cm'] == None and images['ng'] == None and images['add'] == None and images['am'] == None:
+                        reporter.report({'INFO'}, "SEUT: Local material '%s' does not contain any valid textures. Skipping." % (mat.name))
+                    else:
+                        entries.append(matEntry)
+                        reporter.report({'INFO'}, "SEUT: Local material '%s' saved. Don't forget to include relevant DDS texture files in mod!" % (mat.name))
+
+            elif mat.library != None:
+                matRef = ET.Element('MaterialRef')
+                matRef.set('Name', mat.name)
+                entries.append(matRef)
+
+        self.entries = entries
+
+        return entries
+
+
+    def getDummyImage(self):
+        """Returns the DUMMY image the prepared materials are linked to, creating it if it does not exist"""
+
+        if self.dummyImage is None:
+            for img in bpy.data.images:
+                if img.name == 'DUMMY':
+                    self.dummyImage = img
+
+            if self.dummyImage is None:
+                self.dummyImage = bpy.data.images.new('DUMMY', 1, 1)
+
+        return self.dummyImage
+
+    def prepareForExport(self, reporter, context, objects):
+        """Prepares the materials used by the objects for FBX export, unless that has already happened in this session"""
+
+        for obj in objects:
+            if obj is None:
+                continue
+
+            for slot in obj.material_slots:
+                mat = slot.material
+                if mat is not None and mat.node_tree is not None and mat not in self.preparedMaterials:
+                    prepMatForExport(reporter, context, mat, self.getDummyImage())
+                    self.preparedMaterials.append(mat)
+
+    def restoreAfterExport(self, reporter, context):
+        """Removes the export dummies from all materials prepared in this session"""
+
+        for mat in self.preparedMaterials:
+            removeExportDummiesFromMat(reporter, context, mat)
+
+        self.preparedMaterials = []
+
+
+def isValidResolution(number):
+    """Returns True if number is a valid resolution (a square of 2)"""
+    
+    if number <= 0:
+        return False
+
+    return math.log(number, 2).is_integer()
+
+
+def prepMatForExport(self, context, material, dummyImage=None):
+    """Switches material around so that SE can properly read it. The DUMMY image can be passed to avoid looking it up again"""
+    
+    # See if relevant nodes already exist
+    dummyShaderNode = None
+    dummyImageNode = None
+    materialOutput = None
+
+    for node in material.node_tree.nodes:
+        if node.type == 'BSDF_PRINCIPLED' and node.name == 'EXPORT_DUMMY':
+            dummyShaderNode = node
+        elif node.type == 'TEX_IMAGE' and node.name == 'DUMMY_IMAGE':
+            dummyImageNode = node
+        elif node.type == 'OUTPUT_MATERIAL':
+            materialOutput = node
+
+    # Iterate through images to find the dummy image
+    if dummyImage is None:
+        for img in bpy.data.images:
+            if img.name == 'DUMMY':
+                dummyImage = img
+
+    # If no, create it and DUMMY image node, and link them up
+    if dummyImageNode is None:
+        dummyImageNode = material.node_tree.nodes.new('ShaderNodeTexImage')
+        dummyImageNode.name = 'DUMMY_IMAGE'
+        dummyImageNode.label = 'DUMMY_IMAGE'
+
+    if dummyImage is None:
+        dummyImage = bpy.data.images.new('DUMMY', 1, 1)
+
+    if dummyShaderNode is None:
+        dummyShaderNode = material.node_tree.nodes.new('ShaderNodeBsdfPrincipled')
+        dummyShaderNode.name = 'EXPORT_DUMMY'
+        dummyShaderNode.label = 'EXPORT_DUMMY'
+    
+    if materialOutput is None:
+        materialOutput = material.node_tree.nodes.new('ShaderNodeOutputMaterial')
+        material.seut.nodeLinkedToOutputName = ""
+    # This allows the reestablishment of connections after the export is complete.
+    else:
+        try:
+            material.seut.nodeLinkedToOutputName = materialOutput.inputs[0].links[0].from_node.name
+        except IndexError:
+            print("SEUT Info: IndexError at material '" + material.name + "'.")
+
+    # link nodes, add image to node
+    material.node_tree.links.new(dummyImageNode.outputs[0], dummyShaderNode.inputs[0])
+    material.node_tree.links.new(dummyShaderNode.outputs[0], materialOutput.inputs[0])
+    dummyImageNode.image = dummyImage
+
+    return
+
+
+def removeExportDummiesFromMat(self, context, material):
+    """Removes the dummy nodes from the material again after export"""
+
+    materialOutput = None
+    nodeLinkedToOutput = None
+
+    # Remove dummy nodes - do I need to remove the links too?
+    # Image can stay, it's 1x1 px so nbd
+    for node in material.node_tree.nodes:
+        if node.type == 'TEX_IMAGE' and node.name == 'DUMMY_IMAGE':
+            material.node_tree.nodes.remove(node)
+        elif node.type == 'BSDF_PRINCIPLED' and node.name == 'EXPORT_DUMMY':
+            material.node_tree.nodes.remove(node)
+
+        elif node.type == 'OUTPUT_MATERIAL':
+            materialOutput = node
+        elif node.name == material.seut.nodeLinkedToOutputName:
+            nodeLinkedToOutput = node
+    
+    # link the node group back to output
+    if nodeLinkedToOutput is not None:
+        try:
+            material.node_tree.links.new(nodeLinkedToOutput.outputs[0], materialOutput.inputs[0])
+        except IndexError:
+            print("SEUT Info: IndexError at material '" + material.name + "'.")
+
+    return
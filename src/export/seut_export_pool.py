@@ -0,0 +1,161 @@
+import bpy
+import os
+import time
+import threading
+
+from concurrent.futures     import ThreadPoolExecutor
+
+from .seut_mwmbuilder       import mwmbuilder, mwmbuilder_batch
+
+
+class ExportJob():
+    """Holds the deferred external tool stages of a single scene export and collects its reports"""
+
+    def __init__(self, scene):
+        self.sceneName = scene.name
+        self.subtypeId = scene.seut.subtypeId
+        self.exportPath = os.path.normpath(bpy.path.abspath(scene.seut.export_exportPath)) + "\\"
+        self.deleteLooseFiles = scene.seut.export_deleteLooseFiles
+
+        self.stages = []
+        self.mwmBuild = None
+        self.finalStages = []
+        self.messages = []
+        self.failed = False
+        self.error = None
+        self.timeBlender = 0.0
+        self.timeTools = 0.0
+
+        self._lock = threading.Lock()
+
+    def report(self, type, message):
+        """Stands in for Operator.report() so the job can be handed to the export functions in place of an operator"""
+
+        with self._lock:
+            self.messages.append((type, message))
+            if 'ERROR' in type:
+                self.failed = True
+        print(message)
+
+    def fail(self, message):
+        """Marks the job as failed"""
+
+        with self._lock:
+            self.failed = True
+            if self.error is None:
+                self.error = message
+        print("SEUT Error: Scene '" + self.sceneName + "': " + message)
+
+    def addStage(self, name, function, *args, **kwargs):
+        """Adds an external tool stage. Stages must not access Blender data as they are run outside of the main thread"""
+
+        self.stages.append((name, function, args, kwargs))
+
+    def setMwmBuild(self, path, mwmpath, settings, mwmfile, materialspath):
+        """Sets the arguments of the MWM Builder run of the job, which is either run after the stages or batched with other jobs"""
+
+        self.mwmBuild = (path, mwmpath, settings, mwmfile, materialspath)
+
+    def addFinalStage(self, name, function, *args, **kwargs):
+        """Adds a stage that is run once the MWM files of the job have been created"""
+
+        self.finalStages.append((name, function, args, kwargs))
+
+    def runStages(self, stages=None):
+        """Runs tool stages of the job one after another. A stage raising an exception ends the job. Returns whether all stages succeeded"""
+
+        if stages is None:
+            stages = self.stages
+            if self.mwmBuild is not None:
+                stages = stages + [("MWM Builder", mwmbuilder, (self, None) + self.mwmBuild, {})]
+            stages = stages + self.finalStages
+
+        start = time.perf_counter()
+        try:
+            for name, function, args, kwargs in stages:
+                print("SEUT Info: Scene '" + self.sceneName + "': Running " + name + ".")
+                function(*args, **kwargs)
+            return True
+        except Exception as e:
+            self.fail("%s failed: %s" % (name, str(e)))
+            return False
+        finally:
+            self.timeTools += time.perf_counter() - start
+
+
+def isMaskConflict(job1, job2):
+    """Returns True if the MWM Builder file masks of two jobs would pick up each other's loose files"""
+
+    if job1.exportPath != job2.exportPath:
+        return False
+
+    return job1.subtypeId.startswith(job2.subtypeId) or job2.subtypeId.startswith(job1.subtypeId)
+
+
+def getLanes(jobs):
+    """Groups jobs into lanes that may run at the same time. Jobs within a lane conflict with each other and run one after another"""
+
+    lanes = []
+    for job in jobs:
+        conflicting = [lane for lane in lanes if any(isMaskConflict(job, other) for other in lane)]
+        merged = [job]
+        for lane in conflicting:
+            lanes.remove(lane)
+            merged = lane + merged
+        lanes.append(merged)
+
+    # Keep the original scene order within each lane.
+    return [sorted(lane, key=jobs.index) for lane in lanes]
+
+
+def runLane(lane):
+    for job in lane:
+        job.runStages()
+
+
+def run_export_jobs(jobs, maxWorkers, batchMwm=False):
+    """Runs the tool stages of all jobs in a bounded worker pool. If batchMwm is set, the MWM files of all jobs
+    are compiled by a single MWM Builder run once all other stages are done"""
+
+    if not batchMwm:
+        lanes = getLanes([job for job in jobs if len(job.stages) > 0 or job.mwmBuild is not None])
+        if len(lanes) > 0:
+            with ThreadPoolExecutor(max_workers=max(1, maxWorkers)) as executor:
+                futures = [executor.submit(runLane, lane) for lane in lanes]
+                for future in futures:
+                    future.result()
+        return
+
+    # Without MWM Builder file masks there is nothing for the jobs to conflict over.
+    with ThreadPoolExecutor(max_workers=max(1, maxWorkers)) as executor:
+        futures = [(job, executor.submit(job.runStages, job.stages)) for job in jobs if len(job.stages) > 0 or job.mwmBuild is not None]
+        batch = [job for job, future in futures if future.result() and job.mwmBuild is not None]
+
+    if len(batch) == 0:
+        return
+
+    print("SEUT Info: Running MWM Builder once for %i scenes." % (len(batch)))
+    start = time.perf_counter()
+    built = mwmbuilder_batch(batch)
+    print("SEUT Info: MWM Builder finished after %.2fs." % (time.perf_counter() - start))
+
+    for job in built:
+        job.runStages(job.finalStages)
+
+
+def export_report(jobs):
+    """Returns the per-scene summary lines of an export run"""
+
+    lines = []
+    for job in jobs:
+        if job.failed:
+            status = "FAILED"
+        else:
+            status = "OK"
+
+        line = "%s - Scene '%s' (SubtypeId: '%s'): Blender %.2fs, Tools %.2fs" % (status, job.sceneName, job.subtypeId, job.timeBlender, job.timeTools)
+        if job.error is not None:
+            line += " - " + job.error
+        lines.append(line)
+
+    return lines
@@ -1,10 +1,8 @@
 import bpy
 import os
-import math
 import glob
 import subprocess
 import xml.etree.ElementTree as ET
-import xml.dom.minidom
 
 from os.path                                import join
 from mathutils                              import Matrix	
@@ -12,12 +10,15 @@ from bpy_extras.io_utils                    import axis_conversion, ExportHelper
 
 from ..export.seut_custom_fbx_exporter      import save_single
 from ..seut_ot_recreateCollections          import SEUT_OT_RecreateCollections
-from ..seut_utils                           import linkSubpartScene, unlinkSubpartScene
+from .seut_tool_runner                      import ToolRun, ToolCancelledError
+from .seut_xml_writer                       import write_xml
+from .seut_export_materials                 import ExportMaterials
 
 from ..seut_errors                          import showError
+from ..utils.called_tool_type               import ToolType
 
-def export_XML(self, context, collection):
-    """Exports the XML file for a defined collection"""
+def export_XML(self, context, collection, materials=None):
+    """Exports the XML file for a defined collection. The export materials of the session can be passed to share them between collections"""
 
     scene = context.scene
     collections = SEUT_OT_RecreateCollections.getCollections(scene)
@@ -53,154 +54,15 @@ def export_XML(self, context, collection):
     
     path = os.path.normpath(bpy.path.abspath(scene.seut.export_exportPath)) + "\\"
 
+    if materials is None:
+        materials = ExportMaterials()
+
     # Currently no support for the other material parameters - are those even needed anymore?
 
-    # Iterate through all materials in the file
-    for mat in bpy.data.materials:
-        if mat == None:
-            continue
-        if mat.users == 0 or mat.users == 1 and mat.use_fake_user:
-            continue
-        
-        # This ensures that the material presets used internally are not written to the XML.
-        if mat.name[:5] == 'SMAT_':
-            continue
-        
-        # mat is a local material.
-        elif mat.library == None:
-
-            # If the material is not part of a linked library, I have to account for the possibility that it is a leftover material from import.
-            # Those do get cleaned up, but only after the BLEND file is saved, closed and reopened. That may not have happened.
-            isUnique = False
-            for mtl in bpy.data.materials:
-                # There is a material with its name in a linked library but override is turned on.
-                if mtl.library != None and mtl.name == mat.name and mat.seut.overrideMatLib == True:
-                    isUnique = True
-                # There is a material with its name in a linked library and override is turned off.
-                if mtl.library != None and mtl.name == mat.name and mat.seut.overrideMatLib == False:
-                    isUnique = False
-                # There is no material with its name in a linked library.
-                elif mtl.library == None and mat.library == None and mtl.name == mat.name:
-                    isUnique = True
-            
-            if isUnique:
-                matEntry = ET.SubElement(model, 'Material')
-                matEntry.set('Name', mat.name)
-
-                matTechnique = ET.SubElement(matEntry, 'Parameter')
-                matTechnique.set('Name', 'Technique')
-                matTechnique.text = mat.seut.technique
-
-                if mat.seut.facing != 'None':
-                    matFacing = ET.SubElement(matEntry, 'Parameter')
-                    matFacing.set('Name', 'Facing')
-                    matFacing.text = mat.seut.facing
-                    
-                if mat.seut.windScale != 0:
-                    matWindScale = ET.SubElement(matEntry, 'Parameter')
-                    matWindScale.set('Name', 'WindScale')
-                    matWindScale.text = str(mat.seut.windScale)
-                    
-                if mat.seut.windFrequency != 0:
-                    matWindFrequency = ET.SubElement(matEntry, 'Parameter')
-                    matWindFrequency.set('Name', 'WindFrequency')
-                    matWindFrequency.text = str(mat.seut.windFrequency)
-                
-                # Iterate through all image textures in material and register relevant ones to dictionary.
-                images = {
-                    'cm': None,
-                    'ng': None,
-                    'add': None,
-                    'am': None
-                    }
-
-                if mat.node_tree is not None:
-                    for node in mat.node_tree.nodes:
-                        if node.type == 'TEX_IMAGE':
-                            if node.name == 'CM':
-                                images['cm'] = node.image
-                            if node.name == 'NG':
-                                images['ng'] = node.image
-                            if node.name == 'ADD':
-                                images['add'] = node.image
-                            if node.name == 'ALPHAMASK':
-                                images['am'] = node.image
-
-                # Used to create the relative paths for the textures.
-                offset = 0
-
-                # _cm ColorMask texture
-                if images['cm'] == None:
-                    self.report({'WARNING'}, "SEUT: No 'CM' texture or node found for local material '%s'. Skipping." % (mat.name))
-                else:
-                    offset = images['cm'].filepath.find("Textures\\")
-                    if offset == -1:
-                        self.report({'ERROR'}, "SEUT: 'CM' texture filepath in local material '%s' does not contain 'Textures\\'. Cannot be transformed into relative path. (007)" % (mat.name))
-                    else:
-                        matCM = ET.SubElement(matEntry, 'Parameter')
-                        matCM.set('Name', 'ColorMetalTexture')
-                        matCM.text = os.path.splitext(images['cm'].filepath[offset:])[0] + ".dds"
-                    
-                    if not isValidResolution(images['cm'].size[0]) or not isValidResolution(images['cm'].size[1]):
-                        self.report({'WARNING'}, "SEUT: 'CM' texture of local material '%s' is not of a valid resolution (%sx%s). May not display correctly ingame." % (mat.name, str(images['cm'].size[0]), str(images['cm'].size[1])))
-                
-                # _ng NormalGloss texture
-                if images['ng'] == None:
-                    self.report({'WARNING'}, "SEUT: No 'NG' texture or node found for local material '%s'. Skipping." % (mat.name))
-                else:
-                    offset = images['ng'].filepath.find("Textures\\")
-                    if offset == -1:
-                        self.report({'ERROR'}, "SEUT: 'NG' texture filepath in local material '%s' does not contain 'Textures\\'. Cannot be transformed into relative path. (007)" % (mat.name))
-                    else:
-                        matNG = ET.SubElement(matEntry, 'Parameter')
-                        matNG.set('Name', 'NormalGlossTexture')
-                        matNG.text = os.path.splitext(images['ng'].filepath[offset:])[0] + ".dds"
-                    
-                    if not isValidResolution(images['ng'].size[0]) or not isValidResolution(images['ng'].size[1]):
-                        self.report({'WARNING'}, "SEUT: 'NG' texture of local material '%s' is not of a valid resolution (%sx%s). May not display correctly ingame." % (mat.name, str(images['ng'].size[0]), str(images['ng'].size[1])))
-                
-                # _add AddMaps texture
-                if images['add'] == None:
-                    self.report({'WARNING'}, "SEUT: No 'ADD' texture or node found for local material '%s'. Skipping." % (mat.name))
-                else:
-                    offset = images['add'].filepath.find("Textures\\")
-                    if offset == -1:
-                        self.report({'ERROR'}, "SEUT: 'ADD' texture filepath in local material '%s' does not contain 'Textures\\'. Cannot be transformed into relative path. (007)" % (mat.name))
-                    else:
-                        matADD = ET.SubElement(matEntry, 'Parameter')
-                        matADD.set('Name', 'AddMapsTexture')
-                        matADD.text = os.path.splitext(images['add'].filepath[offset:])[0] + ".dds"
-                    
-                    if not isValidResolution(images['add'].size[0]) or not isValidResolution(images['add'].size[1]):
-                        self.report({'WARNING'}, "SEUT: 'ADD' texture of local material '%s' is not of a valid resolution (%sx%s). May not display correctly ingame." % (mat.name, str(images['add'].size[0]), str(images['add'].size[1])))
-                
-                # _alphamask Alphamask texture
-                if images['am'] == None:
-                    self.report({'WARNING'}, "SEUT: No 'ALPHAMASK' texture or node found for local material '%s'. Skipping." % (mat.name))
-                else:
-                    offset = images['am'].filepath.find("Textures\\")
-                    if offset == -1:
-                        self.report({'ERROR'}, "SEUT: 'ALPHAMASK' texture filepath in local material '%s' does not contain 'Textures\\'. Cannot be transformed into relative path. (007)" % (mat.name))
-                    else:
-                        matAM = ET.SubElement(matEntry, 'Parameter')
-                        matAM.set('Name', 'AlphamaskTexture')
-                        matAM.text = os.path.splitext(images['am'].filepath[offset:])[0] + ".dds"
-                    
-                    if not isValidResolution(images['am'].size[0]) or not isValidResolution(images['am'].size[1]):
-                        self.report({'WARNING'}, "SEUT: 'ALPHAMASK' texture of local material '%s' is not of a valid resolution (%sx%s). May not display correctly ingame." % (mat.name, str(images['am'].size[0]), str(images['am'].size[1])))
-
-                # If no textures are added to the material, remove the entry again.
-                if images['cm'] == None and images['ng'] == None and images['add'] == None and images['am'] == None:
-                    self.report({'INFO'}, "SEUT: Local material '%s' does not contain any valid textures. Skipping." % (mat.name))
-                    model.remove(matEntry)
-                else:
-                    self.report({'INFO'}, "SEUT: Local material '%s' saved. Don't forget to include relevant DDS texture files in mod!" % (mat.name))
-
-        elif mat.library != None:
-            matRef = ET.SubElement(model, 'MaterialRef')
-            matRef.set('Name', mat.name)
-            
-    
+    # Material entries are created once per export session and reused for every collection.
+    for matEntry in materials.getEntries(self):
+        model.append(matEntry)
+
     # Only add LODs to XML if exporting the main collection, the LOD collections exist and are not empty.
     if collection == collections['main']:
         
@@ -248,15 +110,6 @@ def export_XML(self, context, collection):
             bs_lodModel = ET.SubElement(bs_lod, 'Model')
             bs_lodModel.text = path[path.find("Models\\"):] + scene.seut.subtypeId + '_BS_LOD'
 
-    # Create file with subtypename + collection name and write string to it
-    tempString = ET.tostring(model, 'utf-8')
-    try:
-        tempString.decode('ascii')
-    except UnicodeDecodeError:
-        showError(context, "Report: Error", "SEUT Error: Invalid character(s) detected. This will prevent a MWM-file from being generated. Please ensure that no special (non ASCII) characters are used in SubtypeIds, Material names or object names. (033)")
-    xmlString = xml.dom.minidom.parseString(tempString)
-    xmlFormatted = xmlString.toprettyxml()
-    
     fileType = collection.name[:collection.name.find(" (")]
     
     if collection == collections['main']:
@@ -264,15 +117,40 @@ def export_XML(self, context, collection):
     else:
         filename = scene.seut.subtypeId + '_' + fileType
 
-    exportedXML = open(path + filename + ".xml", "w")
-    exportedXML.write(xmlFormatted)
+    # Create file with subtypename + collection name and write the tree to it
+    if not write_xml(model, path + filename + ".xml"):
+        showError(context, "Report: Error", "SEUT Error: Invalid character(s) detected. This will prevent a MWM-file from being generated. Please ensure that no special (non ASCII) characters are used in SubtypeIds, Material names or object names. (033)")
+
     self.report({'INFO'}, "SEUT: '%s.xml' has been created." % (path + filename))
 
     return {'FINISHED'}
 
 
-def export_model_FBX(self, context, collection):
-    """Exports the FBX file for a defined collection"""
+def get_children_recursive(obj):
+    """Returns all objects in the hierarchy below an object"""
+
+    children = []
+    for child in obj.children:
+        children.append(child)
+        children.extend(get_children_recursive(child))
+
+    return children
+
+
+def filter_subpart_instances(objects):
+    """Returns the objects without the subpart instances parented to the subpart empties among them, as those belong to the subpart's own model"""
+
+    subpartInstances = set()
+    for obj in objects:
+        if obj is not None and obj.type == 'EMPTY' and 'file' in obj and obj.seut.linkedScene is not None:
+            subpartInstances.update(get_children_recursive(obj))
+
+    return [obj for obj in objects if obj not in subpartInstances]
+
+
+def export_model_FBX(self, context, collection, materials=None):
+    """Exports the FBX file for a defined collection. If the export materials of the session are passed, the materials are
+    only prepared once for all collections and have to be restored through them once the session is done"""
 
     scene = context.scene
     depsgraph = context.evaluated_depsgraph_get()
@@ -301,7 +179,6 @@ def export_model_FBX(self, context, collection):
     layer_collection = bpy.context.view_layer.layer_collection.children[collection.name]
     bpy.context.view_layer.active_layer_collection = layer_collection
     
-    # Unlink all subparts parented to an empty
     for emptyObj in collection.objects:
         if emptyObj is not None and emptyObj.type == 'EMPTY':
             if emptyObj.parent is None:
@@ -315,25 +192,23 @@ def export_model_FBX(self, context, collection):
                     print("SEUT Warning: Highlight empty '" + emptyObj.name + "' and its linked object '" + emptyObj.seut.linkedObject.name + "' have different parent objects. This may prevent it from working properly ingame.")
             if 'file' in emptyObj and emptyObj.seut.linkedScene is not None:
                 emptyObj['file'] = emptyObj.seut.linkedScene.seut.subtypeId
-                unlinkSubpartScene(emptyObj)
 
-    for objMat in bpy.data.materials:
-        if objMat is not None and objMat.node_tree is not None:
-            prepMatForExport(self, context, objMat)
+    # Subpart instances parented to an empty are left out of the export instead of being unlinked and linked again afterwards
+    exportObjects = filter_subpart_instances(list(collection.objects))
+
+    isSession = materials is not None
+    if not isSession:
+        materials = ExportMaterials()
+
+    # Only the materials of the exported objects need to be prepared.
+    materials.prepareForExport(self, context, exportObjects)
 
     # This is the actual call to make an FBX file.
     fbxfile = join(path, filename + ".fbx")
-    export_to_fbxfile(settings, scene, fbxfile, collection.objects, ishavokfbxfile=False)
+    export_to_fbxfile(settings, scene, fbxfile, exportObjects, ishavokfbxfile=False)
 
-    for objMat in bpy.data.materials:
-        if objMat is not None and objMat.node_tree is not None:
-            removeExportDummiesFromMat(self, context, objMat)
-    
-    # Relink all subparts to empties
-    for emptyObj in collection.objects:
-        if scene.seut.linkSubpartInstances:
-            if 'file' in emptyObj and emptyObj.seut.linkedScene is not None and emptyObj.seut.linkedScene.name in bpy.data.scenes:
-                linkSubpartScene(self, scene, emptyObj, None)
+    if not isSession:
+        materials.restoreAfterExport(self, context)
 
     bpy.context.scene.collection.children.unlink(collection)
     self.report({'INFO'}, "SEUT: '%s.fbx' has been created." % (path + filename))
@@ -341,96 +216,6 @@ def export_model_FBX(self, context, collection):
     return {'FINISHED'}
 
 
-def prepMatForExport(self, context, material):
-    """Switches material around so that SE can properly read it"""
-    
-    # See if relevant nodes already exist
-    dummyShaderNode = None
-    dummyImageNode = None
-    dummyImage = None
-    materialOutput = None
-
-    for node in material.node_tree.nodes:
-        if node.type == 'BSDF_PRINCIPLED' and node.name == 'EXPORT_DUMMY':
-            dummyShaderNode = node
-        elif node.type == 'TEX_IMAGE' and node.name == 'DUMMY_IMAGE':
-            dummyImageNode = node
-        elif node.type == 'OUTPUT_MATERIAL':
-            materialOutput = node
-
-    # Iterate through images to find the dummy image
-    for img in bpy.data.images:
-        if img.name == 'DUMMY':
-            dummyImage = img
-
-    # If no, create it and DUMMY image node, and link them up
-    if dummyImageNode is None:
-        dummyImageNode = material.node_tree.nodes.new('ShaderNodeTexImage')
-        dummyImageNode.name = 'DUMMY_IMAGE'
-        dummyImageNode.label = 'DUMMY_IMAGE'
-
-    if dummyImage is None:
-        dummyImage = bpy.data.images.new('DUMMY', 1, 1)
-
-    if dummyShaderNode is None:
-        dummyShaderNode = material.node_tree.nodes.new('ShaderNodeBsdfPrincipled')
-        dummyShaderNode.name = 'EXPORT_DUMMY'
-        dummyShaderNode.label = 'EXPORT_DUMMY'
-    
-    if materialOutput is None:
-        materialOutput = material.node_tree.nodes.new('ShaderNodeOutputMaterial')
-        material.seut.nodeLinkedToOutputName = ""
-    # This allows the reestablishment of connections after the export is complete.
-    else:
-        try:
-            material.seut.nodeLinkedToOutputName = materialOutput.inputs[0].links[0].from_node.name
-        except IndexError:
-            print("SEUT Info: IndexError at material '" + material.name + "'.")
-
-    # link nodes, add image to node
-    material.node_tree.links.new(dummyImageNode.outputs[0], dummyShaderNode.inputs[0])
-    material.node_tree.links.new(dummyShaderNode.outputs[0], materialOutput.inputs[0])
-    dummyImageNode.image = dummyImage
-
-    return
-
-
-def removeExportDummiesFromMat(self, context, material):
-    """Removes the dummy nodes from the material again after export"""
-
-    materialOutput = None
-    nodeLinkedToOutput = None
-
-    # Remove dummy nodes - do I need to remove the links too?
-    # Image can stay, it's 1x1 px so nbd
-    for node in material.node_tree.nodes:
-        if node.type == 'TEX_IMAGE' and node.name == 'DUMMY_IMAGE':
-            material.node_tree.nodes.remove(node)
-        elif node.type == 'BSDF_PRINCIPLED' and node.name == 'EXPORT_DUMMY':
-            material.node_tree.nodes.remove(node)
-
-        elif node.type == 'OUTPUT_MATERIAL':
-            materialOutput = node
-        elif node.name == material.seut.nodeLinkedToOutputName:
-            nodeLinkedToOutput = node
-    
-    # link the node group back to output
-    if nodeLinkedToOutput is not None:
-        try:
-            material.node_tree.links.new(nodeLinkedToOutput.outputs[0], materialOutput.inputs[0])
-        except IndexError:
-            print("SEUT Info: IndexError at material '" + material.name + "'.")
-
-    return
-
-def isValidResolution(number):
-    """Returns True if number is a valid resolution (a square of 2)"""
-    
-    if number <= 0:
-        return False
-
-    return math.log(number, 2).is_integer()
-
 # STOLLIE: Standard output error operator class for catching error return codes.
 class StdoutOperator():
     def report(self, type, message):
@@ -459,15 +244,29 @@ def tool_path(propertyName, displayName, toolPath=None):
         addon = __package__[:__package__.find(".")]
         toolPath = getattr(bpy.context.preferences.addons.get(addon).preferences, propertyName)
 
-    if toolPath is None:
-        raise FileNotFoundError("%s is not configured", (displayName))
+    if toolPath is None or toolPath == "":
+        raise FileNotFoundError("%s is not configured." % (displayName))
 
     toolPath = os.path.normpath(bpy.path.abspath(toolPath))
-    if os.path.isfile(toolPath) is None:
-        raise FileNotFoundError("%s: no such file %s" % (displayName, toolPath))
+    if not os.path.isfile(toolPath):
+        raise FileNotFoundError("%s: no such file '%s'." % (displayName, toolPath))
 
     return toolPath
 
+def tool_timeouts():
+    """Gets the timeouts of the external tools in seconds from user preferences. Tools without a timeout are left out"""
+
+    addon = __package__[:__package__.find(".")]
+    preferences = bpy.context.preferences.addons.get(addon).preferences
+
+    timeouts = {}
+    for tooltype, propertyName in ((ToolType(1), 'fbxImporterTimeout'), (ToolType(2), 'havokTimeout'), (ToolType(3), 'mwmbTimeout')):
+        timeout = getattr(preferences, propertyName)
+        if timeout > 0:
+            timeouts[tooltype] = timeout
+
+    return timeouts
+
 # STOLLIE: Called by other methods to write to a log file when an errors occur.
 def write_to_log(logfile, content, cmdline=None, cwd=None, loglines=[]):
     with open(logfile, 'wb') as log: # wb params here represent writing/create file and binary mode.
@@ -502,6 +301,7 @@ class ExportSettings:
         self.depsgraph = depsgraph
         self.operator = STDOUT_OPERATOR
         self.isLogToolOutput = True
+        self.toolTimeouts = tool_timeouts()
         
         # set on first access, see properties below
         self._fbximporter = None
@@ -527,21 +327,50 @@ class ExportSettings:
             self._mwmbuilder = tool_path('mwmbPath', 'MWM Builder')
         return self._mwmbuilder
 
+    def resolveTools(self, operator, *tools):
+        """Resolves the paths of the given tools ('fbximporter', 'havokfilter', 'mwmbuilder') from the preferences.
+        Must be called from the main thread before the tools are run by the export pool, which cannot access the preferences."""
+
+        for tool in tools:
+            try:
+                getattr(self, tool)
+            except FileNotFoundError as e:
+                operator.report({'ERROR'}, "SEUT: %s (012)" % (str(e)))
+                print("SEUT Error: " + str(e) + " (012)")
+                return {'CANCELLED'}
+
+        return {'CONTINUE'}
+
     def callTool(self, context, cmdline, tooltype, logfile=None, cwd=None, successfulExitCodes=[0], loglines=[], logtextInspector=None):
+        run = ToolRun(
+            cmdline,
+            str(tooltype),
+            cwd=cwd,
+            logfile=logfile if self.isLogToolOutput else None,
+            timeout=self.toolTimeouts.get(tooltype),
+            loglines=loglines,
+            keepOutput=logtextInspector is not None
+        )
+
         try:
-            out = subprocess.check_output(cmdline, cwd=cwd, stderr=subprocess.STDOUT, shell=True)
-            if self.isLogToolOutput and logfile:
-                write_to_log(logfile, out, cmdline=cmdline, cwd=cwd, loglines=loglines)
+            out = run.run(successfulExitCodes)
             if logtextInspector is not None:
                 logtextInspector(out)
 
-        except subprocess.CalledProcessError as e:
-            if self.isLogToolOutput and logfile:
-                write_to_log(logfile, e.output, cmdline=cmdline, cwd=cwd, loglines=loglines)
-            if e.returncode not in successfulExitCodes:
-                showError(context, "Report: Error", "SEUT Error: There was an error during export caused by " + str(tooltype) + "."
-                + " Please refer to the logs in your export folder for details. (035)")
-                raise
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, ToolCancelledError) as e:
+            if isinstance(e, subprocess.TimeoutExpired):
+                message = "SEUT Error: " + str(tooltype) + " did not finish within %i seconds and has been stopped. (036)" % (e.timeout)
+            elif isinstance(e, ToolCancelledError):
+                message = "SEUT Error: " + str(tooltype) + " has been cancelled. (037)"
+            else:
+                message = "SEUT Error: There was an error during export caused by " + str(tooltype) + "." + " Please refer to the logs in your export folder for details. (035)"
+
+            # Tool stages run by the export pool have no context and must not open popups outside of the main thread.
+            if context is None:
+                print(message)
+            else:
+                showError(context, "Report: Error", message)
+            raise
     
     def __getitem__(self, key): # makes all attributes available for parameter substitution
         if not type(key) is str or key.startswith('_'):
@@ -0,0 +1,160 @@
+"""Regenerates the Materials.xml files of all MatLibs in the Materials folder without opening them in the UI.
+
+Usage:
+    blender --background --python <addon folder>/export/seut_matlib_batch.py -- [--materials PATH] [--workers N] [--full]
+
+The MatLibs are split between several background instances of Blender, which export them in parallel.
+"""
+
+import bpy
+import os
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+import importlib
+import addon_utils
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+def get_addon():
+    """Returns the name the addon is installed under, as this file is run as a script rather than as part of the addon"""
+
+    return os.path.basename(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def parse_arguments():
+
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+
+    parser = argparse.ArgumentParser(prog="seut_matlib_batch.py", description="Regenerates the Materials.xml files of all MatLibs in the Materials folder.")
+    parser.add_argument('--materials', help="Materials folder, defaults to the one set in the addon preferences")
+    parser.add_argument('--workers', type=int, default=max(1, (os.cpu_count() or 2) - 1), help="Number of Blender instances to run in parallel")
+    parser.add_argument('--full', action='store_true', help="Rewrite all files, even if no material has changed")
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--report', help=argparse.SUPPRESS)
+    parser.add_argument('files', nargs='*', help=argparse.SUPPRESS)
+
+    return parser.parse_args(argv)
+
+
+def run_worker(args):
+    """Exports the MatLibs passed to this instance and writes the messages to the report file"""
+
+    exportMaterials = importlib.import_module(get_addon() + ".export.seut_ot_exportMaterials")
+    reports = exportMaterials.export_matlibs(args.files, not args.full)
+
+    results = {}
+    for report in reports:
+        results[report.filepath] = [[sorted(type), message] for type, message in report.messages]
+
+    with open(args.report, 'w') as file:
+        json.dump(results, file)
+
+
+def run_batch(args):
+    """Splits the MatLibs between worker instances, waits for them and prints a summary per MatLib. Returns the exit code"""
+
+    addon = get_addon()
+    runner = importlib.import_module(addon + ".export.seut_tool_runner")
+
+    materialsPath = args.materials
+    if materialsPath is None:
+        preferences = bpy.context.preferences.addons.get(addon).preferences
+        materialsPath = preferences.materialsPath
+    materialsPath = os.path.normpath(bpy.path.abspath(materialsPath))
+
+    if not os.path.isdir(materialsPath):
+        print("SEUT Error: Path to Materials Folder '" + materialsPath + "' not valid. (017)")
+        return 1
+
+    matlibs = sorted(os.path.join(materialsPath, entry.name) for entry in os.scandir(materialsPath)
+                     if entry.is_file() and entry.name.endswith(".blend") and entry.name.find("MatLib_") != -1)
+    if len(matlibs) == 0:
+        print("SEUT Info: No MatLibs found in '" + materialsPath + "'.")
+        return 0
+
+    workerCount = max(1, min(args.workers, len(matlibs)))
+    chunks = [matlibs[i::workerCount] for i in range(workerCount)]
+    print("SEUT Info: Exporting %i MatLib(s) with %i worker(s)." % (len(matlibs), workerCount))
+
+    tempDir = tempfile.mkdtemp(prefix="seut_matlibs_")
+
+    def run_chunk(index):
+        reportPath = os.path.join(tempDir, "worker_%i.json" % (index))
+        cmdline = [bpy.app.binary_path, '--background', '--python-exit-code', '1', '--python', os.path.abspath(__file__), '--', '--worker', '--report', reportPath]
+        if args.full:
+            cmdline.append('--full')
+        cmdline.extend(chunks[index])
+
+        run = runner.ToolRun(cmdline, "MatLib worker %i" % (index + 1), logfile=os.path.join(tempDir, "worker_%i.log" % (index)))
+        try:
+            run.run()
+        except Exception as error:
+            print("SEUT Error: MatLib worker %i failed: %s" % (index + 1, str(error)))
+            return None
+
+        with open(reportPath, 'r') as file:
+            return json.load(file)
+
+    # The reports and logs of the workers are only needed until the summary has been printed.
+    try:
+        with ThreadPoolExecutor(max_workers=workerCount) as pool:
+            results = list(pool.map(run_chunk, range(workerCount)))
+
+        exitCode = 0
+        print("SEUT Info: MatLib export summary:")
+        for index, result in enumerate(results):
+            if result is None:
+                exitCode = 1
+                for filepath in chunks[index]:
+                    print("    %s: not exported" % (os.path.basename(filepath)))
+                print_log(os.path.join(tempDir, "worker_%i.log" % (index)))
+                continue
+
+            for filepath in chunks[index]:
+                messages = result.get(filepath, [])
+                warnings = [message for type, message in messages if 'WARNING' in type]
+                errors = [message for type, message in messages if 'ERROR' in type]
+                if len(errors) > 0:
+                    exitCode = 1
+
+                print("    %s: %i warning(s), %i error(s)" % (os.path.basename(filepath), len(warnings), len(errors)))
+                for message in errors + warnings:
+                    print("        " + message)
+
+        return exitCode
+
+    finally:
+        shutil.rmtree(tempDir, ignore_errors=True)
+
+
+def print_log(logfile):
+    """Prints the log of a failed worker, as it is removed along with the other temporary files"""
+
+    try:
+        with open(logfile, 'rb') as log:
+            lines = log.read().decode('utf-8', errors='replace').splitlines()
+    except EnvironmentError:
+        return
+
+    print("    Log of the worker:")
+    for line in lines:
+        print("        " + line)
+
+
+def main():
+
+    addon_utils.enable(get_addon(), default_set=False)
+    args = parse_arguments()
+
+    if args.worker:
+        run_worker(args)
+    else:
+        sys.exit(run_batch(args))
+
+
+if __name__ == "__main__":
+    main()
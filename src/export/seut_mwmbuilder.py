@@ -1,22 +1,29 @@
 import os
 import glob
+import shutil
+import tempfile
+import subprocess
 
 from .seut_export_utils         import ExportSettings
 from ..utils.called_tool_type   import ToolType
 
+# Suffixes of the models a scene may export apart from its main model.
+MODEL_SUFFIXES = ['_BS1', '_BS2', '_BS3', '_LOD1', '_LOD2', '_LOD3', '_BS_LOD']
+
 def mwmbuilder(self, context, path, mwmpath, settings: ExportSettings, mwmfile: str, materialspath):
+    # The SubtypeId is taken from the target file so this can also run from the export pool, where there is no scene to read it from.
+    subtypeId = os.path.splitext(os.path.basename(mwmfile))[0]
     try:
-        scene = context.scene
-        cmdline = [settings.mwmbuilder, '/f', '/s:'+path+'', '/m:'+scene.seut.subtypeId+'*.fbx', '/o:'+mwmpath+'', '/x:'+materialspath+'']
+        cmdline = [settings.mwmbuilder, '/f', '/s:'+path+'', '/m:'+subtypeId+'*.fbx', '/o:'+mwmpath+'', '/x:'+materialspath+'']
         settings.callTool(
             context,
             cmdline,
             ToolType(3),
             cwd=path,
-            logfile=path + scene.seut.subtypeId + '.log'            
+            logfile=path + subtypeId + '.log'
         )
     finally:
-        fileRemovalList = [fileName for fileName in glob.glob(mwmpath + "*.hkt.mwm")]
+        fileRemovalList = [fileName for fileName in glob.glob(mwmpath + subtypeId + "*.hkt.mwm")]
         try:
             for fileName in fileRemovalList:
                 os.remove(fileName)
@@ -24,5 +31,135 @@ def mwmbuilder(self, context, path, mwmpath, settings: ExportSettings, mwmfile:
         except EnvironmentError:
             self.report({'ERROR'}, "SEUT: Deletion of loose files failed. (020)")
             print("SEUT Error: Deletion of loose files failed. (020)")
-        
-        self.report({'INFO'}, "SEUT: MWM file(s) for SubtypeId '%s' (Scene Type: '%s') have been created." % (scene.seut.subtypeId, scene.seut.sceneType))
+
+        self.report({'INFO'}, "SEUT: MWM file(s) for SubtypeId '%s' have been created." % (subtypeId))
+
+
+def mwmbuilder_batch(jobs):
+    """Compiles the loose files of several export jobs with a single MWM Builder run per materials folder.
+    Returns the jobs whose MWM files have all been created"""
+
+    batches = {}
+    for job in jobs:
+        path, mwmpath, settings, mwmfile, materialspath = job.mwmBuild
+        batches.setdefault((settings.mwmbuilder, materialspath), []).append(job)
+
+    built = []
+    for batch in batches.values():
+        try:
+            built += mwmbuilder_staged(batch)
+        except Exception as e:
+            for job in batch:
+                job.fail("MWM Builder failed: %s" % (str(e)))
+
+    return built
+
+
+def mwmbuilder_staged(jobs):
+    """Copies the loose files of the jobs into a staging folder, runs MWM Builder over all of them and moves the results back"""
+
+    settings = jobs[0].mwmBuild[2]
+    materialspath = jobs[0].mwmBuild[4]
+
+    stagingPath = tempfile.mkdtemp(prefix="seut_mwmbuilder_")
+    outputPath = os.path.join(stagingPath, "output")
+    logfile = os.path.join(stagingPath, "MwmBuilder.log")
+    os.mkdir(outputPath)
+
+    # Maps the lower case name of every staged model to its job. Only files named exactly after a model are staged,
+    # which keeps SubtypeIds that are prefixes of each other apart and leaves out the intermediate .hkt.fbx files.
+    models = {}
+    failed = set()
+    try:
+        for job in jobs:
+            path = job.mwmBuild[0]
+            for modelName in [job.subtypeId] + [job.subtypeId + suffix for suffix in MODEL_SUFFIXES]:
+                if not os.path.isfile(path + modelName + ".fbx"):
+                    continue
+                for extension in (".fbx", ".xml", ".hkt"):
+                    if os.path.isfile(path + modelName + extension):
+                        shutil.copyfile(path + modelName + extension, os.path.join(stagingPath, modelName + extension))
+                models[modelName.lower()] = (job, modelName)
+
+        cmdline = [settings.mwmbuilder, '/f', '/s:'+stagingPath+'', '/m:*.fbx', '/o:'+outputPath+'', '/x:'+materialspath+'']
+        toolFailed = False
+        try:
+            settings.callTool(
+                None,
+                cmdline,
+                ToolType(3),
+                cwd=stagingPath,
+                logfile=logfile
+            )
+        except subprocess.CalledProcessError:
+            toolFailed = True
+
+        sections = split_log(logfile, models)
+
+        for modelName, (job, name) in models.items():
+            path, mwmpath = job.mwmBuild[0], job.mwmBuild[1]
+            output = os.path.join(outputPath, name + ".mwm")
+            if not os.path.isfile(output):
+                failed.add(job)
+                job.fail("MWM Builder did not create '%s.mwm'." % (name))
+                continue
+            if toolFailed and any('error' in line.lower() for line in sections.get(modelName, [])):
+                failed.add(job)
+                job.fail("MWM Builder reported errors for '%s.mwm'." % (name))
+            shutil.move(output, mwmpath + name + ".mwm")
+
+        if settings.isLogToolOutput:
+            write_job_logs(jobs, models, sections, cmdline)
+
+    finally:
+        shutil.rmtree(stagingPath, ignore_errors=True)
+
+    built = []
+    for job in jobs:
+        if job not in failed:
+            job.report({'INFO'}, "SEUT: MWM file(s) for SubtypeId '%s' have been created." % (job.subtypeId))
+            built.append(job)
+
+    return built
+
+
+def split_log(logfile, models):
+    """Splits the log of a batched MWM Builder run into sections per model. Lines before the first model are stored under None"""
+
+    sections = {None: []}
+    current = None
+
+    try:
+        with open(logfile, 'r', encoding='utf-8', errors='replace') as log:
+            lines = log.read().splitlines()
+    except EnvironmentError:
+        return sections
+
+    # Longer names first, so that a model whose name ends in another model's name is not mistaken for it.
+    modelNames = sorted(models.keys(), key=len, reverse=True)
+
+    for line in lines:
+        lowerLine = line.lower()
+        for modelName in modelNames:
+            if modelName + ".fbx" in lowerLine or modelName + ".mwm" in lowerLine:
+                current = modelName
+                break
+        sections.setdefault(current, []).append(line)
+
+    return sections
+
+
+def write_job_logs(jobs, models, sections, cmdline):
+    """Writes the log sections of a batched MWM Builder run to the export folders of their jobs"""
+
+    for job in jobs:
+        lines = ["Command: %s " % (" ".join(cmdline))] + sections[None]
+        for modelName, (modelJob, name) in models.items():
+            if modelJob is job:
+                lines += sections.get(modelName, [])
+
+        try:
+            with open(job.mwmBuild[0] + job.subtypeId + '.log', 'w', encoding='utf-8') as log:
+                log.write("\n".join(lines) + "\n")
+        except EnvironmentError:
+            print("SEUT Warning: MWM Builder log for SubtypeId '" + job.subtypeId + "' could not be written.")
@@ -13,6 +13,8 @@ from .seut_ot_exportHKT             import SEUT_OT_ExportHKT
 from .seut_ot_exportLOD             import SEUT_OT_ExportLOD
 from .seut_ot_exportMWM             import SEUT_OT_ExportMWM
 from .seut_ot_exportSBC             import SEUT_OT_ExportSBC
+from .seut_export_cache             import ExportCache
+from .seut_export_materials         import ExportMaterials
 from ..seut_ot_recreateCollections  import SEUT_OT_RecreateCollections
 from ..seut_errors                  import errorExportGeneral
 
@@ -25,53 +27,75 @@ class SEUT_OT_Export(Operator):
     def execute(self, context):
 
         print("SEUT Info: Running operator: ------------------------------------------------------------------ 'scene.export'")
-        
-        scene = context.scene
-        collections = SEUT_OT_RecreateCollections.getCollections(scene)
 
-        # If mode is not object mode, export fails horribly.
-        currentArea = context.area.type
-        context.area.type = 'VIEW_3D'
+        result = export_scene(self, context)
+        if not result == {'FINISHED'}:
+            return result
 
-        currentMode = None
-        if bpy.context.object is not None and bpy.context.object.mode is not 'OBJECT':
-            currentMode = bpy.context.object.mode
-            bpy.ops.object.mode_set(mode='OBJECT')
+        print("SEUT Info: Finished operator: ----------------------------------------------------------------- 'scene.export'")
 
-        # Checks export path and whether SubtypeId exists
-        result = errorExportGeneral(self, context)
-        if not result == {'CONTINUE'}:
-            return result
-        
-        # Character animations need at least one keyframe
-        if scene.seut.sceneType == 'character_animation' and len(scene.timeline_markers) <= 0:
-            scene.timeline_markers.new('F_00', frame=0)
-        
-        # Call all the individual export operators
-        result_main = SEUT_OT_ExportMain.export_Main(self, context, True)
-        SEUT_OT_ExportBS.export_BS(self, context, True)
-        SEUT_OT_ExportLOD.export_LOD(self, context, True)
+        return {'FINISHED'}
 
-        # HKT and SBC export are the only two filetypes those operators handle so I check for enabled here.
-        if scene.seut.export_hkt:
-            SEUT_OT_ExportHKT.export_HKT(self, context, True)
 
-        if scene.seut.export_sbc:
-            SEUT_OT_ExportSBC.export_SBC(self, context)
-        
-        # Finally, compile everything to MWM
-        if result_main == {'FINISHED'}:
-            SEUT_OT_ExportMWM.export_MWM(self, context)
-        
-        # Reset interaction mode
-        try:
-            if bpy.context.object is not None and bpy.context.object.mode is not None:
-                bpy.ops.object.mode_set(mode=currentMode)
-        except:
-            pass
-            
-        context.area.type = currentArea
+def export_scene(self, context, job=None):
+    """Exports all collections in the current scene and compresses them to MWM. If an export job is passed, the external tools are added to it instead of being run.
+    Only report() is used of self, so either the operator or the export job itself can be passed to collect the messages."""
+    
+    scene = context.scene
+    collections = SEUT_OT_RecreateCollections.getCollections(scene)
 
-        print("SEUT Info: Finished operator: ----------------------------------------------------------------- 'scene.export'")
+    # If mode is not object mode, export fails horribly.
+    currentArea = context.area.type
+    context.area.type = 'VIEW_3D'
 
-        return {'FINISHED'}
+    currentMode = None
+    if bpy.context.object is not None and bpy.context.object.mode != 'OBJECT':
+        currentMode = bpy.context.object.mode
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+    # Checks export path and whether SubtypeId exists
+    result = errorExportGeneral(self, context)
+    if not result == {'CONTINUE'}:
+        return result
+    
+    # Character animations need at least one keyframe
+    if scene.seut.sceneType == 'character_animation' and len(scene.timeline_markers) <= 0:
+        scene.timeline_markers.new('F_00', frame=0)
+    
+    # Collections that have not changed since the last export are skipped.
+    cache = None
+    if scene.seut.export_skipUnchanged:
+        cache = ExportCache(context)
+
+    # Materials are resolved once and shared by the XML and FBX files of all collections.
+    materials = ExportMaterials()
+
+    # Call all the individual export operators
+    try:
+        result_main = SEUT_OT_ExportMain.export_Main(self, context, True, cache, materials)
+        SEUT_OT_ExportBS.export_BS(self, context, True, cache, materials)
+        SEUT_OT_ExportLOD.export_LOD(self, context, True, cache, materials)
+    finally:
+        materials.restoreAfterExport(self, context)
+
+    # HKT and SBC export are the only two filetypes those operators handle so I check for enabled here.
+    if scene.seut.export_hkt:
+        SEUT_OT_ExportHKT.export_HKT(self, context, True, job, cache)
+
+    if scene.seut.export_sbc:
+        SEUT_OT_ExportSBC.export_SBC(self, context)
+    
+    # Finally, compile everything to MWM
+    if result_main == {'FINISHED'}:
+        SEUT_OT_ExportMWM.export_MWM(self, context, job, cache)
+    
+    # Reset interaction mode
+    try:
+        if bpy.context.object is not None and bpy.context.object.mode is not None:
+            bpy.ops.object.mode_set(mode=currentMode)
+    except:
+        pass
+        
+    context.area.type = currentArea
+
+    return {'FINISHED'}
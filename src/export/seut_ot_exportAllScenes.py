@@ -1,8 +1,13 @@
 import bpy
+import time
 
 from bpy.types      import Operator
 
+from .seut_ot_export                import export_scene
+from .seut_export_pool              import ExportJob, run_export_jobs, export_report
+from .seut_export_utils             import delete_loose_files
 from ..seut_errors                  import errorExportGeneral
+from ..seut_subpart_graph           import get_graph, find_cycles, get_export_order
 
 
 class SEUT_OT_ExportAllScenes(Operator):
@@ -13,6 +18,9 @@ class SEUT_OT_ExportAllScenes(Operator):
 
     def execute(self, context):
 
+        addon = __package__[:__package__.find(".")]
+        preferences = bpy.context.preferences.addons.get(addon).preferences
+
         # If mode is not object mode, export fails horribly.
         currentArea = context.area.type
         context.area.type = 'VIEW_3D'
@@ -27,17 +35,21 @@ class SEUT_OT_ExportAllScenes(Operator):
 
         originalScene = context.window.scene
 
-        sceneCounter = 0
-        notExportedCounter = 0
-        for scn in bpy.data.scenes:
-            sceneCounter += 1
-            context.window.scene = scn
-            print("SEUT Info: Exporting scene '" + scn.name + "'.")
-            try:
-                bpy.ops.scene.export()
-            except RuntimeError:
-                notExportedCounter += 1
-                print("SEUT Info: Scene '" + scn.name + "' could not be exported.")
+        if preferences.exportParallel:
+            sceneCounter, notExportedCounter = SEUT_OT_ExportAllScenes.export_AllScenesParallel(self, context, preferences.exportMaxWorkers, preferences.exportBatchMwm)
+
+        else:
+            sceneCounter = 0
+            notExportedCounter = 0
+            for scn in SEUT_OT_ExportAllScenes.get_Scenes(self, bpy.data.scenes):
+                sceneCounter += 1
+                context.window.scene = scn
+                print("SEUT Info: Exporting scene '" + scn.name + "'.")
+                try:
+                    bpy.ops.scene.export()
+                except RuntimeError:
+                    notExportedCounter += 1
+                    print("SEUT Info: Scene '" + scn.name + "' could not be exported.")
 
         context.window.scene = originalScene
 
@@ -49,7 +61,66 @@ class SEUT_OT_ExportAllScenes(Operator):
             pass
 
         context.area.type = currentArea
-        
+
         self.report({'INFO'}, "SEUT: %i of %i scenes successfully exported. Refer to Blender System Console for details." % (sceneCounter - notExportedCounter, sceneCounter))
 
-        return {'FINISHED'}
\ No newline at end of file
+        return {'FINISHED'}
+
+    def export_AllScenesParallel(self, context, maxWorkers, batchMwm=False):
+        """Exports the files of all scenes in Blender first and then runs the external tools of the scenes in a worker pool.
+        If batchMwm is set, MWM Builder is only run once for all scenes"""
+
+        jobs = SEUT_OT_ExportAllScenes.export_Jobs(self, context, SEUT_OT_ExportAllScenes.get_Scenes(self, bpy.data.scenes))
+
+        print("SEUT Info: Running external tools for %i scenes with up to %i at a time." % (len(jobs), maxWorkers))
+        run_export_jobs(jobs, maxWorkers, batchMwm)
+
+        return SEUT_OT_ExportAllScenes.finish_Jobs(jobs)
+
+    def get_Scenes(self, scenes):
+        """Returns the scenes in subpart dependency order, so every subpart is exported before the scenes using it"""
+
+        graph = get_graph()
+        for cycle in find_cycles(graph):
+            self.report({'WARNING'}, "SEUT: Scenes %s form a subpart instancing loop." % (" -> ".join("'" + name + "'" for name in cycle)))
+
+        return [bpy.data.scenes[name] for name in get_export_order([scn.name for scn in scenes])]
+
+    def export_Jobs(self, context, scenes):
+        """Exports the files of the scenes in Blender and returns the export jobs holding their external tool stages"""
+
+        jobs = []
+        for scn in scenes:
+            context.window.scene = scn
+            print("SEUT Info: Exporting scene '" + scn.name + "'.")
+
+            job = ExportJob(scn)
+            start = time.perf_counter()
+            try:
+                result = export_scene(job, context, job)
+                if not result == {'FINISHED'}:
+                    job.fail("Scene could not be exported.")
+            except Exception as e:
+                job.fail("Scene could not be exported: " + str(e))
+            job.timeBlender = time.perf_counter() - start
+            jobs.append(job)
+
+        return jobs
+
+    def finish_Jobs(jobs):
+        """Deletes the loose files of finished export jobs and prints the export report. Returns the number of jobs and of failed jobs"""
+
+        # Loose files can only be deleted once no job using the folder is still running.
+        deletedPaths = set()
+        for job in jobs:
+            if job.deleteLooseFiles and job.exportPath not in deletedPaths:
+                delete_loose_files(job.exportPath)
+                deletedPaths.add(job.exportPath)
+
+        print("SEUT Info: Export report:")
+        for line in export_report(jobs):
+            print("SEUT Info: " + line)
+
+        notExportedCounter = len([job for job in jobs if job.failed])
+
+        return len(jobs), notExportedCounter
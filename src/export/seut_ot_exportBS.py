@@ -35,8 +35,8 @@ class SEUT_OT_ExportBS(Operator):
 
         return result
     
-    def export_BS(self, context, partial):
-        """Exports the 'Build Stages' collections"""
+    def export_BS(self, context, partial, cache=None, materials=None):
+        """Exports the 'Build Stages' collections. If an export cache is passed, collections that have not changed are skipped"""
 
         scene = context.scene
         addon = __package__[:__package__.find(".")]
@@ -94,30 +94,36 @@ class SEUT_OT_ExportBS(Operator):
                     return {'CANCELLED'}
 
         # Export BS1, if present.
-        if colBS1Good:
+        if colBS1Good and cache is not None and cache.isUnchanged(collections['bs1']):
+            self.report({'INFO'}, "SEUT: 'BS1' has not changed since the last export. Skipping.")
+        elif colBS1Good:
             if scene.seut.export_xml:
                 self.report({'INFO'}, "SEUT: Exporting XML for 'BS1'.")
-                export_XML(self, context, collections['bs1'])
+                export_XML(self, context, collections['bs1'], materials)
             if scene.seut.export_fbx:
                 self.report({'INFO'}, "SEUT: Exporting FBX for 'BS1'.")
-                export_model_FBX(self, context, collections['bs1'])
+                export_model_FBX(self, context, collections['bs1'], materials)
         
         # Export BS2, if present.
-        if colBS2Good:
+        if colBS2Good and cache is not None and cache.isUnchanged(collections['bs2']):
+            self.report({'INFO'}, "SEUT: 'BS2' has not changed since the last export. Skipping.")
+        elif colBS2Good:
             if scene.seut.export_xml:
                 self.report({'INFO'}, "SEUT: Exporting XML for 'BS2'.")
-                export_XML(self, context, collections['bs2'])
+                export_XML(self, context, collections['bs2'], materials)
             if scene.seut.export_fbx:
                 self.report({'INFO'}, "SEUT: Exporting FBX for 'BS2'.")
-                export_model_FBX(self, context, collections['bs2'])
+                export_model_FBX(self, context, collections['bs2'], materials)
 
         # Export BS3, if present.
-        if colBS3Good:
+        if colBS3Good and cache is not None and cache.isUnchanged(collections['bs3']):
+            self.report({'INFO'}, "SEUT: 'BS3' has not changed since the last export. Skipping.")
+        elif colBS3Good:
             if scene.seut.export_xml:
                 self.report({'INFO'}, "SEUT: Exporting XML for 'BS3'.")
-                export_XML(self, context, collections['bs3'])
+                export_XML(self, context, collections['bs3'], materials)
             if scene.seut.export_fbx:
                 self.report({'INFO'}, "SEUT: Exporting FBX for 'BS3'.")
-                export_model_FBX(self, context, collections['bs3'])
+                export_model_FBX(self, context, collections['bs3'], materials)
         
         return {'FINISHED'}
\ No newline at end of file
@@ -0,0 +1,133 @@
+import bpy
+import threading
+
+from bpy.types      import Operator
+from bpy.props      import BoolProperty
+
+from .seut_ot_exportAllScenes       import SEUT_OT_ExportAllScenes
+from .seut_export_pool              import run_export_jobs
+from .seut_tool_runner              import cancel_tool_runs, reset_tool_runs, get_progress_text
+from ..seut_errors                  import errorExportGeneral
+from ..seut_subpart_graph           import get_graph, get_dependents
+
+
+class SEUT_OT_ExportBackground(Operator):
+    """Exports the current scene or all scenes and runs the external tools in the background, keeping Blender responsive"""
+    bl_idname = "scene.export_background"
+    bl_label = "Export in Background"
+    bl_options = {'REGISTER'}
+
+    allScenes: BoolProperty(
+        name="All Scenes",
+        description="Export all scenes instead of only the current one",
+        default=False
+    )
+
+    dependents: BoolProperty(
+        name="Dependent Scenes",
+        description="Also export all scenes that use the current scene as a subpart, directly or through other subparts",
+        default=False
+    )
+
+    _timer = None
+    _thread = None
+    _jobs = None
+    _cancelled = False
+
+    def invoke(self, context, event):
+
+        addon = __package__[:__package__.find(".")]
+        preferences = bpy.context.preferences.addons.get(addon).preferences
+
+        if SEUT_OT_ExportBackground._thread is not None and SEUT_OT_ExportBackground._thread.is_alive():
+            self.report({'ERROR'}, "SEUT: An export is already running in the background.")
+            return {'CANCELLED'}
+
+        # If mode is not object mode, export fails horribly.
+        currentArea = context.area.type
+        context.area.type = 'VIEW_3D'
+        currentMode = None
+        if bpy.context.object is not None and bpy.context.object.mode != 'OBJECT':
+            currentMode = bpy.context.object.mode
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        # The area and mode are restored on every way out, including the checks failing.
+        try:
+            # Checks export path and whether SubtypeId exists
+            result = errorExportGeneral(self, context)
+            if not result == {'CONTINUE'}:
+                return result
+
+            originalScene = context.window.scene
+            if self.allScenes:
+                scenes = SEUT_OT_ExportAllScenes.get_Scenes(self, bpy.data.scenes)
+            elif self.dependents:
+                dependents = get_dependents(get_graph(), originalScene.name)
+                scenes = SEUT_OT_ExportAllScenes.get_Scenes(self, [scn for scn in bpy.data.scenes if scn == originalScene or scn.name in dependents])
+            else:
+                scenes = [originalScene]
+
+            # Everything that accesses Blender data happens here, only the external tools are run in the background.
+            self._jobs = SEUT_OT_ExportAllScenes.export_Jobs(self, context, scenes)
+            context.window.scene = originalScene
+
+        finally:
+            try:
+                if bpy.context.object is not None and currentMode is not None:
+                    bpy.ops.object.mode_set(mode=currentMode)
+            except:
+                pass
+
+            context.area.type = currentArea
+
+        reset_tool_runs()
+        self._cancelled = False
+        if preferences.exportParallel:
+            maxWorkers = preferences.exportMaxWorkers
+        else:
+            maxWorkers = 1
+
+        SEUT_OT_ExportBackground._thread = threading.Thread(target=run_export_jobs, args=(self._jobs, maxWorkers, preferences.exportParallel and preferences.exportBatchMwm), daemon=True)
+        SEUT_OT_ExportBackground._thread.start()
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.25, window=context.window)
+        wm.modal_handler_add(self)
+
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+
+        if event.type == 'ESC' and event.value == 'PRESS' and not self._cancelled:
+            self._cancelled = True
+            cancel_tool_runs()
+            print("SEUT Info: Export cancelled.")
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        if SEUT_OT_ExportBackground._thread.is_alive():
+            progress = get_progress_text()
+            if self._cancelled:
+                text = "SEUT: Cancelling export..."
+            elif progress == "":
+                text = "SEUT: Exporting... Press Esc to cancel."
+            else:
+                text = "SEUT: Running " + progress + ". Press Esc to cancel."
+            context.workspace.status_text_set(text)
+            return {'PASS_THROUGH'}
+
+        context.window_manager.event_timer_remove(self._timer)
+        context.workspace.status_text_set(None)
+        SEUT_OT_ExportBackground._thread = None
+
+        sceneCounter, notExportedCounter = SEUT_OT_ExportAllScenes.finish_Jobs(self._jobs)
+        reset_tool_runs()
+
+        if self._cancelled:
+            self.report({'WARNING'}, "SEUT: Export cancelled. %i of %i scenes successfully exported." % (sceneCounter - notExportedCounter, sceneCounter))
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, "SEUT: %i of %i scenes successfully exported. Refer to Blender System Console for details." % (sceneCounter - notExportedCounter, sceneCounter))
+
+        return {'FINISHED'}
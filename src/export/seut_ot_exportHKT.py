@@ -6,7 +6,7 @@ from os.path        import join
 from bpy.types      import Operator
 
 from .havok.seut_havok_options      import HAVOK_OPTION_FILE_CONTENT
-from .havok.seut_havok_hkt          import process_hktfbx_to_fbximporterhkt, process_fbximporterhkt_to_final_hkt_for_mwm
+from .havok.seut_havok_hkt          import process_hktfbx_to_fbximporterhkt, process_fbximporterhkt_to_final_hkt_for_mwm, get_bs_hktfiles
 from .seut_export_utils             import ExportSettings, export_to_fbxfile
 from ..seut_ot_recreateCollections  import SEUT_OT_RecreateCollections
 from ..seut_errors                  import errorExportGeneral, errorCollection, isCollectionExcluded, errorToolPath
@@ -40,8 +40,9 @@ class SEUT_OT_ExportHKT(Operator):
 
         return result
     
-    def export_HKT(self, context, partial):
-        """Exports collision to HKT"""
+    def export_HKT(self, context, partial, job=None, cache=None):
+        """Exports collision to HKT. If an export job is passed, the external tools are added to it instead of being run.
+        If an export cache is passed, the export is skipped if the collision has not changed or no model needs it"""
 
         scene = context.scene
         depsgraph = None
@@ -82,6 +83,10 @@ class SEUT_OT_ExportHKT(Operator):
             # bpy.ops.object.transform_apply(location = True, scale = True, rotation = True) # This runs on all objects instead of just the active one for some reason. Breaks when there's instanced subparts.
             bpy.ops.rigidbody.object_add(type='ACTIVE')
 
+        if cache is not None and (not cache.hasPendingModels() or cache.isUnchanged(collections['hkt'])):
+            self.report({'INFO'}, "SEUT: 'Collision' has not changed since the last export or is not needed. Skipping.")
+            return {'FINISHED'}
+
         path = os.path.normpath(bpy.path.abspath(scene.seut.export_exportPath)) + "\\"
 
         # FBX export via Custom FBX Importer
@@ -91,7 +96,14 @@ class SEUT_OT_ExportHKT(Operator):
         export_to_fbxfile(settings, scene, fbxhktfile, collections['hkt'].objects, ishavokfbxfile=True)
 
         # Then create the HKT file.
-        process_hktfbx_to_fbximporterhkt(context, settings, fbxhktfile, hktfile)
-        process_fbximporterhkt_to_final_hkt_for_mwm(self, context, scene, path, settings, hktfile, hktfile)
+        if job is None:
+            process_hktfbx_to_fbximporterhkt(context, settings, fbxhktfile, hktfile)
+            process_fbximporterhkt_to_final_hkt_for_mwm(self, context, scene, path, settings, hktfile, hktfile)
+        else:
+            result = settings.resolveTools(self, 'fbximporter', 'havokfilter')
+            if not result == {'CONTINUE'}:
+                return result
+            job.addStage("FBX Importer", process_hktfbx_to_fbximporterhkt, None, settings, fbxhktfile, hktfile)
+            job.addStage("Havok Standalone Filter Manager", process_fbximporterhkt_to_final_hkt_for_mwm, job, None, None, path, settings, hktfile, hktfile, hktBSfiles=get_bs_hktfiles(scene, path))
            
         return {'FINISHED'}
\ No newline at end of file
@@ -35,8 +35,8 @@ class SEUT_OT_ExportLOD(Operator):
 
         return result
     
-    def export_LOD(self, context, partial):
-        """Exports the 'LOD' collections"""
+    def export_LOD(self, context, partial, cache=None, materials=None):
+        """Exports the 'LOD' collections. If an export cache is passed, collections that have not changed are skipped"""
 
         scene = context.scene
         addon = __package__[:__package__.find(".")]
@@ -115,39 +115,47 @@ class SEUT_OT_ExportLOD(Operator):
                     return {'CANCELLED'}
 
         # Export LOD1, if present.
-        if colLOD1Good:
+        if colLOD1Good and cache is not None and cache.isUnchanged(collections['lod1']):
+            self.report({'INFO'}, "SEUT: 'LOD1' has not changed since the last export. Skipping.")
+        elif colLOD1Good:
             if scene.seut.export_xml:
                 self.report({'INFO'}, "SEUT: Exporting XML for 'LOD1'.")
-                export_XML(self, context, collections['lod1'])
+                export_XML(self, context, collections['lod1'], materials)
             if scene.seut.export_fbx:
                 self.report({'INFO'}, "SEUT: Exporting FBX for 'LOD1'.")
-                export_model_FBX(self, context, collections['lod1'])
+                export_model_FBX(self, context, collections['lod1'], materials)
         
         # Export LOD2, if present.
-        if colLOD2Good:
+        if colLOD2Good and cache is not None and cache.isUnchanged(collections['lod2']):
+            self.report({'INFO'}, "SEUT: 'LOD2' has not changed since the last export. Skipping.")
+        elif colLOD2Good:
             if scene.seut.export_xml:
                 self.report({'INFO'}, "SEUT: Exporting XML for 'LOD2'.")
-                export_XML(self, context, collections['lod2'])
+                export_XML(self, context, collections['lod2'], materials)
             if scene.seut.export_fbx:
                 self.report({'INFO'}, "SEUT: Exporting FBX for 'LOD2'.")
-                export_model_FBX(self, context, collections['lod2'])
+                export_model_FBX(self, context, collections['lod2'], materials)
 
         # Export LOD3, if present.
-        if colLOD3Good:
+        if colLOD3Good and cache is not None and cache.isUnchanged(collections['lod3']):
+            self.report({'INFO'}, "SEUT: 'LOD3' has not changed since the last export. Skipping.")
+        elif colLOD3Good:
             if scene.seut.export_xml:
                 self.report({'INFO'}, "SEUT: Exporting XML for 'LOD3'.")
-                export_XML(self, context, collections['lod3'])
+                export_XML(self, context, collections['lod3'], materials)
             if scene.seut.export_fbx:
                 self.report({'INFO'}, "SEUT: Exporting FBX for 'LOD3'.")
-                export_model_FBX(self, context, collections['lod3'])
+                export_model_FBX(self, context, collections['lod3'], materials)
 
         # Export BS_LOD, if present.
-        if colBSLODGood:
+        if colBSLODGood and cache is not None and cache.isUnchanged(collections['bs_lod']):
+            self.report({'INFO'}, "SEUT: 'BS_LOD' has not changed since the last export. Skipping.")
+        elif colBSLODGood:
             if scene.seut.export_xml:
                 self.report({'INFO'}, "SEUT: Exporting XML for 'BS_LOD'.")
-                export_XML(self, context, collections['bs_lod'])
+                export_XML(self, context, collections['bs_lod'], materials)
             if scene.seut.export_fbx:
                 self.report({'INFO'}, "SEUT: Exporting FBX for 'BS_LOD'.")
-                export_model_FBX(self, context, collections['bs_lod'])
+                export_model_FBX(self, context, collections['bs_lod'], materials)
         
         return {'FINISHED'}
\ No newline at end of file
@@ -32,8 +32,9 @@ class SEUT_OT_ExportMWM(Operator):
 
         return result
 
-    def export_MWM(self, context):
-        """Compiles all loose files into a MWM"""
+    def export_MWM(self, context, job=None, cache=None):
+        """Compiles all loose files into a MWM. If an export job is passed, MWM Builder is added to it instead of being run.
+        If an export cache is passed, its pending collections are recorded once the MWM files have been created"""
         
         scene = context.scene
         depsgraph = None
@@ -58,9 +59,26 @@ class SEUT_OT_ExportMWM(Operator):
         mwmpath = os.path.normpath(bpy.path.abspath(scene.seut.export_exportPath)) + "\\"
         mwmfile = join(mwmpath, scene.seut.subtypeId + ".mwm")
         materialspath = bpy.path.abspath(preferences.materialsPath)
+
+        if cache is not None and not cache.hasPendingModels():
+            cache.commit()
+            self.report({'INFO'}, "SEUT: No collection has changed since the last export. MWM compilation skipped.")
+            return {'FINISHED'}
+
+        # Loose files are deleted by the export pool once all jobs sharing the export folder are done.
+        if job is not None:
+            result = settings.resolveTools(self, 'mwmbuilder')
+            if not result == {'CONTINUE'}:
+                return result
+            job.setMwmBuild(path, mwmpath, settings, mwmfile, materialspath)
+            if cache is not None:
+                job.addFinalStage("Export Manifest", cache.commit)
+            return {'FINISHED'}
         
         try:
             mwmbuilder(self, context, path, mwmpath, settings, mwmfile, materialspath)
+            if cache is not None:
+                cache.commit()
         finally:
             if scene.seut.export_deleteLooseFiles:
                 delete_loose_files(path)
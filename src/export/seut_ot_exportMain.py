@@ -6,7 +6,7 @@ from bpy.types                      import Operator
 
 from .seut_export_utils             import export_XML, export_model_FBX
 from ..seut_ot_recreateCollections  import SEUT_OT_RecreateCollections
-from ..seut_errors                  import errorExportGeneral, errorCollection, isCollectionExcluded, errorToolPath
+from ..seut_errors                  import errorExportGeneral, errorCollection, errorToolPath
 
 class SEUT_OT_ExportMain(Operator):
     """Exports the main model"""
@@ -35,8 +35,8 @@ class SEUT_OT_ExportMain(Operator):
 
         return result
     
-    def export_Main(self, context, partial):
-        """Exports the 'Main' collection"""
+    def export_Main(self, context, partial, cache=None, materials=None):
+        """Exports the 'Main' collection. If an export cache is passed, the collection is skipped if it has not changed"""
 
         scene = context.scene
         collections = SEUT_OT_RecreateCollections.getCollections(scene)
@@ -81,13 +81,17 @@ class SEUT_OT_ExportMain(Operator):
 
         for obj in collections['main'].objects:
             if obj is not None and obj.type == 'EMPTY':
-                if re.search(".00*", obj.name[-4:]) not None or re.search(".0**", obj.name[-4:]) not None or re.search(".***", obj.name[-4:]) not None:
+                if re.search(r"\.[0-9]{3}$", obj.name) is not None:
                     self.report({'WARNING'}, "SEUT: Name of empty '%s' ends on '%s'. This might cause the empty to not work properly ingame." % (obj.name, obj.name[-4:]))
 
+        if cache is not None and cache.isUnchanged(collections['main']):
+            self.report({'INFO'}, "SEUT: 'Main' has not changed since the last export. Skipping.")
+            return {'FINISHED'}
+
         # Export XML if boolean is set.
         if scene.seut.export_xml:
             self.report({'INFO'}, "SEUT: Exporting XML for 'Main'.")
-            export_XML(self, context, collections['main'])
+            export_XML(self, context, collections['main'], materials)
         else:
             print("SEUT Info: 'XML' export disabled.")
 
@@ -95,7 +99,7 @@ class SEUT_OT_ExportMain(Operator):
         if scene.seut.export_fbx:
             self.report({'INFO'}, "SEUT: Exporting FBX for 'Main'.")
 
-            export_model_FBX(self, context, collections['main'])
+            export_model_FBX(self, context, collections['main'], materials)
         else:
             print("SEUT Info: 'FBX' export disabled.")
         
@@ -1,11 +1,12 @@
 import bpy
 import os
 import xml.etree.ElementTree as ET
-import xml.dom.minidom
 
 from bpy.types  import Operator
+from bpy.props  import BoolProperty
 
-from ..seut_errors  import showError
+from .seut_xml_writer   import write_xml
+from ..seut_errors      import showError
 
 class SEUT_OT_ExportMaterials(Operator):
     """Export local materials to Materials.xml file"""
@@ -13,6 +14,12 @@ class SEUT_OT_ExportMaterials(Operator):
     bl_label = "Export Materials to Library"
     bl_options = {'REGISTER', 'UNDO'}
 
+    incremental: BoolProperty(
+        name="Only Changed Materials",
+        description="Only rewrite the file if the entries of materials have changed since the last export. The file is still written as a whole, with the same contents as a full export",
+        default=False
+    )
+
     def execute(self, context):
         
         if not bpy.data.is_saved:
@@ -20,135 +27,186 @@ class SEUT_OT_ExportMaterials(Operator):
             print("SEUT Error: BLEND file must be saved before export. (008)")
             return {'CANCELLED'}
 
-        return SEUT_OT_ExportMaterials.exportMaterials(self, context)
+        return SEUT_OT_ExportMaterials.exportMaterials(self, context, self.incremental)
 
     
-    def exportMaterials(self, context):
-        """Export local materials to Materials.xml file"""
+    def exportMaterials(self, context, incremental=False):
+        """Export local materials to Materials.xml file. In incremental mode, the entries are compared to the existing file
+        and it is only rewritten, as a whole, if an entry has changed."""
         
-        scene = context.scene
+        offset = bpy.path.basename(bpy.context.blend_data.filepath).find(".blend")
+        filename = bpy.path.basename(bpy.context.blend_data.filepath)[:offset]
+
+        # This culls the MatLb_ from the filename
+        if filename.find("MatLib_") != -1:
+            filename = filename[7:]
+
+        filepath = bpy.path.abspath('//') + filename + ".xml"
+
+        existing = None
+        if incremental:
+            existing = read_fingerprints(filepath)
 
         materials = ET.Element('MaterialsLib')
         materials.set('Name', 'Default Materials')
 
+        changed = existing is None
+        entryCount = 0
+
         for mat in bpy.data.materials:
             if mat.library is None:
-                matEntry = ET.SubElement(materials, 'Material')
-                matEntry.set('Name', mat.name)
+                fingerprint, messages = get_fingerprint(mat)
 
-                matTechnique = ET.SubElement(matEntry, 'Parameter')
-                matTechnique.set('Name', 'Technique')
-                matTechnique.text = mat.seut.technique
-
-                if mat.seut.facing != 'None':
-                    matFacing = ET.SubElement(matEntry, 'Parameter')
-                    matFacing.set('Name', 'Facing')
-                    matFacing.text = mat.seut.facing
-                    
-                if mat.seut.windScale != 0:
-                    matWindScale = ET.SubElement(matEntry, 'Parameter')
-                    matWindScale.set('Name', 'WindScale')
-                    matWindScale.text = str(mat.seut.windScale)
-                    
-                if mat.seut.windFrequency != 0:
-                    matWindFrequency = ET.SubElement(matEntry, 'Parameter')
-                    matWindFrequency.set('Name', 'WindFrequency')
-                    matWindFrequency.text = str(mat.seut.windFrequency)
-                
-                # Iterate through all image textures in material and register relevant ones to dictionary.
-                images = {
-                    'cm': None,
-                    'ng': None,
-                    'add': None,
-                    'am': None
-                    }
-
-                if mat.node_tree is not None:
-                    for node in mat.node_tree.nodes:
-                        if node.type == 'TEX_IMAGE':
-                            if node.name == 'CM':
-                                images['cm'] = node.image
-                            if node.name == 'NG':
-                                images['ng'] = node.image
-                            if node.name == 'ADD':
-                                images['add'] = node.image
-                            if node.name == 'ALPHAMASK':
-                                images['am'] = node.image
-
-                # Used to create the relative paths for the textures.
-                offset = 0
-
-                # _cm ColorMask texture
-                if images['cm'] == None:
-                    self.report({'WARNING'}, "SEUT: No 'CM' texture or node found for local material '%s'. Skipping." % (mat.name))
-                else:
-                    offset = images['cm'].filepath.find("Textures\\")
-                    if offset == -1:
-                        self.report({'ERROR'}, "SEUT: 'CM' texture filepath in local material '%s' does not contain 'Textures\\'. Cannot be transformed into relative path. (007)" % (mat.name))
-                    else:
-                        matCM = ET.SubElement(matEntry, 'Parameter')
-                        matCM.set('Name', 'ColorMetalTexture')
-                        matCM.text = os.path.splitext(images['cm'].filepath[offset:])[0] + ".dds"
-                
-                # _ng NormalGloss texture
-                if images['ng'] == None:
-                    self.report({'WARNING'}, "SEUT: No 'NG' texture or node found for local material '%s'. Skipping." % (mat.name))
-                else:
-                    offset = images['ng'].filepath.find("Textures\\")
-                    if offset == -1:
-                        self.report({'ERROR'}, "SEUT: 'NG' texture filepath in local material '%s' does not contain 'Textures\\'. Cannot be transformed into relative path. (007)" % (mat.name))
-                    else:
-                        matNG = ET.SubElement(matEntry, 'Parameter')
-                        matNG.set('Name', 'NormalGlossTexture')
-                        matNG.text = os.path.splitext(images['ng'].filepath[offset:])[0] + ".dds"
-                
-                # _add AddMaps texture
-                if images['add'] == None:
-                    self.report({'WARNING'}, "SEUT: No 'ADD' texture or node found for local material '%s'. Skipping." % (mat.name))
-                else:
-                    offset = images['add'].filepath.find("Textures\\")
-                    if offset == -1:
-                        self.report({'ERROR'}, "SEUT: 'ADD' texture filepath in local material '%s' does not contain 'Textures\\'. Cannot be transformed into relative path. (007)" % (mat.name))
-                    else:
-                        matADD = ET.SubElement(matEntry, 'Parameter')
-                        matADD.set('Name', 'AddMapsTexture')
-                        matADD.text = os.path.splitext(images['add'].filepath[offset:])[0] + ".dds"
-                
-                # _alphamask Alphamask texture
-                if images['am'] == None:
-                    self.report({'WARNING'}, "SEUT: No 'ALPHAMASK' texture or node found for local material '%s'. Skipping." % (mat.name))
+                previous = NOT_EXPORTED
+                if existing is not None:
+                    previous = existing.pop(mat.name, NOT_EXPORTED)
+
+                # Materials that are not in the existing file count as changed, even if they are not written to it.
+                # The file itself only needs to be rewritten if the material is written to it.
+                if previous != fingerprint:
+                    if fingerprint is not None or previous is not NOT_EXPORTED:
+                        changed = True
+                    for type, message in messages:
+                        self.report(type, message)
+
+                # Errors of unchanged materials are reported again, as they have not been fixed yet.
                 else:
-                    offset = images['am'].filepath.find("Textures\\")
-                    if offset == -1:
-                        self.report({'ERROR'}, "SEUT: 'ALPHAMASK' texture filepath in local material '%s' does not contain 'Textures\\'. Cannot be transformed into relative path. (007)" % (mat.name))
-                    else:
-                        matAM = ET.SubElement(matEntry, 'Parameter')
-                        matAM.set('Name', 'AlphamaskTexture')
-                        matAM.text = os.path.splitext(images['am'].filepath[offset:])[0] + ".dds"
-
-                # If no textures are added to the material, remove the entry again.
-                if images['cm'] == None and images['ng'] == None and images['add'] == None and images['am'] == None:
-                    self.report({'INFO'}, "SEUT: Local material '%s' does not contain any valid textures. Skipping." % (mat.name))
-                    materials.remove(matEntry)
-                    
-        # Create file with subtypename + collection name and write string to it
-        tempString = ET.tostring(materials, 'utf-8')
-        try:
-            tempString.decode('ascii')
-        except UnicodeDecodeError:
-            showError(context, "Report: Error", "SEUT Error: Invalid character(s) detected. This will prevent a MWM-file from being generated. Please ensure that no special (non ASCII) characters are used in SubtypeIds, Material names or object names. (033)")
-        xmlString = xml.dom.minidom.parseString(tempString)
-        xmlFormatted = xmlString.toprettyxml()
-        
-        offset = bpy.path.basename(bpy.context.blend_data.filepath).find(".blend")
-        filename = bpy.path.basename(bpy.context.blend_data.filepath)[:offset]
+                    for type, message in messages:
+                        if 'ERROR' in type:
+                            self.report(type, message)
 
-        # This culls the MatLb_ from the filename
-        if filename.find("MatLib_") != -1:
-            filename = filename[7:]
+                if fingerprint is None:
+                    continue
+
+                matEntry = ET.SubElement(materials, 'Material')
+                matEntry.set('Name', mat.name)
+                for name, value in fingerprint:
+                    parameter = ET.SubElement(matEntry, 'Parameter')
+                    parameter.set('Name', name)
+                    parameter.text = value
+                entryCount += 1
+
+        # Materials that have been removed since the last export
+        if existing is not None and len(existing) > 0:
+            changed = True
+
+        if not changed:
+            self.report({'INFO'}, "SEUT: '%s' is up to date." % (filepath))
+            return {'FINISHED'}
         
-        exportedXML = open(bpy.path.abspath('//') + filename + ".xml", "w")
-        exportedXML.write(xmlFormatted)
-        self.report({'INFO'}, "SEUT: '%s.xml' has been created." % (bpy.path.abspath('//') + filename))
+        # Create file with the name of the BLEND file and write the tree to it
+        if not write_xml(materials, filepath):
+            text = "SEUT Error: Invalid character(s) detected. This will prevent a MWM-file from being generated. Please ensure that no special (non ASCII) characters are used in SubtypeIds, Material names or object names. (033)"
+            if bpy.app.background:
+                self.report({'ERROR'}, text)
+            else:
+                showError(context, "Report: Error", text)
+
+        self.report({'INFO'}, "SEUT: '%s' has been created with %i material(s)." % (filepath, entryCount))
 
         return {'FINISHED'}
+
+
+# Stands in for the entry of a material that is not in the existing Materials.xml.
+NOT_EXPORTED = object()
+
+# Texture nodes of SEUT materials and the parameters they are written to.
+TEXTURE_PARAMETERS = [
+    ('CM', 'ColorMetalTexture'),
+    ('NG', 'NormalGlossTexture'),
+    ('ADD', 'AddMapsTexture'),
+    ('ALPHAMASK', 'AlphamaskTexture')
+    ]
+
+
+def get_fingerprint(mat):
+    """Returns the parameters a local material is written to Materials.xml with, as (Name, value) pairs, and the messages to report about it.
+    The parameters are None if the material does not contain any valid textures."""
+
+    messages = []
+    parameters = [('Technique', mat.seut.technique)]
+
+    if mat.seut.facing != 'None':
+        parameters.append(('Facing', mat.seut.facing))
+    if mat.seut.windScale != 0:
+        parameters.append(('WindScale', str(mat.seut.windScale)))
+    if mat.seut.windFrequency != 0:
+        parameters.append(('WindFrequency', str(mat.seut.windFrequency)))
+
+    # Iterate through all image textures in material and register relevant ones to dictionary.
+    images = {}
+    if mat.node_tree is not None:
+        for node in mat.node_tree.nodes:
+            if node.type == 'TEX_IMAGE' and node.image is not None:
+                images[node.name] = node.image
+
+    for nodeName, parameterName in TEXTURE_PARAMETERS:
+        if nodeName not in images:
+            messages.append(({'WARNING'}, "SEUT: No '%s' texture or node found for local material '%s'. Skipping." % (nodeName, mat.name)))
+            continue
+
+        # Used to create the relative paths for the textures.
+        offset = images[nodeName].filepath.find("Textures\\")
+        if offset == -1:
+            messages.append(({'ERROR'}, "SEUT: '%s' texture filepath in local material '%s' does not contain 'Textures\\'. Cannot be transformed into relative path. (007)" % (nodeName, mat.name)))
+        else:
+            parameters.append((parameterName, os.path.splitext(images[nodeName].filepath[offset:])[0] + ".dds"))
+
+    # If no textures are added to the material, it is not written.
+    if not any(nodeName in images for nodeName, parameterName in TEXTURE_PARAMETERS):
+        messages.append(({'INFO'}, "SEUT: Local material '%s' does not contain any valid textures. Skipping." % (mat.name)))
+        return None, messages
+
+    return parameters, messages
+
+
+def read_fingerprints(filepath):
+    """Returns the parameters of all materials in an existing Materials.xml by name, or None if there is no valid file"""
+
+    if not os.path.isfile(filepath):
+        return None
+
+    try:
+        root = ET.parse(filepath).getroot()
+    except (EnvironmentError, ET.ParseError):
+        return None
+
+    fingerprints = {}
+    for matEntry in root.findall('Material'):
+        fingerprints[matEntry.get('Name')] = [(parameter.get('Name'), parameter.text) for parameter in matEntry.findall('Parameter')]
+
+    return fingerprints
+
+
+class MaterialsReport():
+    """Stands in for Operator.report() when Materials.xml files are exported without the UI and collects the messages"""
+
+    def __init__(self, filepath):
+
+        self.filepath = filepath
+        self.messages = []
+
+    def report(self, type, message):
+
+        self.messages.append((type, message))
+        print(message)
+
+
+def export_matlibs(filepaths, incremental=False):
+    """Opens each BLEND file in turn and exports its local materials to Materials.xml. Meant to be run in a background
+    instance of Blender, as the currently open file is replaced. Returns a MaterialsReport for each file."""
+
+    reports = []
+    for filepath in filepaths:
+        report = MaterialsReport(filepath)
+        reports.append(report)
+
+        try:
+            bpy.ops.wm.open_mainfile(filepath=filepath)
+        except RuntimeError as error:
+            report.report({'ERROR'}, "SEUT: BLEND file '%s' could not be opened: %s" % (filepath, str(error)))
+            continue
+
+        SEUT_OT_ExportMaterials.exportMaterials(report, bpy.context, incremental)
+
+    return reports
@@ -0,0 +1,91 @@
+import bpy
+import os
+
+from bpy.types      import Operator
+
+from .seut_ot_exportSBC             import SEUT_OT_ExportSBC
+from .seut_xml_writer               import XmlWriter
+from ..seut_errors                  import errorExportGeneral, showError
+
+
+class SEUT_OT_ExportModSBC(Operator):
+    """Exports the CubeBlock definitions of all scenes into combined SBC files in the Data folder of their mod"""
+    bl_idname = "scene.export_mod_sbc"
+    bl_label = "Export Mod SBC"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+
+        print("SEUT Info: Running operator: ------------------------------------------------------------------ 'scene.export_mod_sbc'")
+
+        addon = __package__[:__package__.find(".")]
+        preferences = bpy.context.preferences.addons.get(addon).preferences
+
+        # Checks export path and whether SubtypeId exists
+        result = errorExportGeneral(self, context)
+        if not result == {'CONTINUE'}:
+            return result
+
+        originalScene = context.window.scene
+
+        # Scenes are grouped by the Data folder of the mod their export folder is in.
+        mods = {}
+        for scn in bpy.data.scenes:
+            context.window.scene = scn
+
+            result = SEUT_OT_ExportSBC.check_SBC(self, context)
+            if not result == {'CONTINUE'}:
+                continue
+
+            path = os.path.normpath(bpy.path.abspath(scn.seut.export_exportPath)) + "\\"
+            offset = path.find("Models\\")
+            if offset == -1:
+                self.report({'WARNING'}, "SEUT: Export folder of scene '%s' is not located in the 'Models' folder of a mod. Skipping." % (scn.name))
+                continue
+
+            mods.setdefault(path[:offset] + "Data\\", []).append(scn)
+
+        blendName = os.path.splitext(bpy.path.basename(bpy.data.filepath))[0]
+        if blendName == "":
+            blendName = "SEUT"
+
+        fileCounter = 0
+        blockCounter = 0
+        try:
+            for dataPath, scenes in mods.items():
+                if not os.path.isdir(dataPath):
+                    os.makedirs(dataPath)
+
+                shards = [scenes[i:i + preferences.sbcBlocksPerFile] for i in range(0, len(scenes), preferences.sbcBlocksPerFile)]
+                for index, shard in enumerate(shards):
+                    if len(shards) > 1:
+                        filename = "CubeBlocks_%s_%i.sbc" % (blendName, index + 1)
+                    else:
+                        filename = "CubeBlocks_%s.sbc" % (blendName)
+
+                    SEUT_OT_ExportModSBC.write_Shard(self, context, dataPath + filename, shard)
+                    self.report({'INFO'}, "SEUT: '%s' has been created with %i block(s)." % (dataPath + filename, len(shard)))
+                    fileCounter += 1
+                    blockCounter += len(shard)
+        finally:
+            context.window.scene = originalScene
+
+        self.report({'INFO'}, "SEUT: %i block definition(s) written to %i SBC file(s)." % (blockCounter, fileCounter))
+
+        print("SEUT Info: Finished operator: ----------------------------------------------------------------- 'scene.export_mod_sbc'")
+
+        return {'FINISHED'}
+
+    def write_Shard(self, context, filepath, scenes):
+        """Writes the CubeBlock definitions of the scenes into a single SBC file, one definition at a time"""
+
+        with XmlWriter(filepath) as writer:
+            writer.start('Definitions', {'xmlns:xsi': 'http://www.w3.org/2001/XMLSchema-instance', 'xmlns:xsd': 'http://www.w3.org/2001/XMLSchema'})
+            writer.start('CubeBlocks')
+
+            for scn in scenes:
+                context.window.scene = scn
+                writer.write(SEUT_OT_ExportSBC.get_Definition(self, context))
+
+        if not writer.isAscii:
+            showError(context, "Report: Error", "SEUT Error: Invalid character(s) detected. This will prevent a MWM-file from being generated. Please ensure that no special (non ASCII) characters are used in SubtypeIds, Material names or object names. (033)")
@@ -1,11 +1,11 @@
 import bpy
 import os
 import xml.etree.ElementTree as ET
-import xml.dom.minidom
 
 from bpy.types      import Operator
 from collections    import OrderedDict
 
+from .seut_xml_writer               import write_xml
 from ..seut_ot_mirroring            import SEUT_OT_Mirroring
 from ..seut_ot_mountpoints          import SEUT_OT_Mountpoints
 from ..seut_ot_recreateCollections  import SEUT_OT_RecreateCollections
@@ -41,10 +41,36 @@ class SEUT_OT_ExportSBC(Operator):
     def export_SBC(self, context):
         """Exports the SBC file for a defined collection"""
 
+        scene = context.scene
+
+        result = SEUT_OT_ExportSBC.check_SBC(self, context)
+        if not result == {'CONTINUE'}:
+            return result
+
+        # Create XML tree and add initial parameters.
+        definitions = ET.Element('Definitions')
+        definitions.set('xmlns:xsi', 'http://www.w3.org/2001/XMLSchema-instance')
+        definitions.set('xmlns:xsd', 'http://www.w3.org/2001/XMLSchema')
+
+        cubeBlocks = ET.SubElement(definitions, 'CubeBlocks')
+        cubeBlocks.append(SEUT_OT_ExportSBC.get_Definition(self, context))
+
+        # Write to file, place in export folder
+        path = os.path.normpath(bpy.path.abspath(scene.seut.export_exportPath)) + "\\"
+        filename = scene.seut.subtypeId
+
+        if not write_xml(definitions, path + filename + ".sbc"):
+            showError(context, "Report: Error", "SEUT Error: Invalid character(s) detected. This will prevent a MWM-file from being generated. Please ensure that no special (non ASCII) characters are used in SubtypeIds, Material names or object names. (033)")
+
+        self.report({'INFO'}, "SEUT: '%s.sbc' has been created." % (path + filename))
+
+        return {'FINISHED'}
+
+    def check_SBC(self, context):
+        """Checks whether an SBC definition should and can be created for the current scene"""
+
         scene = context.scene
         collections = SEUT_OT_RecreateCollections.getCollections(scene)
-        addon = __package__[:__package__.find(".")]
-        preferences = bpy.context.preferences.addons.get(addon).preferences
 
         if not scene.seut.export_sbc:
             print("SEUT Info: 'SBC' is toggled off. SBC export skipped.")
@@ -69,13 +95,15 @@ class SEUT_OT_ExportSBC(Operator):
                 self.report({'ERROR'}, "SEUT: Invalid Build Stage setup. Cannot have BS3 but no BS2. (015)")
                 return {'CANCELLED'}
 
-        # Create XML tree and add initial parameters.
-        definitions = ET.Element('Definitions')
-        definitions.set('xmlns:xsi', 'http://www.w3.org/2001/XMLSchema-instance')
-        definitions.set('xmlns:xsd', 'http://www.w3.org/2001/XMLSchema')
+        return {'CONTINUE'}
 
-        cubeBlocks = ET.SubElement(definitions, 'CubeBlocks')
-        def_definition = ET.SubElement(cubeBlocks, 'Definition')
+    def get_Definition(self, context):
+        """Creates the CubeBlock definition of the current scene"""
+
+        scene = context.scene
+        collections = SEUT_OT_RecreateCollections.getCollections(scene)
+
+        def_definition = ET.Element('Definition')
         
         def_Id = ET.SubElement(def_definition, 'Id')
         def_TypeId = ET.SubElement(def_Id, 'TypeId')
@@ -226,12 +254,12 @@ class SEUT_OT_ExportSBC(Operator):
                         if endY > scene.seut.bBox_Y:
                             endY = scene.seut.bBox_Y
 
-                    # Need to do this to prevent ET from auto-rearranging keys.
-                    def_Mountpoint.set('a_Side', sideName)
-                    def_Mountpoint.set('b_StartX', str(round(startX, 2)))
-                    def_Mountpoint.set('c_StartY', str(round(startY, 2)))
-                    def_Mountpoint.set('d_EndX', str(round(endX, 2)))
-                    def_Mountpoint.set('e_EndY', str(round(endY, 2)))
+                    # The XML writer keeps the attributes in this order.
+                    def_Mountpoint.set('Side', sideName)
+                    def_Mountpoint.set('StartX', str(round(startX, 2)))
+                    def_Mountpoint.set('StartY', str(round(startY, 2)))
+                    def_Mountpoint.set('EndX', str(round(endX, 2)))
+                    def_Mountpoint.set('EndY', str(round(endY, 2)))
 
         
         # Creating Build Stage references.
@@ -293,28 +321,4 @@ class SEUT_OT_ExportSBC(Operator):
                     def_MirroringBlock = ET.SubElement(def_definition, 'MirroringBlock')
                     def_MirroringBlock.text = scn.seut.subtypeId
 
-
-        # Write to file, place in export folder
-        tempString = ET.tostring(definitions, 'utf-8')
-        try:
-            tempString.decode('ascii')
-        except UnicodeDecodeError:
-            showError(context, "Report: Error", "SEUT Error: Invalid character(s) detected. This will prevent a MWM-file from being generated. Please ensure that no special (non ASCII) characters are used in SubtypeIds, Material names or object names. (033)")
-        xmlString = xml.dom.minidom.parseString(tempString)
-        xmlFormatted = xmlString.toprettyxml()
-
-        # Fixing the entries
-        xmlFormatted = xmlFormatted.replace("a_Side", "Side")
-        xmlFormatted = xmlFormatted.replace("b_StartX", "StartX")
-        xmlFormatted = xmlFormatted.replace("c_StartY", "StartY")
-        xmlFormatted = xmlFormatted.replace("d_EndX", "EndX")
-        xmlFormatted = xmlFormatted.replace("e_EndY", "EndY")
-
-        filename = scene.seut.subtypeId
-
-        exportedXML = open(path + filename + ".sbc", "w")
-        exportedXML.write(xmlFormatted)
-
-        self.report({'INFO'}, "SEUT: '%s.sbc' has been created." % (path + filename))
-
-        return {'FINISHED'}
\ No newline at end of file
+        return def_definition
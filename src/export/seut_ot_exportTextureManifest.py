@@ -0,0 +1,55 @@
+import bpy
+import os
+
+from bpy.types  import Operator
+
+from .seut_export_materials             import ExportMaterials
+from ..materials.seut_texture_index     import get_texture_manifest
+
+
+class SEUT_OT_ExportTextureManifest(Operator):
+    """Writes a list of the DDS files the local materials refer to into the mod folder of every scene, to check which textures need to ship with the mod"""
+    bl_idname = "scene.export_texture_manifest"
+    bl_label = "Export Texture Manifest"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+
+        if not bpy.data.is_saved:
+            self.report({'ERROR'}, "SEUT: BLEND file must be saved before export. (008)")
+            print("SEUT Error: BLEND file must be saved before export. (008)")
+            return {'CANCELLED'}
+
+        textures, invalid = get_texture_manifest(ExportMaterials())
+
+        for name in invalid:
+            self.report({'ERROR'}, "SEUT: Texture filepath in local material '%s' does not contain 'Textures\\'. Cannot be transformed into relative path. (007)" % (name))
+
+        # All scenes are exported with the same materials, so every mod they are exported to gets the same manifest.
+        mods = set()
+        for scn in bpy.data.scenes:
+            path = os.path.normpath(bpy.path.abspath(scn.seut.export_exportPath)) + "\\"
+            offset = path.find("Models\\")
+            if scn.seut.export_exportPath != "" and offset != -1:
+                mods.add(path[:offset])
+
+        if len(mods) == 0:
+            self.report({'ERROR'}, "SEUT: No scene has an export folder located in the 'Models' folder of a mod. (014)")
+            print("SEUT Error: No scene has an export folder located in the 'Models' folder of a mod. (014)")
+            return {'CANCELLED'}
+
+        blendName = os.path.splitext(bpy.path.basename(bpy.data.filepath))[0]
+
+        for modPath in sorted(mods):
+            missing = [texture for texture in textures if not os.path.isfile(modPath + texture)]
+            for texture in missing:
+                self.report({'WARNING'}, "SEUT: Texture '%s' does not exist in mod folder '%s'." % (texture, modPath))
+
+            filepath = modPath + "Textures_" + blendName + ".txt"
+            with open(filepath, 'w') as manifest:
+                for texture in textures:
+                    manifest.write(texture + "\n")
+
+            self.report({'INFO'}, "SEUT: '%s' has been created with %i texture(s), %i of which are missing." % (filepath, len(textures), len(missing)))
+
+        return {'FINISHED'}
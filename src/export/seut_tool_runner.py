@@ -0,0 +1,166 @@
+import os
+import time
+import threading
+import subprocess
+
+_runsLock = threading.Lock()
+_activeRuns = []
+_cancelEvent = threading.Event()
+
+
+class ToolCancelledError(Exception):
+    """Raised when a tool run has been cancelled"""
+    pass
+
+
+class ToolRun():
+    """Runs an external tool as a subprocess and streams its output line by line into a log file"""
+
+    def __init__(self, cmdline, name, cwd=None, logfile=None, timeout=None, loglines=[], keepOutput=False):
+        self.cmdline = cmdline
+        self.name = name
+        self.cwd = cwd
+        self.logfile = logfile
+        self.timeout = timeout
+        self.loglines = loglines
+
+        # The output is only held in memory if something needs to inspect it afterwards.
+        self.output = [] if keepOutput else None
+        self.lineCount = 0
+        self.lastLine = ""
+        self.startTime = None
+        self.cancelled = False
+
+        self._process = None
+
+    @property
+    def elapsed(self):
+        if self.startTime is None:
+            return 0.0
+        return time.perf_counter() - self.startTime
+
+    def run(self, successfulExitCodes=[0]):
+        """Runs the tool and waits for it to finish. Returns its output if keepOutput is set.
+        Raises CalledProcessError on an unsuccessful exit code, TimeoutExpired on timeout and ToolCancelledError on cancellation"""
+
+        if _cancelEvent.is_set():
+            raise ToolCancelledError("%s was cancelled before it started." % (self.name))
+
+        log = None
+        if self.logfile is not None:
+            log = open(self.logfile, 'wb')
+            if self.cwd:
+                log.write(("Running from: %s \n" % (self.cwd)).encode('utf-8'))
+            log.write(("Command: %s \n" % (" ".join(self.cmdline))).encode('utf-8'))
+            for line in self.loglines:
+                log.write(line.encode('utf-8'))
+                log.write(b"\n")
+            log.flush()
+
+        try:
+            self.startTime = time.perf_counter()
+            self._process = subprocess.Popen(self.cmdline, cwd=self.cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+
+            with _runsLock:
+                _activeRuns.append(self)
+
+            # Catches a cancellation that happened while the process was being started.
+            if _cancelEvent.is_set():
+                self.cancel()
+
+            reader = threading.Thread(target=self.readOutput, args=(log,), daemon=True)
+            reader.start()
+
+            try:
+                returncode = self._process.wait(timeout=self.timeout)
+            except subprocess.TimeoutExpired:
+                self.kill()
+                reader.join()
+                raise subprocess.TimeoutExpired(self.cmdline, self.timeout, output=self.getOutput())
+
+            reader.join()
+
+        finally:
+            with _runsLock:
+                if self in _activeRuns:
+                    _activeRuns.remove(self)
+            if log is not None:
+                log.close()
+
+        if self.cancelled:
+            raise ToolCancelledError("%s was cancelled." % (self.name))
+
+        if returncode not in successfulExitCodes:
+            raise subprocess.CalledProcessError(returncode, self.cmdline, output=self.getOutput())
+
+        return self.getOutput()
+
+    def readOutput(self, log):
+        for line in iter(self._process.stdout.readline, b''):
+            if log is not None:
+                log.write(line)
+                log.flush()
+            if self.output is not None:
+                self.output.append(line)
+            self.lineCount += 1
+            self.lastLine = line.decode('utf-8', errors='replace').strip()
+
+        self._process.stdout.close()
+
+    def getOutput(self):
+        if self.output is None:
+            return None
+        return b"".join(self.output)
+
+    def kill(self):
+        try:
+            self._process.terminate()
+            self._process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        except EnvironmentError:
+            pass
+
+    def cancel(self):
+        self.cancelled = True
+        if self._process is not None and self._process.poll() is None:
+            self.kill()
+
+
+def get_active_runs():
+    """Returns the tool runs that are currently in progress"""
+
+    with _runsLock:
+        return list(_activeRuns)
+
+
+def cancel_tool_runs():
+    """Cancels all running tools. Tools that have not been started yet are cancelled as soon as they would be started"""
+
+    _cancelEvent.set()
+    for run in get_active_runs():
+        run.cancel()
+
+
+def reset_tool_runs():
+    """Allows tools to be started again after cancel_tool_runs()"""
+
+    _cancelEvent.clear()
+
+
+def get_progress_text():
+    """Returns a short summary of the running tools, for display in the UI"""
+
+    runs = get_active_runs()
+    if len(runs) == 0:
+        return ""
+
+    parts = []
+    for run in runs:
+        label = run.name
+        if run.logfile is not None:
+            label += " (" + os.path.basename(run.logfile).split('.')[0] + ")"
+        parts.append("%s: %is, %i lines" % (label, run.elapsed, run.lineCount))
+
+    return ", ".join(parts)
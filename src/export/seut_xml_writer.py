@@ -0,0 +1,103 @@
+import os
+
+
+class XmlWriter():
+    """Writes indented XML to a file as it is produced. Attributes are written in the order they have been set.
+    The target file is only replaced once the writer is closed without an error"""
+
+    def __init__(self, filepath, indent='\t'):
+        self.filepath = filepath
+        self.indent = indent
+        self.isAscii = True
+
+        self._tempPath = filepath + ".tmp"
+        self._file = open(self._tempPath, 'w', encoding='utf-8', newline='\n')
+        self._open = []
+
+        self._file.write('<?xml version="1.0" ?>\n')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        if excType is None:
+            self.close()
+        else:
+            self.discard()
+        return False
+
+    def start(self, tag, attrib={}):
+        """Opens an element. Everything written until the matching end() is placed inside it"""
+
+        self._file.write(self.indent * len(self._open) + '<' + self.escape(tag) + self.formatAttributes(attrib) + '>\n')
+        self._open.append(tag)
+
+    def end(self):
+        """Closes the element opened last"""
+
+        tag = self._open.pop()
+        self._file.write(self.indent * len(self._open) + '</' + self.escape(tag) + '>\n')
+
+    def write(self, element):
+        """Writes an ElementTree element and all of its children"""
+
+        depth = len(self._open)
+        self.writeElement(element, depth)
+
+    def writeElement(self, element, depth):
+        prefix = self.indent * depth
+        opening = '<' + self.escape(element.tag) + self.formatAttributes(element.attrib)
+
+        if len(element) == 0:
+            if element.text:
+                self._file.write(prefix + opening + '>' + self.escape(element.text) + '</' + self.escape(element.tag) + '>\n')
+            else:
+                self._file.write(prefix + opening + '/>\n')
+            return
+
+        self._file.write(prefix + opening + '>\n')
+        if element.text and element.text.strip():
+            self._file.write(self.indent * (depth + 1) + self.escape(element.text) + '\n')
+        for child in element:
+            self.writeElement(child, depth + 1)
+        self._file.write(prefix + '</' + self.escape(element.tag) + '>\n')
+
+    def formatAttributes(self, attrib):
+        result = ""
+        for key, value in attrib.items():
+            result += ' ' + self.escape(key) + '="' + self.escape(str(value), True) + '"'
+        return result
+
+    def escape(self, text, isAttribute=False):
+        if self.isAscii:
+            try:
+                text.encode('ascii')
+            except UnicodeEncodeError:
+                self.isAscii = False
+
+        text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+        if isAttribute:
+            text = text.replace('"', '&quot;')
+        return text
+
+    def close(self):
+        while len(self._open) > 0:
+            self.end()
+        self._file.close()
+        os.replace(self._tempPath, self.filepath)
+
+    def discard(self):
+        self._file.close()
+        try:
+            os.remove(self._tempPath)
+        except EnvironmentError:
+            pass
+
+
+def write_xml(element, filepath):
+    """Writes an ElementTree element to a file. Returns False if it contains non-ASCII characters"""
+
+    with XmlWriter(filepath) as writer:
+        writer.write(element)
+
+    return writer.isAscii
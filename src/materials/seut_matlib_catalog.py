@@ -0,0 +1,198 @@
+import bpy
+import os
+import json
+
+# Increase this whenever the structure of the catalog entries changes, to invalidate existing catalogs.
+CATALOG_VERSION = 1
+CATALOG_NAME = "seut_matlib_catalog.json"
+
+# Entries of all MatLibs that have been scanned, keyed by their normalized file path.
+_catalog = None
+
+
+def get_catalog_path():
+    return os.path.join(bpy.utils.user_resource('CONFIG', path="seut", autocreate=True), CATALOG_NAME)
+
+
+def read_catalog():
+    """Reads the MatLib catalog from the Blender config folder. Returns an empty catalog if there is none or it is invalid"""
+
+    try:
+        with open(get_catalog_path(), 'r') as catalog:
+            data = json.load(catalog)
+    except (EnvironmentError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get('version') != CATALOG_VERSION:
+        return {}
+
+    return data.get('libraries', {})
+
+
+def write_catalog(libraries):
+    """Writes the MatLib catalog to the Blender config folder"""
+
+    path = get_catalog_path()
+    tempPath = path + ".tmp"
+    try:
+        with open(tempPath, 'w') as catalog:
+            json.dump({'version': CATALOG_VERSION, 'libraries': libraries}, catalog, indent=1, sort_keys=True)
+        os.replace(tempPath, path)
+    except EnvironmentError:
+        print("SEUT Warning: MatLib catalog could not be written to '" + path + "'.")
+
+
+def get_catalog():
+    global _catalog
+
+    if _catalog is None:
+        _catalog = read_catalog()
+
+    return _catalog
+
+
+def get_key(filepath):
+    return os.path.normcase(os.path.normpath(filepath))
+
+
+def get_stat(filepath):
+    try:
+        stat = os.stat(filepath)
+    except EnvironmentError:
+        return None
+
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def create_entry(filepath, data_from):
+    """Creates a catalog entry from the data of a library that is being loaded"""
+
+    return {
+        'stat': get_stat(filepath),
+        'materials': list(data_from.materials),
+        'images': list(data_from.images),
+        'node_groups': list(data_from.node_groups)
+        }
+
+
+def set_entry(filepath, data_from):
+    """Records the contents of a MatLib while it is being loaded anyway, so it does not have to be opened again to scan it"""
+
+    catalog = get_catalog()
+    catalog[get_key(filepath)] = create_entry(filepath, data_from)
+    write_catalog(catalog)
+
+
+def get_entry(filepath):
+    """Returns the materials, images and node groups of a MatLib. The library is only opened if it has changed since it was last scanned"""
+
+    catalog = get_catalog()
+    key = get_key(filepath)
+    stat = get_stat(filepath)
+    entry = catalog.get(key)
+
+    if stat is None:
+        return None
+
+    if entry is None or entry['stat'] != stat:
+        with bpy.data.libraries.load(filepath, link=True) as (data_from, data_to):
+            entry = create_entry(filepath, data_from)
+        catalog[key] = entry
+        write_catalog(catalog)
+
+    return entry
+
+
+def list_matlibs(materialsPath):
+    """Returns the file names of all MatLibs in the Materials folder and drops MatLibs that no longer exist in it from the catalog"""
+
+    fileNames = set()
+    for entry in os.scandir(materialsPath):
+        if entry.is_file() and entry.name.endswith(".blend") and entry.name.find("MatLib_") != -1:
+            fileNames.add(entry.name)
+
+    catalog = get_catalog()
+    folderKey = get_key(materialsPath)
+    existing = set(get_key(os.path.join(materialsPath, name)) for name in fileNames)
+    removed = [key for key in catalog.keys() if os.path.dirname(key) == folderKey and key not in existing]
+    if len(removed) > 0:
+        for key in removed:
+            del catalog[key]
+        write_catalog(catalog)
+
+    return fileNames
+
+
+def get_persisted_matlibs():
+    """Returns the names of the MatLibs that were enabled in this file when it was last saved"""
+
+    names = set()
+    for scn in bpy.data.scenes:
+        names.update(name for name in scn.seut.enabledMatLibs.split(";") if name != "")
+
+    return names
+
+
+def persist_matlib(name, enabled):
+    """Records whether a MatLib is enabled in every scene of the file, as the MatLib list itself is not kept with the file"""
+
+    names = get_persisted_matlibs()
+    if enabled:
+        names.add(name)
+    else:
+        names.discard(name)
+
+    value = ";".join(sorted(names))
+    for scn in bpy.data.scenes:
+        if scn.seut.enabledMatLibs != value:
+            scn.seut.enabledMatLibs = value
+
+
+def get_enabled_matlibs(context):
+    """Returns the file paths of all MatLibs that are enabled in the MatLib list"""
+
+    addon = __package__[:__package__.find(".")]
+    preferences = bpy.context.preferences.addons.get(addon).preferences
+    materialsPath = os.path.normpath(bpy.path.abspath(preferences.materialsPath))
+
+    if preferences.materialsPath == "" or preferences.materialsPath == "." or not os.path.isdir(materialsPath):
+        return []
+
+    return [materialsPath + "\\" + lib.name for lib in context.window_manager.seut.matlibs if lib.enabled]
+
+
+def get_material_sources(context):
+    """Returns the file path of the enabled MatLib each library material can be linked from, by material name"""
+
+    sources = {}
+    for filepath in get_enabled_matlibs(context):
+        entry = get_entry(filepath)
+        if entry is None:
+            continue
+
+        for name in entry['materials']:
+            if name not in sources:
+                sources[name] = filepath
+
+    return sources
+
+
+def link_materials(context, names):
+    """Links the materials of the given names from the enabled MatLibs, unless they are linked already. One library load per MatLib is used.
+    Returns the number of newly linked materials"""
+
+    sources = get_material_sources(context)
+    linked = set(mat.name for mat in bpy.data.materials if mat.library is not None)
+
+    namesByLibrary = {}
+    for name in set(names):
+        if name in sources and name not in linked:
+            namesByLibrary.setdefault(sources[name], []).append(name)
+
+    count = 0
+    for filepath, libraryNames in namesByLibrary.items():
+        with bpy.data.libraries.load(filepath, link=True) as (data_from, data_to):
+            data_to.materials = [name for name in libraryNames if name in data_from.materials]
+        count += len([mat for mat in data_to.materials if mat is not None])
+
+    return count
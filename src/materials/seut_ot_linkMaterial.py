@@ -0,0 +1,61 @@
+import bpy
+
+from bpy.types  import Operator
+from bpy.props  import EnumProperty
+
+from .seut_matlib_catalog   import get_material_sources, link_materials
+
+# Blender does not keep the strings of dynamic enum items alive, so they need to be referenced here.
+_materialItems = []
+
+
+def get_materialItems(self, context):
+    global _materialItems
+
+    _materialItems = [(name, name, "") for name in sorted(get_material_sources(context).keys())]
+
+    return _materialItems
+
+
+class SEUT_OT_LinkMaterial(Operator):
+    """Link a material from the enabled MatLibs and assign it to the active material slot"""
+    bl_idname = "object.link_material"
+    bl_label = "Link Library Material"
+    bl_options = {'REGISTER', 'UNDO'}
+    bl_property = "material"
+
+    material: EnumProperty(
+        name="Material",
+        items=get_materialItems
+    )
+
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None and context.active_object.type == 'MESH'
+
+
+    def invoke(self, context, event):
+
+        context.window_manager.invoke_search_popup(self)
+
+        return {'RUNNING_MODAL'}
+
+
+    def execute(self, context):
+
+        link_materials(context, [self.material])
+
+        material = None
+        for mat in bpy.data.materials:
+            if mat.name == self.material and mat.library is not None:
+                material = mat
+                break
+
+        if material is None:
+            self.report({'ERROR'}, "SEUT: Material '%s' could not be linked from the enabled MatLibs." % (self.material))
+            return {'CANCELLED'}
+
+        context.active_object.active_material = material
+
+        return {'FINISHED'}
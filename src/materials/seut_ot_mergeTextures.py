@@ -0,0 +1,24 @@
+from bpy.types  import Operator
+
+from .seut_texture_index    import TextureIndex
+
+
+class SEUT_OT_MergeTextures(Operator):
+    """Merges images that load the same texture file through different paths, so each file is only loaded once"""
+    bl_idname = "scene.merge_textures"
+    bl_label = "Merge Duplicate Textures"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+
+        index = TextureIndex()
+        duplicates = index.getDuplicates()
+
+        for key, images in duplicates.items():
+            print("SEUT Info: '%s' is loaded by images: %s" % (key, ", ".join(image.name for image in images)))
+
+        removed = index.mergeDuplicates()
+
+        self.report({'INFO'}, "SEUT: %i duplicate image(s) of %i texture file(s) merged." % (removed, len(duplicates)))
+
+        return {'FINISHED'}
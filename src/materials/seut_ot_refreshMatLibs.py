@@ -3,6 +3,8 @@ import os
 
 from bpy.types  import Operator
 
+from .seut_matlib_catalog   import list_matlibs, get_persisted_matlibs
+
 class SEUT_OT_RefreshMatLibs(Operator):
     """Refresh available MatLibs"""
     bl_idname = "scene.refresh_matlibs"
@@ -30,12 +32,7 @@ class SEUT_OT_RefreshMatLibs(Operator):
             return {'CANCELLED'}
 
         # Find all MatLibs in directory, save to set, then add to matlibs list
-        path = bpy.path.abspath(preferences.materialsPath)
-        newSet = set()
-
-        for file in os.listdir(path):
-            if file is not None and file.endswith(".blend") and file.find("MatLib_") != -1:
-                newSet.add(file)
+        newSet = list_matlibs(materialsPath)
 
         # Add everything in the directory that is not already in the set to the set
         for libNew in newSet:
@@ -45,13 +42,19 @@ class SEUT_OT_RefreshMatLibs(Operator):
                 item = wm.seut.matlibs.add()
                 item.name = libNew
 
+        # Libraries that materials are currently linked from.
+        linkedLibraries = set(mat.library.name for mat in bpy.data.materials if mat.library is not None)
+
+        # MatLibs linked on demand may not have any materials linked yet, so the ones enabled in the file are kept enabled.
+        if preferences.matlibLinkOnDemand:
+            linkedLibraries.update(get_persisted_matlibs())
+
         # If the set has entries that don't exist in the directory, remove them
         for libOld in wm.seut.matlibs:
             if libOld.name in newSet:
-                for mat in bpy.data.materials:
-                    if mat.library is not None and mat.library.name == libOld.name:
-                        wm.seut.matlibs[wm.seut.matlibs.find(libOld.name)].enabled = True
-                        break
+                # Setting enabled links the library again, which is not needed if it already is.
+                if libOld.name in linkedLibraries and not libOld.enabled:
+                    libOld.enabled = True
                 continue
             else:
                 for idx in range(0, len(wm.seut.matlibs)):
@@ -1,7 +1,15 @@
 import bpy
+import re
+import time
 
+from array                          import array
 from bpy.types                      import Operator
 
+from .seut_matlib_catalog           import link_materials
+
+# Matches the numbering Blender appends to duplicate datablock names, e.g. '.001'
+DUPLICATE_SUFFIX = re.compile(r"\.\d{3}$")
+
 class SEUT_OT_RemapMaterials(Operator):
     """Remap materials of objects in all scenes to linked library materials"""
     bl_idname = "object.remapmaterials"
@@ -23,53 +31,127 @@ class SEUT_OT_RemapMaterials(Operator):
 
         return {'FINISHED'}
     
-    # This code was written by Kamikaze
+    # Originally written by Kamikaze
     def remapMaterials(self, context):
         """Remap materials of objects in all scenes to linked library materials"""
-        
-        mtl_to_delete = []
 
-        currentScene = bpy.context.window.scene
+        start = time.perf_counter()
+
+        localMaterials = [mat for mat in bpy.data.materials if mat.library is None and mat.users > 0 and not mat.seut.overrideMatLib]
+
+        # Library materials the local materials could be remapped to are linked first, in case MatLibs are linked on demand.
+        names = set()
+        for mat in localMaterials:
+            names.add(mat.name)
+            names.add(get_base_name(mat.name))
+        link_materials(context, names)
+
+        linkedMaterials = get_linked_materials()
+
+        replacements = {}
+        for mat in localMaterials:
+            # If an object is imported that has a material that already exists in the scene, it is numbered.
+            # Thus the name without the numbering is checked as well.
+            new_material = linkedMaterials.get(mat.name)
+            if new_material is None:
+                new_material = linkedMaterials.get(get_base_name(mat.name))
+
+            if new_material is not None:
+                replacements[mat] = new_material
+
+        users = get_material_users(replacements.keys())
 
-        for scene in bpy.data.scenes:
-            bpy.context.window.scene = scene
+        # Popping materials off a mesh does not keep object-linked slots in order, so these meshes are left alone.
+        cleanedMeshes = set()
+        for obj in users:
+            if obj.type == 'MESH' and any(slot.link != 'DATA' for slot in obj.material_slots):
+                cleanedMeshes.add(obj.data)
 
-            for obj in bpy.context.view_layer.objects:
+        # Only objects in a scene are remapped, as before.
+        objects = [obj for obj in users if len(obj.users_scene) > 0]
 
-                if obj.type == 'EMPTY':
+        mtl_to_delete = set()
+        remapCounter = 0
+
+        for obj in objects:
+
+            # Meshes can be shared between objects, their unused slots only need to be removed once.
+            if obj.type == 'MESH' and obj.data not in cleanedMeshes:
+                cleanedMeshes.add(obj.data)
+                remove_unused_slots(obj.data)
+
+            for slot in obj.material_slots:
+                old_material = slot.material
+                if old_material is None or old_material not in replacements:
                     continue
 
-                # Select this object and remove any unused materials
-                bpy.context.view_layer.objects.active = obj
-                try:
-                    bpy.ops.object.material_slot_remove_unused()
-                except RuntimeError:
-                    self.report({'WARNING'}, "SEUT: Could not remove unused material slots for object '%s'." % (obj.name))
-
-                for slot in obj.material_slots:
-                    if slot.material != None and slot.material.library == None:
-                        # This material is not linked from a library
-                        old_material = slot.material
-
-                        new_material = None
-                        # Try to find a linked material with the same name
-                        for mtl in bpy.data.materials:
-                            # If an object is imported that has a material that already exists in the scene, it is numbered.
-                            # Thus checking the substring of the name is necessary to catch all of them.
-                            if mtl.library != None and ( mtl.name == old_material.name or mtl.name == old_material.name[:-4] ) and old_material.seut.overrideMatLib == False:
-                                new_material = mtl
-                                break                            
-
-                        if new_material != None:
-                            # Use the linked material
-                            slot.material = new_material
-                            # Delete the old material
-                            if old_material not in mtl_to_delete:
-                                mtl_to_delete.append(old_material)
+                slot.material = replacements[old_material]
+                mtl_to_delete.add(old_material)
+                remapCounter += 1
 
         for mtl in mtl_to_delete:
             bpy.data.materials.remove(
                 mtl, do_unlink=True, do_id_user=True, do_ui_user=False)
 
-        bpy.context.window.scene = currentScene
-        return
\ No newline at end of file
+        print("SEUT Info: Remapped %i material slot(s) on %i object(s) in %.3fs." % (remapCounter, len(objects), time.perf_counter() - start))
+
+        return
+
+
+def get_base_name(name):
+    """Returns the name of a datablock without the numbering Blender adds to duplicate names ('.001')"""
+
+    match = DUPLICATE_SUFFIX.search(name)
+    if match is None:
+        return name
+
+    return name[:match.start()]
+
+
+def get_linked_materials():
+    """Returns all materials linked from libraries by name. If several libraries contain a material of the same name, the first one is used."""
+
+    linkedMaterials = {}
+    for mtl in bpy.data.materials:
+        if mtl.library is not None and mtl.name not in linkedMaterials:
+            linkedMaterials[mtl.name] = mtl
+
+    return linkedMaterials
+
+
+def get_material_users(materials):
+    """Returns the objects that use any of the materials, either through their own material slots or through their data"""
+
+    objects = set()
+    if len(materials) == 0:
+        return objects
+
+    data = set()
+    for users in bpy.data.user_map(subset=set(materials), value_types={'OBJECT', 'MESH', 'CURVE', 'META'}).values():
+        for user in users:
+            if isinstance(user, bpy.types.Object):
+                objects.add(user)
+            else:
+                data.add(user)
+
+    if len(data) > 0:
+        for users in bpy.data.user_map(subset=data, value_types={'OBJECT'}).values():
+            objects.update(users)
+
+    return objects
+
+
+def remove_unused_slots(mesh):
+    """Removes the materials of a mesh that are not assigned to any of its faces, without calling operators"""
+
+    if len(mesh.materials) == 0:
+        return
+
+    indices = array('i', [0]) * len(mesh.polygons)
+    mesh.polygons.foreach_get('material_index', indices)
+    used = set(indices)
+
+    # Going backwards keeps the lower indices valid while removing. Blender shifts the face indices of the remaining slots.
+    for index in reversed(range(len(mesh.materials))):
+        if index not in used:
+            mesh.materials.pop(index=index)
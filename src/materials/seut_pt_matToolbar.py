@@ -2,6 +2,9 @@ import bpy
 
 from bpy.types      import Panel
 
+from .seut_texture_info    import get_image_info
+from .seut_texture_index   import TEXTURE_NODES
+
 
 class SEUT_PT_Panel_Materials(Panel):
     """Creates the materials panel for SEUT"""
@@ -36,10 +39,24 @@ class SEUT_PT_Panel_Materials(Panel):
             box.prop(material.seut, 'windScale', icon='SORTSIZE')
             box.prop(material.seut, 'windFrequency', icon='GROUP')
 
+            # Texture information is read from the file headers, so the images do not need to be loaded.
+            if material.node_tree is not None:
+                textures = [node for node in material.node_tree.nodes if node.type == 'TEX_IMAGE' and node.name in TEXTURE_NODES and node.image is not None]
+                if len(textures) > 0:
+                    box = layout.box()
+                    box.label(text="Textures", icon='TEXTURE')
+                    for node in textures:
+                        info = get_image_info(node.image)
+                        if info is None:
+                            box.label(text="%s: %s" % (node.name, node.image.name))
+                        else:
+                            box.label(text="%s: %ix%i, %i mip(s), %s" % (node.name, info.width, info.height, info.mipCount, info.format))
+
         box = layout.box()
         box.label(text="Create new SEUT Material", icon='MATERIAL')
         box.prop(wm.seut, 'matPreset', icon='PRESET')
         box.operator('object.mat_create', icon='ADD')
+        box.operator('object.link_material', icon='LINKED')
 
 class SEUT_PT_Panel_MatLib(Panel):
     """Creates the MatLib linking panel for SEUT"""
@@ -60,4 +77,6 @@ class SEUT_PT_Panel_MatLib(Panel):
         layout.operator('scene.refresh_matlibs', icon='FILE_REFRESH')
         
         layout.separator()
-        layout.operator('scene.export_materials', icon='EXPORT')
\ No newline at end of file
+        layout.operator('scene.export_materials', icon='EXPORT')
+        layout.operator('scene.export_texture_manifest', icon='FILE_TEXT')
+        layout.operator('scene.merge_textures', icon='AUTOMERGE_ON')
\ No newline at end of file
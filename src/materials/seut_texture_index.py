@@ -0,0 +1,96 @@
+import bpy
+import os
+
+from .seut_matlib_catalog   import get_key
+
+# Names of the image texture nodes of SEUT materials whose textures are written to the XML.
+TEXTURE_NODES = ('CM', 'NG', 'ADD', 'ALPHAMASK')
+
+
+def get_image_key(image):
+    """Returns the normalized absolute path of the file an image refers to, or None for packed or generated images"""
+
+    if image is None or image.source != 'FILE' or image.packed_file is not None or image.filepath == "":
+        return None
+
+    return get_key(bpy.path.abspath(image.filepath, library=image.library))
+
+
+def get_relative_path(image):
+    """Returns the path of the DDS file of an image relative to the mod folder, or None if it is not located in a 'Textures' folder"""
+
+    offset = image.filepath.find("Textures\\")
+    if offset == -1:
+        return None
+
+    return os.path.splitext(image.filepath[offset:])[0] + ".dds"
+
+
+def get_merge_plan(images):
+    """Returns the image the users of a group of images loading the same file are remapped to, and the images to remove.
+    Linked images cannot be removed, so one of them is kept if there are any and the others are left alone. Otherwise the one with the most users is kept."""
+
+    keep = sorted(images, key=lambda image: (image.library is None, -image.users))[0]
+    remove = [image for image in images if image != keep and image.library is None]
+
+    return keep, remove
+
+
+class TextureIndex():
+    """Indexes all image datablocks by the file they refer to, so images loading the same file through different paths can be found"""
+
+    def __init__(self):
+
+        self.imagesByPath = {}
+        for image in bpy.data.images:
+            key = get_image_key(image)
+            if key is not None:
+                self.imagesByPath.setdefault(key, []).append(image)
+
+    def getDuplicates(self):
+        """Returns the groups of images that refer to the same file, keyed by the normalized path"""
+
+        return dict((key, images) for key, images in self.imagesByPath.items() if len(images) > 1)
+
+    def mergeDuplicates(self):
+        """Remaps all users of duplicate images to a single image per file and removes the duplicates. Returns the number of removed images"""
+
+        removed = 0
+        for key, images in self.getDuplicates().items():
+            keep, remove = get_merge_plan(images)
+
+            # The remaining images are collected first, as removed images can no longer be accessed.
+            self.imagesByPath[key] = [image for image in images if image == keep or image.library is not None]
+
+            for image in remove:
+                image.user_remap(keep)
+                bpy.data.images.remove(image, do_unlink=True)
+                removed += 1
+
+        return removed
+
+
+def get_texture_manifest(materials):
+    """Returns the relative paths of all DDS files the local materials written to the model XMLs refer to.
+    Materials whose textures are not located in a 'Textures' folder are returned separately."""
+
+    textures = set()
+    invalid = set()
+
+    for mat in bpy.data.materials:
+        if mat.library is not None or mat.node_tree is None:
+            continue
+        if mat.users == 0 or mat.users == 1 and mat.use_fake_user:
+            continue
+        if mat.name[:5] == 'SMAT_' or not materials.isUnique(mat):
+            continue
+
+        for node in mat.node_tree.nodes:
+            if node.type == 'TEX_IMAGE' and node.name in TEXTURE_NODES and node.image is not None:
+                path = get_relative_path(node.image)
+                if path is None:
+                    invalid.add(mat.name)
+                else:
+                    textures.add(path)
+
+    return sorted(textures), sorted(invalid)
@@ -0,0 +1,151 @@
+import bpy
+import os
+import struct
+
+from .seut_matlib_catalog   import get_key, get_stat
+
+# Headers of all textures that have been inspected, keyed by their normalized file path.
+_textureInfos = {}
+
+DDS_MAGIC = b'DDS '
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+DDS_FLAG_MIPMAPCOUNT = 0x20000
+DDS_PF_FOURCC = 0x4
+DDS_PF_ALPHAPIXELS = 0x1
+
+PNG_COLOR_TYPES = {
+    0: 'Grayscale',
+    2: 'RGB',
+    3: 'Indexed',
+    4: 'Grayscale Alpha',
+    6: 'RGBA'
+    }
+
+TGA_IMAGE_TYPES = {
+    1: 'Indexed',
+    2: 'RGB',
+    3: 'Grayscale',
+    9: 'Indexed RLE',
+    10: 'RGB RLE',
+    11: 'Grayscale RLE'
+    }
+
+
+class TextureInfo():
+    """Dimensions, mip count and format of a texture file, as read from its header"""
+
+    def __init__(self, width, height, mipCount, format):
+
+        self.width = width
+        self.height = height
+        self.mipCount = mipCount
+        self.format = format
+
+
+def read_dds_header(file):
+
+    header = file.read(148)
+    if len(header) < 128 or header[:4] != DDS_MAGIC:
+        return None
+
+    flags, height, width = struct.unpack_from('<3I', header, 8)
+    mipCount = struct.unpack_from('<I', header, 28)[0]
+    pfFlags, fourCC, bitCount = struct.unpack_from('<I4sI', header, 80)
+
+    if not flags & DDS_FLAG_MIPMAPCOUNT or mipCount == 0:
+        mipCount = 1
+
+    if pfFlags & DDS_PF_FOURCC:
+        format = fourCC.decode('ascii', 'replace').strip('\x00 ')
+        # DX10 textures store their actual format in an extended header.
+        if format == 'DX10' and len(header) >= 132:
+            format = "DXGI %i" % (struct.unpack_from('<I', header, 128)[0])
+    elif pfFlags & DDS_PF_ALPHAPIXELS:
+        format = "RGBA %ibit" % (bitCount)
+    else:
+        format = "RGB %ibit" % (bitCount)
+
+    return TextureInfo(width, height, mipCount, format)
+
+
+def read_png_header(file):
+
+    header = file.read(26)
+    if len(header) < 26 or header[:8] != PNG_SIGNATURE or header[12:16] != b'IHDR':
+        return None
+
+    width, height, bitDepth, colorType = struct.unpack_from('>2I2B', header, 16)
+
+    return TextureInfo(width, height, 1, "%s %ibit" % (PNG_COLOR_TYPES.get(colorType, 'Unknown'), bitDepth))
+
+
+def read_tga_header(file):
+
+    header = file.read(18)
+    if len(header) < 18:
+        return None
+
+    imageType = header[2]
+    width, height, pixelDepth = struct.unpack_from('<2HB', header, 12)
+    if imageType not in TGA_IMAGE_TYPES:
+        return None
+
+    return TextureInfo(width, height, 1, "%s %ibit" % (TGA_IMAGE_TYPES[imageType], pixelDepth))
+
+
+def read_texture_info(filepath):
+    """Reads the header of a DDS, PNG or TGA file without loading its pixel data. Returns None for other or invalid files"""
+
+    extension = os.path.splitext(filepath)[1].lower()
+    if extension == '.dds':
+        reader = read_dds_header
+    elif extension == '.png':
+        reader = read_png_header
+    elif extension == '.tga':
+        reader = read_tga_header
+    else:
+        return None
+
+    try:
+        with open(filepath, 'rb') as file:
+            return reader(file)
+    except (EnvironmentError, struct.error):
+        return None
+
+
+def get_texture_info(filepath):
+    """Returns the TextureInfo of a texture file. Headers are only read again if the file has changed since it was last inspected"""
+
+    stat = get_stat(filepath)
+    if stat is None:
+        return None
+
+    key = get_key(filepath)
+    cached = _textureInfos.get(key)
+    if cached is not None and cached[0] == stat:
+        return cached[1]
+
+    info = read_texture_info(filepath)
+    _textureInfos[key] = (stat, info)
+
+    return info
+
+
+def get_image_info(image):
+    """Returns the TextureInfo of the file an image datablock refers to. Returns None for packed or generated images"""
+
+    if image is None or image.source != 'FILE' or image.packed_file is not None:
+        return None
+
+    return get_texture_info(bpy.path.abspath(image.filepath, library=image.library))
+
+
+def get_image_size(image):
+    """Returns the resolution of an image, read from the file header where possible so Blender does not have to load the image"""
+
+    info = get_image_info(image)
+    if info is None:
+        return (image.size[0], image.size[1])
+
+    return (info.width, info.height)
@@ -13,10 +13,12 @@ from bpy.props  import (EnumProperty,
 from .seut_ot_recreateCollections   import SEUT_OT_RecreateCollections
 from .seut_errors                   import showError
 from .seut_utils                    import linkSubpartScene, unlinkSubpartScene, getParentCollection
+from .seut_subpart_graph            import invalidate_graph
 
 
 def update_linkedScene(self, context):
     scene = context.scene
+    invalidate_graph()
     empty = context.view_layer.objects.active
     collections = SEUT_OT_RecreateCollections.getCollections(scene)
 
@@ -1,22 +1,25 @@
 import bpy
 import math
+import numpy
 
 from bpy.types                      import Operator
 from .seut_ot_recreateCollections   import SEUT_OT_RecreateCollections
 
+# Tolerance in meters so vertices lying exactly on a cell border do not add another cell because of float precision.
+SNAP_TOLERANCE = 0.001
+
 class SEUT_OT_BBoxAuto(Operator):
-    """Sets the bounding box automatically (not very accurate)"""
+    """Sets the bounding box automatically from the vertices of all objects in the 'Main' collection"""
     bl_idname = "object.bbox_auto"
     bl_label = "Automatic"
     bl_options = {'REGISTER', 'UNDO'}
 
-    
     # Button is unavailable when bounding box is turned off.
     @classmethod
     def poll(cls, context):
         return context.window_manager.seut.bBoxToggle == 'on'
 
-    
+
     # This is what is executed if "Automatic" is pressed.
     def execute(self, context):
 
@@ -26,43 +29,80 @@ class SEUT_OT_BBoxAuto(Operator):
 
         if wm.seut.bBoxToggle == 'off':
             self.report({'INFO'}, "SEUT: Triggered auto BBox even though BBox is turned off. This should never happen.")
-            
+
             return {'CANCELLED'}
 
         if collections['main'] == None or len(collections['main'].objects) == 0:
             self.report({'ERROR'}, "SEUT: Collection 'Main' not found or empty. Not possible to set automatic bounding box. (010)")
-            
+
+            return {'CANCELLED'}
+
+        # Subpart instances are not part of the model of the block.
+        objects = [obj for obj in collections['main'].all_objects if obj.name.find("(L)") == -1]
+        vertices = get_world_vertices(context.evaluated_depsgraph_get(), objects)
+
+        if len(vertices) == 0:
+            self.report({'ERROR'}, "SEUT: Collection 'Main' does not contain any geometry. Not possible to set automatic bounding box. (010)")
+
             return {'CANCELLED'}
 
-        xD = 0
-        yD = 0
-        zD = 0
-
-        # this currently does not take the object's children's dimensions into account 
-        for obj in collections['main'].all_objects:
-            if obj.location.x + obj.dimensions.x > xD:
-                xD = obj.location.x + obj.dimensions.x
-            if obj.location.y + obj.dimensions.y > yD:
-                yD = obj.location.y + obj.dimensions.y
-            if obj.location.z + obj.dimensions.z > zD:
-                zD = obj.location.z + obj.dimensions.z
-        
+        xD, yD, zD = get_axis_extents(vertices)
+
         factor = 1
 
         if scene.seut.gridScale == 'large': factor = 2.5
         if scene.seut.gridScale == 'small': factor = 0.5
 
         # This should technically be math.ceil(D / factor) * factor but when drawing the bounding box it's already being multiplied by the factor.
-        xSize = math.ceil(xD / factor)
-        ySize = math.ceil(yD / factor)
-        zSize = math.ceil(zD / factor)
-        
-        scene.seut.bBox_X = xSize
-        scene.seut.bBox_Y = ySize
-        scene.seut.bBox_Z = zSize
+        scene.seut.bBox_X = get_cells(xD, factor)
+        scene.seut.bBox_Y = get_cells(yD, factor)
+        scene.seut.bBox_Z = get_cells(zD, factor)
 
         bpy.ops.object.bbox('INVOKE_DEFAULT')
 
         self.report({'INFO'}, "SEUT: Bounding Box set for dimensions X: %f Y: %f Z: %f in 'Main' collection." % (xD, yD, zD))
-        
-        return {'FINISHED'}
\ No newline at end of file
+
+        return {'FINISHED'}
+
+
+def get_world_vertices(depsgraph, objects):
+    """Returns the world space coordinates of the evaluated vertices of all objects, as one array per object"""
+
+    vertices = []
+    for obj in objects:
+        if obj.type not in {'MESH', 'CURVE', 'SURFACE', 'FONT', 'META'}:
+            continue
+
+        evaluated = obj.evaluated_get(depsgraph)
+        mesh = evaluated.to_mesh()
+        try:
+            if mesh is None or len(mesh.vertices) == 0:
+                continue
+
+            coords = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float32)
+            mesh.vertices.foreach_get('co', coords)
+            coords = coords.reshape(-1, 3)
+
+            matrix = numpy.array(evaluated.matrix_world, dtype=numpy.float32)
+            vertices.append(coords @ matrix[:3, :3].T + matrix[:3, 3])
+        finally:
+            evaluated.to_mesh_clear()
+
+    return vertices
+
+
+def get_axis_extents(vertices):
+    """Returns the size of the smallest box centered on the origin and aligned to the world axes that contains all vertices"""
+
+    extents = numpy.zeros(3)
+    for coords in vertices:
+        extents = numpy.maximum(extents, numpy.abs(coords).max(axis=0))
+
+    # The bounding box is drawn centered on the origin of the block.
+    return tuple(float(e) * 2 for e in extents)
+
+
+def get_cells(dimension, factor):
+    """Returns the number of grid cells needed to fit the dimension"""
+
+    return max(1, math.ceil((dimension - SNAP_TOLERANCE) / factor))
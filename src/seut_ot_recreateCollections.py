@@ -1,6 +1,29 @@
 import bpy
 
-from bpy.types import Operator
+from bpy.types          import Operator
+from bpy.app.handlers   import persistent
+
+
+COLLECTION_PREFIXES = {
+    'seut': 'SEUT',
+    'main': 'Main',
+    'hkt': 'Collision',
+    'lod1': 'LOD1',
+    'lod2': 'LOD2',
+    'lod3': 'LOD3',
+    'bs1': 'BS1',
+    'bs2': 'BS2',
+    'bs3': 'BS3',
+    'bs_lod': 'BS_LOD',
+    }
+
+EMPTY_COLLECTIONS = {key: None for key in COLLECTION_PREFIXES.keys()}
+
+# SEUT collections of all SubtypeIds, built in a single pass over bpy.data.collections.
+# Additions and removals are detected through the collection count, renames and undo through the handlers below.
+_collectionIndex = None
+_collectionCount = -1
+_msgbusOwner = object()
 
 class SEUT_OT_RecreateCollections(Operator):
     """Recreates the collections"""
@@ -17,54 +40,28 @@ class SEUT_OT_RecreateCollections(Operator):
 
 
     def getCollections(scene):
-        """Scans existing collections to find the SEUT ones"""
+        """Looks up the SEUT collections of a scene in the collection index"""
 
-        tag = ' (' + scene.seut.subtypeId + ')'
-
-        collections = {
-            'seut': None,
-            'main': None,
-            'hkt': None,
-            'lod1': None,
-            'lod2': None,
-            'lod3': None,
-            'bs1': None,
-            'bs2': None,
-            'bs3': None,
-            'bs_lod': None,
-            }
-
-        if len(bpy.data.collections) > 0:
-            for col in bpy.data.collections:
-                if col.name == 'SEUT' + tag:
-                    collections['seut'] = col
+        index = getCollectionIndex()
+        cached = index.get(scene.seut.subtypeId)
 
-                if col.name == 'Main' + tag:
-                    collections['main'] = col
+        collections = dict(EMPTY_COLLECTIONS)
+        if cached is None:
+            return collections
 
-                if col.name == 'Collision' + tag:
-                    collections['hkt'] = col
-
-                elif col.name == 'LOD1' + tag:
-                    collections['lod1'] = col
-
-                elif col.name == 'LOD2' + tag:
-                    collections['lod2'] = col
-
-                elif col.name == 'LOD3' + tag:
-                    collections['lod3'] = col
+        # A renamed collection the handlers did not catch is dropped from the index by the full rebuild.
+        tag = ' (' + scene.seut.subtypeId + ')'
+        for key, col in cached.items():
+            try:
+                valid = col.name == COLLECTION_PREFIXES[key] + tag
+            except ReferenceError:
+                valid = False
 
-                elif col.name == 'BS1' + tag:
-                    collections['bs1'] = col
+            if not valid:
+                invalidate_Collections()
+                return SEUT_OT_RecreateCollections.getCollections(scene)
 
-                elif col.name == 'BS2' + tag:
-                    collections['bs2'] = col
-                    
-                elif col.name == 'BS3' + tag:
-                    collections['bs3'] = col
-                    
-                elif col.name == 'BS_LOD' + tag:
-                    collections['bs_lod'] = col
+            collections[key] = col
         
         return collections
 
@@ -116,6 +113,8 @@ class SEUT_OT_RecreateCollections(Operator):
                 elif col.name == 'BS_LOD' + tag or col.name == 'BS_LOD' + tagOld:
                     col.name = 'BS_LOD' + tag
 
+        invalidate_Collections()
+
         return
 
 
@@ -171,4 +170,70 @@ class SEUT_OT_RecreateCollections(Operator):
             collections['bs_lod'] = bpy.data.collections.new('BS_LOD' + tag)
             collections['seut'].children.link(collections['bs_lod'])
 
-        return collections
\ No newline at end of file
+        return collections
+
+def getCollectionIndex():
+    """Returns the SEUT collections of every SubtypeId, rebuilding the index if collections have been added or removed"""
+
+    global _collectionIndex
+    global _collectionCount
+
+    if _collectionIndex is not None and _collectionCount == len(bpy.data.collections):
+        return _collectionIndex
+
+    index = {}
+    for col in bpy.data.collections:
+        name = col.name
+        if not name.endswith(')'):
+            continue
+
+        for key, prefix in COLLECTION_PREFIXES.items():
+            if name.startswith(prefix + ' ('):
+                index.setdefault(name[len(prefix) + 2:-1], {})[key] = col
+                break
+
+    _collectionIndex = index
+    _collectionCount = len(bpy.data.collections)
+
+    return _collectionIndex
+
+
+def invalidate_Collections():
+    """Makes the next collection lookup rebuild the collection index"""
+
+    global _collectionIndex
+    _collectionIndex = None
+
+
+@persistent
+def collection_index_handler(dummy, depsgraph=None):
+    """Invalidates the collection index on file load, undo and redo and whenever a collection has been updated, which includes renames"""
+
+    if depsgraph is None:
+        invalidate_Collections()
+        return
+
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Collection):
+            invalidate_Collections()
+            return
+
+
+def collection_rename_notify(*args):
+    invalidate_Collections()
+
+
+def subscribe_Collections():
+    """Subscribes to collection renames. Subscriptions are cleared on file load, so this needs to be called again afterwards"""
+
+    bpy.msgbus.clear_by_owner(_msgbusOwner)
+    bpy.msgbus.subscribe_rna(
+        key=(bpy.types.Collection, "name"),
+        owner=_msgbusOwner,
+        args=(),
+        notify=collection_rename_notify
+    )
+
+
+def unsubscribe_Collections():
+    bpy.msgbus.clear_by_owner(_msgbusOwner)
@@ -4,6 +4,7 @@ from bpy.types import Operator
 
 from .seut_ot_mirroring     import SEUT_OT_Mirroring
 from .seut_utils            import linkSubpartScene
+from .seut_ot_recreateCollections   import invalidate_Collections
 
 class SEUT_OT_StructureConversion(Operator):
     """Ports blend files created with the old plugin to the new structure"""
@@ -78,6 +79,8 @@ class SEUT_OT_StructureConversion(Operator):
                     bpy.data.collections['SEUT' + tag].children.link(collection)
                 
                 collection.hide_viewport = False
+
+            invalidate_Collections()
                 
             # Convert custom properties of empties from harag's to the default blender method.
             for obj in scn.objects:
@@ -2,7 +2,7 @@ import bpy
 import os
 
 from bpy.types  import Operator, AddonPreferences
-from bpy.props  import BoolProperty, StringProperty, EnumProperty
+from bpy.props  import BoolProperty, StringProperty, EnumProperty, IntProperty
 
 from .seut_errors   import showError
 
@@ -110,6 +110,11 @@ class SEUT_AddonPreferences(AddonPreferences):
         subtype='FILE_PATH',
         update=update_materialsPath
     )
+    matlibLinkOnDemand: BoolProperty(
+        name="Link MatLib Materials on Demand",
+        description="Enabling a MatLib only makes its materials available. They are linked once they are assigned, remapped to or needed for export, instead of linking all of them at once",
+        default=False
+    )
     fbxImporterPath: StringProperty(
         name="Custom FBX Importer",
         description="Despite its name, this tool is mainly used to export models to the FBX format",
@@ -128,6 +133,47 @@ class SEUT_AddonPreferences(AddonPreferences):
         subtype='FILE_PATH',
         update=update_mwmbPath
     )
+    fbxImporterTimeout: IntProperty(
+        name="FBX Importer Timeout",
+        description="Seconds after which a run of the Custom FBX Importer is stopped. 0 disables the timeout",
+        default=300,
+        min=0
+    )
+    havokTimeout: IntProperty(
+        name="Havok Timeout",
+        description="Seconds after which a run of the Havok Standalone Filter Tool is stopped. 0 disables the timeout",
+        default=600,
+        min=0
+    )
+    mwmbTimeout: IntProperty(
+        name="MWM Builder Timeout",
+        description="Seconds after which a run of MWM Builder is stopped. 0 disables the timeout",
+        default=1800,
+        min=0
+    )
+    exportParallel: BoolProperty(
+        name="Parallel Export",
+        description="When exporting all scenes, first export the files of every scene in Blender and then run the external tools for multiple scenes at the same time",
+        default=False
+    )
+    exportMaxWorkers: IntProperty(
+        name="Concurrent Scenes",
+        description="How many scenes may run the external tools at the same time during a parallel export",
+        default=4,
+        min=1,
+        max=32
+    )
+    sbcBlocksPerFile: IntProperty(
+        name="Blocks per SBC File",
+        description="How many block definitions are written into each SBC file when exporting the combined SBC of a mod",
+        default=50,
+        min=1
+    )
+    exportBatchMwm: BoolProperty(
+        name="Single MWM Builder Run",
+        description="During a parallel export, compile the loose files of all scenes with a single run of MWM Builder instead of one run per scene",
+        default=False
+    )
 
     # addon updater preferences from `__init__`, be sure to copy all of them
     auto_check_update: bpy.props.BoolProperty(
@@ -171,11 +217,24 @@ class SEUT_AddonPreferences(AddonPreferences):
             layout.prop(self, "set_stollie_tools_paths")
 
         layout.prop(self, "materialsPath", expand=True)
+        layout.prop(self, "matlibLinkOnDemand")
         box = layout.box()
         box.label(text="External Tools")
         box.prop(self, "mwmbPath", expand=True)
         box.prop(self, "fbxImporterPath", expand=True)
         box.prop(self, "havokPath", expand=True)
+        row = box.row()
+        row.prop(self, "mwmbTimeout")
+        row.prop(self, "fbxImporterTimeout")
+        row.prop(self, "havokTimeout")
+
+        box = layout.box()
+        box.label(text="Export All Scenes")
+        box.prop(self, "exportParallel")
+        if self.exportParallel:
+            box.prop(self, "exportMaxWorkers")
+            box.prop(self, "exportBatchMwm")
+        box.prop(self, "sbcBlocksPerFile")
 
 
         addon_updater_ops.update_settings_ui(self,context)
@@ -220,12 +220,23 @@ class SEUT_PT_Panel_Export(Panel):
         row = layout.row()
         row.scale_y = 1.1
         row.operator('scene.export', icon='EXPORT')
+        row = layout.row(align=True)
+        op = row.operator('scene.export_background', text="Background", icon='SORTTIME')
+        op.allScenes = False
+        op.dependents = False
+        row.operator('scene.export_background', text="All in Background", icon='SORTTIME').allScenes = True
+        op = layout.operator('scene.export_background', text="With Dependent Scenes in Background", icon='SORTTIME')
+        op.allScenes = False
+        op.dependents = True
+        row = layout.row()
+        row.operator('scene.export_mod_sbc', icon='FILE_TEXT')
 
         # Options
         box = layout.box()
         box.label(text="Options", icon='SETTINGS')
     
         box.prop(scene.seut, "export_deleteLooseFiles")
+        box.prop(scene.seut, "export_skipUnchanged")
         if scene.seut.sceneType != 'character' and scene.seut.sceneType != 'character_anmiation':
             box.prop(scene.seut, "export_rescaleFactor")
         
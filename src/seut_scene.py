@@ -199,6 +199,10 @@ class SEUT_Scene(PropertyGroup):
     subtypeBefore: StringProperty(
         name="Previous SubtypeId"
     )
+    enabledMatLibs: StringProperty(
+        name="Enabled MatLibs",
+        description="MatLibs that are enabled in this file, separated by ';'. Kept with the scenes so MatLibs linked on demand stay enabled after reloading the file"
+    )
 
     # Grid Scale
     gridScale: EnumProperty(
@@ -360,6 +364,11 @@ class SEUT_Scene(PropertyGroup):
         description="Whether the intermediary files should be deleted after the MWM has been created",
         default=True
     )
+    export_skipUnchanged: BoolProperty(
+        name="Skip Unchanged",
+        description="Whether collections that have not changed since the last export should be skipped. Requires the MWM files of the last export to still be in the export folder",
+        default=False
+    )
     export_fbx: BoolProperty(
         name="FBX",
         description="Whether to export to FBX",
@@ -0,0 +1,146 @@
+import bpy
+
+# Names of the scenes each scene uses as subparts. Rebuilt lazily after subparts or collections have changed.
+_graph = None
+
+
+def is_subpart_empty(obj):
+    """Returns True if the object is an empty that places a subpart, as opposed to e.g. a mirroring empty"""
+
+    return obj.type == 'EMPTY' and 'file' in obj
+
+
+def build_graph():
+    """Returns the names of the scenes each scene links to as subparts, through 'linkedScene' or the 'file' property of its empties"""
+
+    scenesBySubtypeId = {}
+    for scn in bpy.data.scenes:
+        if scn.seut.subtypeId != "":
+            scenesBySubtypeId[scn.seut.subtypeId] = scn.name
+
+    graph = {}
+    for scn in bpy.data.scenes:
+        subparts = set()
+        for obj in scn.objects:
+            # Instances are copies of the subpart scene's own empties and would only repeat its dependencies.
+            # Mirroring empties link to their own or the mirroring scene without being subparts, they have no 'file' property.
+            if not is_subpart_empty(obj) or obj.name.find("(L)") != -1:
+                continue
+
+            if obj.seut.linkedScene is not None and obj.seut.linkedScene.name in bpy.data.scenes:
+                subparts.add(obj.seut.linkedScene.name)
+            elif 'file' in obj and obj['file'] in scenesBySubtypeId:
+                subparts.add(scenesBySubtypeId[obj['file']])
+
+        graph[scn.name] = subparts
+
+    return graph
+
+
+def get_graph():
+    global _graph
+
+    if _graph is None:
+        _graph = build_graph()
+
+    return _graph
+
+
+def invalidate_graph():
+    global _graph
+    _graph = None
+
+
+def get_subgraph(graph, start):
+    """Returns the part of the graph that can be reached from start by following subpart links"""
+
+    subgraph = {}
+    stack = [start]
+    while len(stack) > 0:
+        name = stack.pop()
+        if name in subgraph:
+            continue
+        subgraph[name] = set(graph.get(name, ()))
+        stack.extend(subgraph[name])
+
+    return subgraph
+
+
+def find_cycles(graph):
+    """Returns every subpart instancing loop as a list of scene names, regardless of how many scenes it goes through"""
+
+    cycles = []
+    state = {}
+
+    for root in sorted(graph.keys()):
+        if root in state:
+            continue
+
+        # Iterative depth-first search, as recursion could exceed the limit on deep hierarchies.
+        path = [root]
+        state[root] = 'VISITING'
+        iterators = [iter(sorted(graph.get(root, ())))]
+
+        while len(iterators) > 0:
+            child = next(iterators[-1], None)
+            if child is None:
+                state[path.pop()] = 'DONE'
+                iterators.pop()
+            elif state.get(child) == 'VISITING':
+                cycles.append(path[path.index(child):] + [child])
+            elif child not in state:
+                state[child] = 'VISITING'
+                path.append(child)
+                iterators.append(iter(sorted(graph.get(child, ()))))
+
+    return cycles
+
+
+def get_export_levels(graph, sceneNames):
+    """Orders the scenes so that subparts come before the scenes using them. Scenes within a level do not depend on each other
+    and can be exported concurrently. Scenes that are part of an instancing loop are put into a last level of their own."""
+
+    remaining = set(sceneNames)
+    levels = []
+
+    while len(remaining) > 0:
+        level = [name for name in remaining if not any(subpart in remaining for subpart in graph.get(name, ()))]
+        if len(level) == 0:
+            levels.append(sorted(remaining, key=sceneNames.index))
+            break
+
+        levels.append(sorted(level, key=sceneNames.index))
+        remaining.difference_update(level)
+
+    return levels
+
+
+def get_export_order(sceneNames):
+    """Returns the scene names in an order in which every subpart is exported before the scenes using it"""
+
+    order = []
+    for level in get_export_levels(get_graph(), list(sceneNames)):
+        order.extend(level)
+
+    return order
+
+
+def get_dependents(graph, sceneName):
+    """Returns the names of all scenes that use the scene as a subpart, directly or through other subparts"""
+
+    users = {}
+    for name, subparts in graph.items():
+        for subpart in subparts:
+            users.setdefault(subpart, set()).add(name)
+
+    dependents = set()
+    stack = [sceneName]
+    while len(stack) > 0:
+        for user in users.get(stack.pop(), ()):
+            if user not in dependents:
+                dependents.add(user)
+                stack.append(user)
+
+    dependents.discard(sceneName)
+
+    return dependents
@@ -0,0 +1,159 @@
+import bpy
+import time
+
+from bpy.app.handlers   import persistent
+
+from .seut_ot_recreateCollections   import SEUT_OT_RecreateCollections
+from .seut_utils                    import linkSubpartScene, unlinkSubpartScene
+from .seut_subpart_graph            import invalidate_graph
+from .export.seut_export_utils      import STDOUT_OPERATOR
+
+# Seconds without further edits before the instances are refreshed, so they are not rebuilt on every step of a transform.
+REFRESH_DELAY = 0.5
+
+# Which subpart instances exist and what they depend on. Rebuilt lazily after collections have changed.
+_index = None
+
+_pendingObjects = set()
+_pendingScenes = set()
+_lastUpdate = 0.0
+
+
+def get_signature(scene):
+    """Returns the names of the objects of a subpart scene that instances are created for"""
+
+    collections = SEUT_OT_RecreateCollections.getCollections(scene)
+    if collections['main'] is None:
+        return frozenset()
+
+    return frozenset(obj.name for obj in collections['main'].objects
+                     if (obj.parent is None or obj.parent.type != 'EMPTY' or not 'file' in obj.parent) and obj.name.find("(L)") == -1)
+
+
+def build_index():
+    """Indexes the subpart instances of all scenes that show them, by the name of the object they were created from,
+    and the subpart empties by the scene they link to"""
+
+    instances = {}
+    dependents = {}
+    origins = {}
+
+    for scn in bpy.data.scenes:
+        if not scn.seut.linkSubpartInstances:
+            continue
+
+        for empty in scn.objects:
+            if empty.type != 'EMPTY' or empty.seut.linkedScene is None or empty.seut.linkedScene.name not in bpy.data.scenes:
+                continue
+
+            dependents.setdefault(empty.seut.linkedScene.name, []).append(empty.name)
+            origins[empty.name] = scn.name
+
+            for child in empty.children:
+                offset = child.name.rfind(" (L)")
+                if offset != -1:
+                    instances.setdefault(child.name[:offset], []).append(child.name)
+
+    signatures = {}
+    for sceneName in dependents.keys():
+        signatures[sceneName] = get_signature(bpy.data.scenes[sceneName])
+
+    return {
+        'instances': instances,
+        'dependents': dependents,
+        'origins': origins,
+        'signatures': signatures
+        }
+
+
+def get_index():
+    global _index
+
+    if _index is None:
+        _index = build_index()
+
+    return _index
+
+
+def invalidate_index():
+    global _index
+    _index = None
+
+
+@persistent
+def subpart_refresh_handler(scene, depsgraph=None):
+    """Queues the subpart instances of objects that have been changed in a subpart scene for a refresh"""
+    global _lastUpdate
+
+    if depsgraph is None:
+        invalidate_index()
+        invalidate_graph()
+        _pendingObjects.clear()
+        _pendingScenes.clear()
+        return
+
+    index = get_index()
+    collectionChanged = any(isinstance(update.id, bpy.types.Collection) for update in depsgraph.updates)
+
+    queued = False
+    if scene.name in index['dependents']:
+        # Instances share their mesh with the object they were created from, so only transforms need to be copied over.
+        for update in depsgraph.updates:
+            if isinstance(update.id, bpy.types.Object) and update.is_updated_transform and update.id.name in index['instances']:
+                _pendingObjects.add(update.id.name)
+                queued = True
+
+        # Objects have been added to or removed from the subpart scene, so its instances need to be linked again.
+        if collectionChanged and get_signature(scene) != index['signatures'].get(scene.name):
+            _pendingScenes.add(scene.name)
+            queued = True
+
+    if collectionChanged:
+        invalidate_index()
+        invalidate_graph()
+
+    if queued:
+        _lastUpdate = time.perf_counter()
+        if not bpy.app.timers.is_registered(refresh_instances):
+            bpy.app.timers.register(refresh_instances, first_interval=REFRESH_DELAY)
+
+
+def refresh_instances():
+    """Links the queued subpart scenes again and updates the transforms of the queued instances once no further edits have come in for REFRESH_DELAY"""
+
+    remaining = REFRESH_DELAY - (time.perf_counter() - _lastUpdate)
+    if remaining > 0:
+        return remaining
+
+    index = get_index()
+
+    for sceneName in _pendingScenes:
+        for emptyName in index['dependents'].get(sceneName, []):
+            empty = bpy.data.objects.get(emptyName)
+            originScene = bpy.data.scenes.get(index['origins'][emptyName])
+            if empty is None or originScene is None:
+                continue
+
+            collection = empty.children[0].users_collection[0] if len(empty.children) > 0 and len(empty.children[0].users_collection) > 0 else None
+            unlinkSubpartScene(empty)
+            linkSubpartScene(STDOUT_OPERATOR, originScene, empty, collection)
+
+    for sourceName in _pendingObjects:
+        source = bpy.data.objects.get(sourceName)
+        if source is None:
+            continue
+
+        # The instances are updated in place, so their selection and other state is kept.
+        for instanceName in index['instances'].get(sourceName, []):
+            instance = bpy.data.objects.get(instanceName)
+            if instance is None:
+                continue
+
+            instance.matrix_parent_inverse = source.matrix_parent_inverse.copy()
+            instance.matrix_basis = source.matrix_basis.copy()
+
+    _pendingObjects.clear()
+    _pendingScenes.clear()
+    invalidate_index()
+
+    return None
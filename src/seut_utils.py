@@ -4,6 +4,7 @@ from math   import pi
 
 from .seut_ot_recreateCollections   import SEUT_OT_RecreateCollections
 from .seut_errors                   import errorCollection, showError
+from .seut_subpart_graph            import get_graph, invalidate_graph, get_subgraph, find_cycles, is_subpart_empty
 
 def linkSubpartScene(self, originScene, empty, targetCollection):
     """Link instances of subpart scene objects as children to empty"""
@@ -22,88 +23,61 @@ def linkSubpartScene(self, originScene, empty, targetCollection):
         empty['file'] = None
         return result
     
-    # This prevents instancing loops.
-    for o in subpartCollections['main'].objects:
-        if o is not None and o.type == 'EMPTY' and o.seut.linkedScene == originScene:
-            showError(context, "Report: Error", "SEUT Error: Linking to scene '" + subpartScene.name + "' from '" + currentScene.name + "' would create a subpart instancing loop.")
-            empty.seut.linkedScene = None
-            empty['file'] = None
-            return {'CANCEL'}
-    
-    # Switch to subpartScene to get collections
-    context.window.scene = subpartScene
-
-    currentArea = context.area.type
-    context.area.type = 'VIEW_3D'
-    if context.object is not None and context.object.mode is not 'OBJECT':
-        bpy.ops.object.mode_set(mode='OBJECT')
+    # This prevents instancing loops, no matter through how many subpart scenes they go. Every scene that would be
+    # instanced is checked, as a loop further down would otherwise make the nested linking below recurse without end.
+    graph = get_graph()
+    if is_subpart_empty(empty):
+        graph = dict(graph)
+        graph[originScene.name] = graph.get(originScene.name, set()) | {subpartScene.name}
+        start = originScene.name
+    else:
+        # Mirroring empties link to their own scene on purpose, only the scenes below it need to be free of loops.
+        start = subpartScene.name
+
+    if len(find_cycles(get_subgraph(graph, start))) > 0:
+        showError(context, "Report: Error", "SEUT Error: Linking to scene '" + subpartScene.name + "' from '" + currentScene.name + "' would create a subpart instancing loop.")
+        empty.seut.linkedScene = None
+        empty['file'] = None
+        invalidate_graph()
+        return {'CANCEL'}
 
-    objectsToIterate = set(subpartCollections['main'].objects)
+    if targetCollection is None:
+        targetCollection = parentCollections['main']
 
-    for obj in objectsToIterate:
+    # The instances are linked duplicates created through the data API, so neither the scene nor the selection need to be changed.
+    linkedObjects = []
+    for obj in list(subpartCollections['main'].objects):
 
         # The following is done only on a first-level subpart as
         # further-nested subparts already have empties as parents.
         # Needs to account for empties being parents that aren't subpart empties.
         if obj is not None and (obj.parent is None or obj.parent.type != 'EMPTY' or not 'file' in obj.parent) and obj.name.find("(L)") == -1:
 
-            obj.hide_viewport = False
-
-            existingObjects = set(subpartCollections['main'].objects)
-            
-            # Create instance of object
-            try:
-                context.window.view_layer.objects.active.select_set(state=False, view_layer=context.window.view_layer)
-            except AttributeError:
-                pass
-            context.window.view_layer.objects.active = obj
-            obj.select_set(state=True, view_layer=context.window.view_layer)
-
-            bpy.ops.object.duplicate(linked=True)
-        
-            newObjects = set(subpartCollections['main'].objects)
-            createdObjects = newObjects.copy()
-            deleteObjects = set()
-
-            for obj1 in newObjects:
-                for obj2 in existingObjects:
-                    if obj1 == obj2:
-                        createdObjects.remove(obj1)
-                if obj1 in createdObjects and obj1.name.find("(L)") != -1:
-                    createdObjects.remove(obj1)
-                    deleteObjects.add(obj1)
-            
-            for delObj in deleteObjects:
-                bpy.data.objects.remove(delObj, do_unlink=True)
-            
-            # Rename instance
-            linkedObject = None
-            for createdObj in createdObjects:
-                createdObj.name = obj.name + " (L)"
-                linkedObject = createdObj
-
-            if linkedObject is not None:
-                # Link instance to empty
-                try:
-                    if targetCollection is None:
-                        parentCollections['main'].objects.link(linkedObject)
-                    else:
-                        targetCollection.objects.link(linkedObject)
-                except RuntimeError:
-                    pass
-                subpartCollections['main'].objects.unlink(linkedObject)
-                linkedObject.parent = empty
-
-                if linkedObject.type == 'EMPTY' and linkedObject.seut.linkedScene is not None and linkedObject.seut.linkedScene.name in bpy.data.scenes and originScene.seut.linkSubpartInstances:
-                    linkSubpartScene(self, originScene, linkedObject, targetCollection)
-        
-    # Switch back to previous scene
-    context.area.type = currentArea
-    context.window.scene = currentScene
+            linkedObjects.append(linkSubpartObject(obj, empty, targetCollection))
+
+    for linkedObject in linkedObjects:
+        if linkedObject.type == 'EMPTY' and linkedObject.seut.linkedScene is not None and linkedObject.seut.linkedScene.name in bpy.data.scenes and originScene.seut.linkSubpartInstances:
+            linkSubpartScene(self, originScene, linkedObject, targetCollection)
     
     return {'CONTINUE'}
 
 
+def linkSubpartObject(obj, empty, targetCollection):
+    """Creates a linked duplicate of a subpart scene object as child of the empty"""
+
+    linkedObject = obj.copy()
+    linkedObject.name = obj.name + " (L)"
+    linkedObject.hide_viewport = False
+
+    try:
+        targetCollection.objects.link(linkedObject)
+    except RuntimeError:
+        pass
+    linkedObject.parent = empty
+
+    return linkedObject
+
+
 def unlinkSubpartScene(empty):
     """Unlinks all subpart instances from an empty"""
 
@@ -126,12 +100,14 @@ def getParentCollection(context, childObject):
     scene = context.scene
 
     collections = SEUT_OT_RecreateCollections.getCollections(scene)
+
+    # Blender keeps track of the collections an object is in, so only those need to be checked instead of all objects of all SEUT collections.
+    # Checked in the order of the SEUT collections so an object linked to several of them gives the same result as before.
+    userCollections = childObject.users_collection
     
     for key, value in collections.items():
-        if value is not None:
-            for obj in value.objects:
-                if obj is not None and obj == childObject:
-                    return value
+        if value is not None and value in userCollections:
+            return value
     
     return None
 
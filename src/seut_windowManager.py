@@ -12,7 +12,8 @@ from bpy.props  import (EnumProperty,
                         CollectionProperty
                         )
 
-from .seut_errors  import showError
+from .seut_errors                  import showError
+from .materials.seut_matlib_catalog import set_entry, get_entry, persist_matlib
 
 
 def update_BBox(self, context):
@@ -33,21 +34,33 @@ def update_enabled(self, context):
         showError(context, "Report: Error", "SEUT Error: Path to Materials Folder (Addon Preferences) '" + materialsPath + "' not valid. (017)")
         return
 
-    if self.enabled:
-        with bpy.data.libraries.load(materialsPath + "\\" + self.name, link=True) as (data_from, data_to):
+    filepath = materialsPath + "\\" + self.name
+    persist_matlib(self.name, self.enabled)
+
+    if self.enabled and preferences.matlibLinkOnDemand:
+        # Only the contents of the library are scanned, its materials are linked when they are needed.
+        get_entry(filepath)
+
+    elif self.enabled:
+        with bpy.data.libraries.load(filepath, link=True) as (data_from, data_to):
             data_to.materials=data_from.materials
+            set_entry(filepath, data_from)
 
     else:
-        with bpy.data.libraries.load(materialsPath + "\\" + self.name, link=True) as (data_from, data_to):
-                for mat in data_from.materials:
-                    if mat in bpy.data.materials and bpy.data.materials[mat].library is not None and bpy.data.materials[mat].library.name == self.name:
-                        bpy.data.materials.remove(bpy.data.materials[mat], do_unlink=True)
-                for img in data_from.images:
-                    if img in bpy.data.images and bpy.data.images[img].library is not None and bpy.data.images[img].library.name == self.name:
-                        bpy.data.images.remove(bpy.data.images[img], do_unlink=True)
-                for ngroup in data_from.node_groups:
-                    if ngroup in bpy.data.node_groups and bpy.data.node_groups[ngroup].library is not None and bpy.data.node_groups[ngroup].library.name == self.name:
-                        bpy.data.node_groups.remove(bpy.data.node_groups[ngroup], do_unlink=True)
+        # The contents of the library are taken from the MatLib catalog so it does not need to be opened.
+        entry = get_entry(filepath)
+        if entry is None:
+            return
+
+        for mat in entry['materials']:
+            if mat in bpy.data.materials and bpy.data.materials[mat].library is not None and bpy.data.materials[mat].library.name == self.name:
+                bpy.data.materials.remove(bpy.data.materials[mat], do_unlink=True)
+        for img in entry['images']:
+            if img in bpy.data.images and bpy.data.images[img].library is not None and bpy.data.images[img].library.name == self.name:
+                bpy.data.images.remove(bpy.data.images[img], do_unlink=True)
+        for ngroup in entry['node_groups']:
+            if ngroup in bpy.data.node_groups and bpy.data.node_groups[ngroup].library is not None and bpy.data.node_groups[ngroup].library.name == self.name:
+                bpy.data.node_groups.remove(bpy.data.node_groups[ngroup], do_unlink=True)
                         
 
 class SEUT_MatLibProps(PropertyGroup):
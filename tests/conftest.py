@@ -0,0 +1,77 @@
+"""Test helpers for the addon.
+
+Most modules of the addon import bpy, so their tests need to be run with Blender's Python and are skipped otherwise:
+    blender --background --factory-startup --python-expr "import sys, pytest; sys.exit(pytest.main(['tests']))"
+
+Modules that do not import bpy, like the tool runner, can also be tested with any Python 3.7+:
+    python -m pytest -q tests
+"""
+
+import os
+import sys
+import importlib
+import importlib.util
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ADDON = "src"
+
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def load_source(*path):
+    """Loads a single module of the addon by its path below src/, without importing the addon package, which needs Blender.
+    Only works for modules without relative imports."""
+
+    name = os.path.splitext(path[-1])[0]
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, ADDON, *path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+
+def import_addon_module(name):
+    """Imports a module of the addon through the addon package, skipping the calling test module outside of Blender"""
+
+    pytest.importorskip("bpy")
+
+    return importlib.import_module(ADDON + "." + name)
+
+
+@pytest.fixture(scope='session')
+def addon():
+    """Enables the addon, so its properties and preferences are registered. Skips the test outside of Blender"""
+
+    pytest.importorskip("bpy")
+    import addon_utils
+
+    addon_utils.enable(ADDON, default_set=True)
+    yield importlib.import_module(ADDON)
+    addon_utils.disable(ADDON, default_set=True)
+
+
+@pytest.fixture
+def preferences(addon):
+    """Returns the addon preferences and restores them after the test"""
+
+    import bpy
+
+    prefs = bpy.context.preferences.addons[ADDON].preferences
+    saved = dict((name, getattr(prefs, name)) for name in prefs.bl_rna.properties.keys() if name != 'rna_type' and not prefs.bl_rna.properties[name].is_readonly)
+    yield prefs
+    for name, value in saved.items():
+        setattr(prefs, name, value)
+
+
+@pytest.fixture
+def clean_data(addon):
+    """Gives the test an empty file to work in"""
+
+    import bpy
+
+    bpy.ops.wm.read_homefile(use_empty=True)
+    yield bpy.data
+    bpy.ops.wm.read_homefile(use_empty=True)
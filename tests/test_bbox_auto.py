@@ -0,0 +1,83 @@
+import math
+
+import pytest
+
+from conftest import import_addon_module
+
+numpy = pytest.importorskip("numpy")
+seut_ot_bBoxAuto = import_addon_module("seut_ot_bBoxAuto")
+
+# The corners of a cube with an edge length of 2, centered on the origin.
+CUBE = numpy.array([(x, y, z) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)], dtype=numpy.float32)
+
+
+def rotate_z(coords, degrees):
+    angle = math.radians(degrees)
+    rotation = numpy.array([
+        (math.cos(angle), -math.sin(angle), 0),
+        (math.sin(angle), math.cos(angle), 0),
+        (0, 0, 1)
+        ], dtype=numpy.float32)
+
+    return coords @ rotation.T
+
+
+def test_axis_extents_of_rotated_cube():
+    extents = seut_ot_bBoxAuto.get_axis_extents([rotate_z(CUBE, 45)])
+
+    # The corners of the rotated cube stick out along the world axes, the box has to contain them.
+    assert extents == pytest.approx((2 * math.sqrt(2), 2 * math.sqrt(2), 2), rel=1e-5)
+
+
+def test_axis_extents_centered_on_origin():
+    # The box is centered on the origin of the block, so it extends as far on both sides as the furthest vertex.
+    extents = seut_ot_bBoxAuto.get_axis_extents([numpy.array([(0, 0, 0), (3, 1, -2)], dtype=numpy.float32)])
+
+    assert extents == pytest.approx((6, 2, 4))
+
+
+def test_axis_extents_of_several_objects():
+    first = CUBE * 0.5
+    second = CUBE + numpy.array((2, 0, 0), dtype=numpy.float32)
+
+    assert seut_ot_bBoxAuto.get_axis_extents([first, second]) == pytest.approx((6, 2, 2))
+
+
+def test_cells_on_cell_border():
+    assert seut_ot_bBoxAuto.get_cells(2.5, 2.5) == 1
+    assert seut_ot_bBoxAuto.get_cells(5.0, 2.5) == 2
+    assert seut_ot_bBoxAuto.get_cells(1.5, 0.5) == 3
+
+
+def test_cells_past_cell_border():
+    assert seut_ot_bBoxAuto.get_cells(2.6, 2.5) == 2
+    assert seut_ot_bBoxAuto.get_cells(1.51, 0.5) == 4
+
+
+def test_cells_at_least_one():
+    assert seut_ot_bBoxAuto.get_cells(0, 2.5) == 1
+    assert seut_ot_bBoxAuto.get_cells(0.0001, 0.5) == 1
+
+
+def test_cells_of_rotated_cube_on_cell_border():
+    # Rotating by 90 degrees in single precision leaves the corners slightly outside of the cell border.
+    extents = seut_ot_bBoxAuto.get_axis_extents([rotate_z(CUBE, 90)])
+
+    assert [seut_ot_bBoxAuto.get_cells(dimension, 0.5) for dimension in extents] == [4, 4, 4]
+    assert [seut_ot_bBoxAuto.get_cells(dimension, 2.5) for dimension in extents] == [1, 1, 1]
+
+
+def test_world_vertices_of_rotated_object(clean_data):
+    import bpy
+
+    mesh = clean_data.meshes.new("Cube")
+    mesh.from_pydata([tuple(float(c) for c in corner) for corner in CUBE], [], [])
+    obj = clean_data.objects.new("Cube", mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    obj.rotation_euler = (0, 0, math.radians(45))
+    obj.location = (1, 0, 0)
+
+    vertices = seut_ot_bBoxAuto.get_world_vertices(bpy.context.evaluated_depsgraph_get(), [obj])
+
+    assert len(vertices) == 1
+    assert seut_ot_bBoxAuto.get_axis_extents(vertices) == pytest.approx((2 + 2 * math.sqrt(2), 2 * math.sqrt(2), 2), rel=1e-5)
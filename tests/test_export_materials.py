@@ -0,0 +1,98 @@
+import os
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from conftest import import_addon_module
+
+seut_export_materials = import_addon_module("export.seut_export_materials")
+seut_matlib_catalog = import_addon_module("materials.seut_matlib_catalog")
+
+import bpy
+
+MATLIB = "MatLib_Test.blend"
+
+
+class Reporter():
+
+    def __init__(self):
+        self.messages = []
+
+    def report(self, type, message):
+        self.messages.append((type, message))
+
+
+@pytest.fixture
+def catalog(monkeypatch, tmp_path):
+    """Keeps the MatLib catalog of the test out of the Blender config folder"""
+
+    monkeypatch.setattr(seut_matlib_catalog, 'get_catalog_path', lambda: str(tmp_path / "catalog.json"))
+    monkeypatch.setattr(seut_matlib_catalog, '_catalog', None)
+
+
+def create_material(name):
+    mat = bpy.data.materials.new(name)
+    mat.use_nodes = True
+    node = mat.node_tree.nodes.new('ShaderNodeTexImage')
+    node.name = 'CM'
+    node.image = bpy.data.images.new(name + "_cm", 4, 4)
+    node.image.filepath = "C:\\Mods\\Test\\Textures\\" + name + "_cm.png"
+
+    return mat
+
+
+def create_matlib(materialsPath):
+    """Writes a MatLib containing the materials 'Metal' and 'Glass' to the Materials folder"""
+
+    # The addon joins the Materials folder and the name of a MatLib with a backslash. The MatLib is written to that same path, so this also works outside of Windows.
+    filepath = os.path.normpath(materialsPath) + "\\" + MATLIB
+    materials = set([create_material("Metal"), create_material("Glass")])
+    bpy.data.libraries.write(filepath, materials)
+
+    for mat in materials:
+        bpy.data.materials.remove(mat)
+
+
+def get_entries(preferences, materialsPath, linkOnDemand):
+    """Returns the model XML entries of a model using a local material named like a MatLib material and a unique local material"""
+
+    bpy.ops.wm.read_homefile(use_empty=True)
+    create_matlib(materialsPath)
+
+    # Set directly, as the update function of the path refreshes the MatLib list.
+    preferences['materialsPath'] = materialsPath
+    preferences.matlibLinkOnDemand = linkOnDemand
+
+    mesh = bpy.data.meshes.new("Model")
+    mesh.materials.append(create_material("Metal"))
+    mesh.materials.append(create_material("Custom"))
+    bpy.context.scene.collection.objects.link(bpy.data.objects.new("Model", mesh))
+
+    matlibs = bpy.context.window_manager.seut.matlibs
+    matlibs.clear()
+    matlib = matlibs.add()
+    matlib.name = MATLIB
+    matlib.enabled = True
+
+    return [ET.tostring(entry) for entry in seut_export_materials.ExportMaterials().getEntries(Reporter())]
+
+
+def test_entries_do_not_depend_on_linking_on_demand(clean_data, preferences, catalog, tmp_path):
+    materialsPath = str(tmp_path / "Materials")
+    os.mkdir(materialsPath)
+
+    eager = get_entries(preferences, materialsPath, False)
+    onDemand = get_entries(preferences, materialsPath, True)
+
+    assert onDemand == eager
+    assert [ET.fromstring(entry).get('Name') for entry in eager] == ["Custom"]
+
+
+def test_library_material_linked_for_export(clean_data, preferences, catalog, tmp_path):
+    materialsPath = str(tmp_path / "Materials")
+    os.mkdir(materialsPath)
+
+    get_entries(preferences, materialsPath, True)
+
+    # Only the MatLib material a local material is named like is linked.
+    assert sorted((mat.name, mat.library is not None) for mat in bpy.data.materials) == [("Custom", False), ("Metal", False), ("Metal", True)]
@@ -0,0 +1,147 @@
+import time
+
+import pytest
+
+from conftest import import_addon_module
+
+seut_export_utils = import_addon_module("export.seut_export_utils")
+seut_custom_fbx_exporter = import_addon_module("export.seut_custom_fbx_exporter")
+seut_utils = import_addon_module("seut_utils")
+
+import bpy
+
+
+class PinnedTime():
+    """Stands in for the time module in the FBX exporter, so every export writes the same time stamps"""
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+    def localtime(self, *args):
+        return time.localtime(0)
+
+    def time(self):
+        return 0.0
+
+
+def create_collections(scene, name):
+    """Creates the SEUT and Main collections of a scene. Properties are set directly, as their update functions work on the active scene"""
+
+    scene.seut['subtypeId'] = name
+
+    seut = bpy.data.collections.new("SEUT (%s)" % (name))
+    scene.collection.children.link(seut)
+    main = bpy.data.collections.new("Main (%s)" % (name))
+    seut.children.link(main)
+
+    return main
+
+
+def create_mesh(name, collection, parent=None, location=(0.0, 0.0, 0.0)):
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata([(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0)], [], [(0, 1, 2)])
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = location
+    obj.parent = parent
+    collection.objects.link(obj)
+
+    return obj
+
+
+def create_empty(name, collection, parent, linkedScene=None):
+    empty = bpy.data.objects.new(name, None)
+    empty.parent = parent
+    collection.objects.link(empty)
+    if linkedScene is not None:
+        empty['file'] = linkedScene.seut.subtypeId
+        empty.seut['linkedScene'] = linkedScene
+
+    return empty
+
+
+@pytest.fixture
+def block(clean_data):
+    """A block with a door subpart, which in turn has a hinge subpart. The instances are linked like linkSubpartScene() does"""
+
+    hinge = bpy.data.scenes.new("Hinge")
+    hingeMain = create_collections(hinge, "Hinge")
+    pin = create_mesh("Hinge_Pin", hingeMain)
+
+    door = bpy.data.scenes.new("Door")
+    doorMain = create_collections(door, "Door")
+    frame = create_mesh("Door_Frame", doorMain)
+    hingeEmpty = create_empty("subpart_hinge", doorMain, frame, hinge)
+
+    # The scene of the empty file is the active one, so it can be exported.
+    scene = bpy.context.scene
+    scene.name = "Block"
+    blockMain = create_collections(scene, "Block")
+    body = create_mesh("Block_Body", blockMain)
+    doorEmpty = create_empty("subpart_door", blockMain, body, door)
+    conveyor = create_empty("dummy_conveyor", blockMain, body)
+    conveyor['highlight'] = "Block_Body"
+    cap = create_mesh("Conveyor_Cap", blockMain, conveyor, location=(0.0, 0.0, 1.0))
+
+    seut_utils.linkSubpartObject(frame, doorEmpty, blockMain)
+    hingeInstance = seut_utils.linkSubpartObject(hingeEmpty, doorEmpty, blockMain)
+    seut_utils.linkSubpartObject(pin, hingeInstance, blockMain)
+
+    return {
+        'scene': scene,
+        'main': blockMain,
+        'body': body,
+        'doorEmpty': doorEmpty,
+        'conveyor': conveyor,
+        'cap': cap
+        }
+
+
+def test_subpart_instances_are_excluded(block):
+    objects = seut_export_utils.filter_subpart_instances(list(block['main'].objects))
+
+    # Children of empties that do not place a subpart are part of the model.
+    assert sorted(obj.name for obj in objects) == ["Block_Body", "Conveyor_Cap", "dummy_conveyor", "subpart_door"]
+
+
+def test_subpart_empty_without_linked_scene_keeps_children(block):
+    lid = create_empty("subpart_lid", block['main'], block['body'])
+    lid['file'] = "Lid"
+    frame = create_mesh("Lid_Frame", block['main'], lid)
+
+    objects = seut_export_utils.filter_subpart_instances(list(block['main'].objects))
+
+    assert lid in objects and frame in objects
+
+
+def test_children_recursive(block):
+    children = seut_export_utils.get_children_recursive(block['doorEmpty'])
+
+    assert sorted(obj.name for obj in children) == ["Door_Frame (L)", "Hinge_Pin (L)", "subpart_hinge (L)"]
+    assert seut_export_utils.get_children_recursive(block['cap']) == []
+
+
+def test_fbx_same_as_with_unlinked_instances(block, monkeypatch, tmp_path):
+    monkeypatch.setattr(seut_custom_fbx_exporter.get_fbx_module(), 'time', PinnedTime())
+
+    scene = block['scene']
+    main = block['main']
+    settings = seut_export_utils.ExportSettings(scene, bpy.context.evaluated_depsgraph_get())
+    # Both files are written to the same path, as it is part of the file.
+    fbxfile = str(tmp_path / "Block.fbx")
+
+    seut_export_utils.export_to_fbxfile(settings, scene, fbxfile, seut_export_utils.filter_subpart_instances(list(main.objects)))
+    with open(fbxfile, 'rb') as fbx:
+        filtered = fbx.read()
+
+    # The export before the filter: the instances were removed, the collection exported as a whole and the instances linked again.
+    seut_utils.unlinkSubpartScene(block['doorEmpty'])
+    assert not any(obj.name.endswith("(L)") for obj in main.objects)
+    settings = seut_export_utils.ExportSettings(scene, bpy.context.evaluated_depsgraph_get())
+
+    seut_export_utils.export_to_fbxfile(settings, scene, fbxfile, main.objects)
+    with open(fbxfile, 'rb') as fbx:
+        unlinked = fbx.read()
+
+    assert b"Conveyor_Cap" in filtered
+    assert b"Door_Frame" not in filtered
+    assert filtered == unlinked
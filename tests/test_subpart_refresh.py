@@ -0,0 +1,142 @@
+import time
+
+import pytest
+
+from conftest import import_addon_module
+
+seut_subpart_refresh = import_addon_module("seut_subpart_refresh")
+seut_utils = import_addon_module("seut_utils")
+
+import bpy
+
+
+def create_scene(name):
+    """Creates a scene with its SEUT and Main collections. Properties are set directly, as their update functions work on the active scene"""
+
+    scene = bpy.data.scenes.new(name)
+    scene.seut['subtypeId'] = name
+
+    seut = bpy.data.collections.new("SEUT (%s)" % (name))
+    scene.collection.children.link(seut)
+    main = bpy.data.collections.new("Main (%s)" % (name))
+    seut.children.link(main)
+
+    return scene, main
+
+
+def create_empty(name, collection, linkedScene):
+    empty = bpy.data.objects.new(name, None)
+    empty['file'] = linkedScene.seut.subtypeId
+    empty.seut['linkedScene'] = linkedScene
+    collection.objects.link(empty)
+
+    return empty
+
+
+@pytest.fixture
+def scenes(clean_data):
+    """A block with a door subpart, the frame of which has an instance below the subpart empty of the block"""
+
+    door, doorMain = create_scene("Door")
+    frame = bpy.data.objects.new("Door_Frame", bpy.data.meshes.new("Door_Frame"))
+    doorMain.objects.link(frame)
+
+    block, blockMain = create_scene("Block")
+    block.seut['linkSubpartInstances'] = True
+    body = bpy.data.objects.new("Block_Body", bpy.data.meshes.new("Block_Body"))
+    blockMain.objects.link(body)
+    empty = create_empty("subpart_door", blockMain, door)
+    empty.parent = body
+    instance = seut_utils.linkSubpartObject(frame, empty, blockMain)
+
+    seut_subpart_refresh.invalidate_index()
+    yield {
+        'door': door,
+        'doorMain': doorMain,
+        'frame': frame,
+        'block': block,
+        'empty': empty,
+        'instance': instance
+        }
+
+    seut_subpart_refresh._pendingObjects.clear()
+    seut_subpart_refresh._pendingScenes.clear()
+    seut_subpart_refresh.invalidate_index()
+
+
+def test_build_index(scenes):
+    index = seut_subpart_refresh.build_index()
+
+    assert index['instances'] == {'Door_Frame': ["Door_Frame (L)"]}
+    assert index['dependents'] == {'Door': ["subpart_door"]}
+    assert index['origins'] == {'subpart_door': "Block"}
+    assert index['signatures'] == {'Door': frozenset(["Door_Frame"])}
+
+
+def test_build_index_skips_scenes_without_instances(scenes):
+    scenes['block'].seut['linkSubpartInstances'] = False
+
+    index = seut_subpart_refresh.build_index()
+
+    assert index['instances'] == {}
+    assert index['dependents'] == {}
+
+
+def test_signature_leaves_out_instances_and_subpart_children(scenes):
+    hinge, hingeMain = create_scene("Hinge")
+    nestedEmpty = create_empty("subpart_hinge", scenes['doorMain'], hinge)
+    nestedEmpty.parent = scenes['frame']
+    hingeInstance = bpy.data.objects.new("Hinge_Pin (L)", None)
+    scenes['doorMain'].objects.link(hingeInstance)
+    hingeInstance.parent = nestedEmpty
+    handle = bpy.data.objects.new("Door_Handle", None)
+    scenes['doorMain'].objects.link(handle)
+
+    # The subpart empty itself is part of the model, the instances below it are not.
+    assert seut_subpart_refresh.get_signature(scenes['door']) == frozenset(["Door_Frame", "subpart_hinge", "Door_Handle"])
+
+
+def test_refresh_waits_for_edits_to_stop(scenes):
+    seut_subpart_refresh._pendingObjects.add("Door_Frame")
+    seut_subpart_refresh._lastUpdate = time.perf_counter()
+
+    remaining = seut_subpart_refresh.refresh_instances()
+
+    assert remaining is not None and 0 < remaining <= seut_subpart_refresh.REFRESH_DELAY
+    assert seut_subpart_refresh._pendingObjects == {"Door_Frame"}
+
+    seut_subpart_refresh._lastUpdate -= seut_subpart_refresh.REFRESH_DELAY
+
+    assert seut_subpart_refresh.refresh_instances() is None
+    assert seut_subpart_refresh._pendingObjects == set()
+
+
+def test_refresh_updates_instances_in_place(scenes):
+    instance = scenes['instance']
+    pointer = instance.as_pointer()
+    instance['state'] = "kept"
+
+    scenes['frame'].location = (1.0, 2.0, 3.0)
+    scenes['frame'].scale = (2.0, 2.0, 2.0)
+
+    seut_subpart_refresh._pendingObjects.add("Door_Frame")
+    seut_subpart_refresh._lastUpdate = time.perf_counter() - seut_subpart_refresh.REFRESH_DELAY
+    seut_subpart_refresh.refresh_instances()
+
+    instance = bpy.data.objects["Door_Frame (L)"]
+    assert instance.as_pointer() == pointer
+    assert instance['state'] == "kept"
+    assert instance.parent == scenes['empty']
+    assert tuple(instance.location) == (1.0, 2.0, 3.0)
+    assert tuple(instance.scale) == (2.0, 2.0, 2.0)
+
+
+def test_load_clears_queue(scenes):
+    seut_subpart_refresh._pendingObjects.add("Door_Frame")
+    seut_subpart_refresh._pendingScenes.add("Door")
+
+    seut_subpart_refresh.subpart_refresh_handler(None)
+
+    assert seut_subpart_refresh._pendingObjects == set()
+    assert seut_subpart_refresh._pendingScenes == set()
+    assert seut_subpart_refresh._index is None
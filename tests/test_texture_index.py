@@ -0,0 +1,76 @@
+from conftest import import_addon_module
+
+seut_texture_index = import_addon_module("materials.seut_texture_index")
+
+
+class FakeImage():
+    """Stands in for bpy.types.Image with only what the merge plan looks at"""
+
+    def __init__(self, name, users, library=None):
+        self.name = name
+        self.users = users
+        self.library = library
+
+    def __repr__(self):
+        return self.name
+
+
+def test_linked_image_kept_with_several_linked_and_local():
+    localMost = FakeImage("Local_CM", 5)
+    linkedFew = FakeImage("MatLib_A_CM", 1, library="MatLib_A.blend")
+    localFew = FakeImage("Local_CM.001", 2)
+    linkedMost = FakeImage("MatLib_B_CM", 3, library="MatLib_B.blend")
+
+    keep, remove = seut_texture_index.get_merge_plan([localMost, linkedFew, localFew, linkedMost])
+
+    # The linked image with the most users is kept, even though a local one has more.
+    assert keep is linkedMost
+    # The other linked image cannot be removed and is left alone.
+    assert remove == [localMost, localFew]
+
+
+def test_most_used_local_image_kept():
+    first = FakeImage("CM", 1)
+    most = FakeImage("CM.001", 4)
+    last = FakeImage("CM.002", 2)
+
+    keep, remove = seut_texture_index.get_merge_plan([first, most, last])
+
+    assert keep is most
+    assert remove == [first, last]
+
+
+def test_only_linked_images_nothing_removed():
+    first = FakeImage("MatLib_A_CM", 2, library="MatLib_A.blend")
+    second = FakeImage("MatLib_B_CM", 2, library="MatLib_B.blend")
+
+    keep, remove = seut_texture_index.get_merge_plan([first, second])
+
+    # Ties keep the order the images were found in.
+    assert keep is first
+    assert remove == []
+
+
+def test_merge_duplicates_remaps_users(clean_data, tmp_path):
+    texture = str(tmp_path / "Textures" / "Cube_cm.png")
+
+    images = []
+    for name, filepath in (("Cube_cm", texture), ("Cube_cm.001", str(tmp_path / "Textures" / ".." / "Textures" / "Cube_cm.png")), ("Cube_cm.002", texture)):
+        image = clean_data.images.new(name, 4, 4)
+        image.source = 'FILE'
+        image.filepath = filepath
+        images.append(image)
+
+    mat = clean_data.materials.new("Cube")
+    mat.use_nodes = True
+    node = mat.node_tree.nodes.new('ShaderNodeTexImage')
+    node.name = 'CM'
+    node.image = images[1]
+
+    index = seut_texture_index.TextureIndex()
+
+    assert len(index.getDuplicates()) == 1
+    assert index.mergeDuplicates() == 2
+    assert len(clean_data.images) == 1
+    assert node.image == clean_data.images[0]
+    assert index.getDuplicates() == {}
@@ -0,0 +1,169 @@
+import sys
+import time
+import threading
+import subprocess
+
+import pytest
+
+from conftest import load_source
+
+seut_tool_runner = load_source("export", "seut_tool_runner.py")
+
+# Stands in for the Windows tools: writes to stdout and stderr alternately, flushing after every line, then exits with the given code.
+FAKE_TOOL = """
+import sys
+for i in range(5):
+    sys.stdout.write("out %i\\n" % i)
+    sys.stdout.flush()
+    sys.stderr.write("err %i\\n" % i)
+    sys.stderr.flush()
+sys.exit(int(sys.argv[1]))
+"""
+
+
+# Stands in for a tool that hangs after writing some output.
+HANGING_TOOL = """
+import sys
+import time
+for i in range(3):
+    sys.stdout.write("line %i\\n" % i)
+    sys.stdout.flush()
+time.sleep(60)
+"""
+
+
+def fake_tool(exitCode):
+    return [sys.executable, "-c", FAKE_TOOL, str(exitCode)]
+
+
+def hanging_tool():
+    return [sys.executable, "-c", HANGING_TOOL]
+
+
+def read_log(logfile):
+    with open(logfile, 'rb') as log:
+        return log.read().decode('utf-8')
+
+
+def wait_for_lines(run, count, timeout=10):
+    deadline = time.perf_counter() + timeout
+    while run.lineCount < count:
+        assert time.perf_counter() < deadline, "Tool did not write %i lines in time." % (count)
+        time.sleep(0.01)
+
+
+def test_streams_stdout_and_stderr_to_log(tmp_path):
+    logfile = str(tmp_path / "fake.log")
+    run = seut_tool_runner.ToolRun(fake_tool(0), "Fake Tool", cwd=str(tmp_path), logfile=logfile, keepOutput=True)
+
+    output = run.run()
+
+    lines = output.decode('utf-8').splitlines()
+    assert lines == ["out 0", "err 0", "out 1", "err 1", "out 2", "err 2", "out 3", "err 3", "out 4", "err 4"]
+    assert run.lineCount == 10
+    assert run.lastLine == "err 4"
+
+    with open(logfile, 'rb') as log:
+        contents = log.read().decode('utf-8')
+    assert contents.startswith("Running from: %s \n" % (str(tmp_path)))
+    assert contents.endswith("out 4\nerr 4\n")
+
+
+def test_output_not_kept_by_default():
+    run = seut_tool_runner.ToolRun(fake_tool(0), "Fake Tool")
+
+    assert run.run() is None
+    assert run.lineCount == 10
+
+
+def test_unsuccessful_exit_code_raises():
+    run = seut_tool_runner.ToolRun(fake_tool(3), "Fake Tool", keepOutput=True)
+
+    with pytest.raises(subprocess.CalledProcessError) as info:
+        run.run()
+
+    assert info.value.returncode == 3
+    assert info.value.output.decode('utf-8').splitlines()[-1] == "err 4"
+
+
+def test_additional_successful_exit_codes():
+    run = seut_tool_runner.ToolRun(fake_tool(1), "Fake Tool")
+
+    run.run(successfulExitCodes=[0, 1])
+
+    assert run.lineCount == 10
+
+
+def test_cancelled_runs_do_not_start():
+    seut_tool_runner.cancel_tool_runs()
+    try:
+        with pytest.raises(seut_tool_runner.ToolCancelledError):
+            seut_tool_runner.ToolRun(fake_tool(0), "Fake Tool").run()
+    finally:
+        seut_tool_runner.reset_tool_runs()
+
+    assert seut_tool_runner.get_active_runs() == []
+
+
+def test_timeout_stops_tool(tmp_path):
+    logfile = str(tmp_path / "hanging.log")
+    run = seut_tool_runner.ToolRun(hanging_tool(), "Hanging Tool", logfile=logfile, timeout=1, keepOutput=True)
+
+    start = time.perf_counter()
+    with pytest.raises(subprocess.TimeoutExpired) as info:
+        run.run()
+
+    assert time.perf_counter() - start < 10
+    assert run._process.poll() is not None
+    assert info.value.timeout == 1
+    assert info.value.output.decode('utf-8').splitlines() == ["line 0", "line 1", "line 2"]
+    # What the tool wrote before it was stopped stays in the log.
+    assert read_log(logfile).endswith("line 0\nline 1\nline 2\n")
+    assert seut_tool_runner.get_active_runs() == []
+
+
+def test_cancel_stops_running_tool(tmp_path):
+    logfile = str(tmp_path / "hanging.log")
+    run = seut_tool_runner.ToolRun(hanging_tool(), "Hanging Tool", logfile=logfile)
+    errors = []
+
+    def target():
+        try:
+            run.run()
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    try:
+        wait_for_lines(run, 3)
+        assert seut_tool_runner.get_active_runs() == [run]
+
+        seut_tool_runner.cancel_tool_runs()
+        thread.join(timeout=10)
+    finally:
+        seut_tool_runner.reset_tool_runs()
+
+    assert not thread.is_alive()
+    assert len(errors) == 1 and isinstance(errors[0], seut_tool_runner.ToolCancelledError)
+    assert run.cancelled
+    assert run._process.poll() is not None
+    assert read_log(logfile).endswith("line 0\nline 1\nline 2\n")
+    assert seut_tool_runner.get_active_runs() == []
+
+
+def test_tool_timeout_reported(addon, preferences, capsys, tmp_path):
+    from src.export.seut_export_utils import ExportSettings
+    from src.utils.called_tool_type import ToolType
+
+    import bpy
+
+    preferences.mwmbTimeout = 1
+    settings = ExportSettings(bpy.context.scene, None)
+    logfile = str(tmp_path / "mwmbuilder.log")
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        settings.callTool(None, hanging_tool(), ToolType(3), logfile=logfile)
+
+    assert "did not finish within 1 seconds and has been stopped. (036)" in capsys.readouterr().out
+    assert read_log(logfile).endswith("line 0\nline 1\nline 2\n")